@@ -0,0 +1,110 @@
+"""Agregasi keputusan kelompok dari banyak evaluator (siswa, rekan, pengawas).
+
+- AIJ (Aggregation of Individual Judgments): rata-rata geometrik tertimbang
+  elemen per elemen dari matriks perbandingan individu.
+- AIP (Aggregation of Individual Priorities): rata-rata aritmetik tertimbang
+  dari vektor prioritas individu.
+
+Bobot diberikan per role (default siswa 30, rekan 30, pengawas 40) dan dibagi
+rata ke evaluator di dalam role tersebut. Akumulasi dilakukan per role
+sebagai jumlah berjalan, sehingga input dapat dialirkan per chunk (misalnya
+dari file .npy yang di-memory-map) tanpa memuat seluruh evaluator ke memori.
+"""
+import numpy as np
+
+from ahp_db import BOBOT_ROLE, KOLOM_ROLE
+
+
+def kode_role(roles, kolom_role=KOLOM_ROLE):
+    """Mengubah nama role (atau kode integer) menjadi array indeks ke ``kolom_role``"""
+    roles = np.asarray(roles)
+    if roles.dtype.kind in 'iu':
+        return roles.astype(np.int64)
+    unik, inverse = np.unique(roles, return_inverse=True)
+    tidak_dikenal = [str(role) for role in unik if role not in kolom_role]
+    if tidak_dikenal:
+        raise ValueError(f'Role tidak dikenal {tidak_dikenal}, harus salah satu dari {list(kolom_role)}')
+    return np.array([list(kolom_role).index(role) for role in unik], dtype=np.int64)[inverse]
+
+
+class AgregatorKelompok:
+    """Akumulator AIJ / AIP per role yang bisa diisi bertahap per chunk.
+
+    ``mode`` adalah 'aij' (input matriks (M, n, n)) atau 'aip' (input vektor
+    prioritas (M, n)). ``bobot_role`` berupa dict {role: bobot}; role tanpa
+    evaluator diabaikan dan bobot role lainnya dinormalisasi ulang.
+    """
+
+    def __init__(self, n, mode='aij', bobot_role=None, kolom_role=KOLOM_ROLE):
+        if mode not in ('aij', 'aip'):
+            raise ValueError("mode harus 'aij' atau 'aip'")
+        bobot_role = BOBOT_ROLE if bobot_role is None else bobot_role
+        self.mode = mode
+        self.kolom_role = list(kolom_role)
+        self.bobot_role = np.array([float(bobot_role.get(role, 0)) for role in self.kolom_role])
+        bentuk = (len(self.kolom_role), n, n) if mode == 'aij' else (len(self.kolom_role), n)
+        self._jumlah = np.zeros(bentuk)
+        self._hitung = np.zeros(len(self.kolom_role), dtype=np.int64)
+
+    def tambah(self, data, roles=None):
+        """Menambahkan satu chunk matriks / vektor prioritas beserta role evaluatornya"""
+        data = np.asarray(data, dtype=float)
+        if self.mode == 'aij':
+            if np.any(data <= 0):
+                raise ValueError('Semua elemen matriks perbandingan harus bernilai positif')
+            data = np.log(data)
+        if roles is None:
+            kode = np.zeros(len(data), dtype=np.int64)
+        else:
+            kode = kode_role(roles, self.kolom_role)
+        # Jumlah per role memakai perkalian matriks one-hot (R, M) x (M, ...)
+        one_hot = kode[np.newaxis, :] == np.arange(len(self.kolom_role))[:, np.newaxis]
+        self._jumlah += np.tensordot(one_hot.astype(float), data, axes=(1, 0))
+        self._hitung += one_hot.sum(axis=1)
+        return self
+
+    def hasil(self):
+        """Matriks kelompok (AIJ) atau vektor prioritas kelompok ternormalisasi (AIP)"""
+        ada = self._hitung > 0
+        if not np.any(ada):
+            raise ValueError('Belum ada data evaluator yang ditambahkan')
+        bobot = np.where(ada, self.bobot_role, 0.0)
+        if bobot.sum() == 0:
+            # Tanpa bobot role (mis. roles=None dengan satu kelompok), semua role sama rata
+            bobot = ada.astype(float)
+        bobot = bobot / bobot.sum()
+
+        rata_role = self._jumlah[ada] / self._hitung[ada].reshape((-1,) + (1,) * (self._jumlah.ndim - 1))
+        gabungan = np.tensordot(bobot[ada], rata_role, axes=(0, 0))
+        if self.mode == 'aij':
+            return np.exp(gabungan)
+        return gabungan / gabungan.sum()
+
+
+def agregasi_aij(matriks, roles=None, bobot_role=None):
+    """Rata-rata geometrik tertimbang elemen per elemen dari tumpukan matriks (M, n, n)"""
+    matriks = np.asarray(matriks, dtype=float)
+    return AgregatorKelompok(matriks.shape[-1], 'aij', bobot_role).tambah(matriks, roles).hasil()
+
+
+def agregasi_aip(prioritas, roles=None, bobot_role=None):
+    """Rata-rata aritmetik tertimbang dari vektor prioritas individu (M, n)"""
+    prioritas = np.asarray(prioritas, dtype=float)
+    return AgregatorKelompok(prioritas.shape[-1], 'aip', bobot_role).tambah(prioritas, roles).hasil()
+
+
+def agregasi_stream(chunks, n, mode='aij', bobot_role=None):
+    """Agregasi dari iterable (data_chunk, roles_chunk) tanpa memuat semua evaluator ke memori"""
+    agregator = AgregatorKelompok(n, mode, bobot_role)
+    for data, roles in chunks:
+        agregator.tambah(data, roles)
+    return agregator.hasil()
+
+
+def iter_chunk_npy(path_data, path_roles=None, ukuran_chunk=10000):
+    """Membaca file .npy besar secara memory-mapped per chunk: menghasilkan (data, roles)"""
+    data = np.load(path_data, mmap_mode='r')
+    roles = np.load(path_roles, mmap_mode='r') if path_roles is not None else None
+    for mulai in range(0, len(data), ukuran_chunk):
+        selesai = mulai + ukuran_chunk
+        yield np.asarray(data[mulai:selesai]), (np.asarray(roles[mulai:selesai]) if roles is not None else None)
@@ -0,0 +1,274 @@
+"""Arsip kolumnar hasil perhitungan per periode evaluasi (Arrow IPC / Parquet).
+
+Periode yang sudah berstatus 'selesai' tidak berubah lagi, sehingga nilai,
+bobot, ranking dan CR-nya cukup dihitung sekali lalu disimpan ke satu file
+per periode dengan tata letak partisi hive::
+
+    storage/app/arsip_ahp/periode_evaluasi_id=<id>/hasil.arrow
+
+Kolom ``nilai_ahp`` dihitung dengan rumus HasilEvaluasiController (lihat
+``ahp_inkremental``): rata-rata tertimbang bobot kriteria x bobot sub kriteria
+per role, lalu siswa 30% / rekan 30% / pengawas 40%, sehingga sama dengan
+``tt_hasil_evaluasi.nilai_akhir``. Matriks rata-rata nilai per kriteria
+(n_guru, n_kriteria) disimpan sebagai kolom fixed_size_list,
+sehingga saat dibaca dari file Arrow yang di-memory-map array NumPy-nya
+langsung menunjuk ke halaman file tanpa salinan. Membaca arsip tidak
+menyentuh database sama sekali. Membutuhkan pyarrow (opsional).
+
+Contoh:
+    python ahp_arsip.py --periode 3
+    python ahp_arsip.py --semua --format parquet
+"""
+import argparse
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from ahp_db import iter_query, koneksi_dari_env, muat_kriteria, muat_nilai_periode, placeholder
+from ahp_engine import hitung_ahp
+from ahp_inkremental import agregat_pasangan, bobot_kriteria, hitung_nilai_akhir, nilai_role_dari_agregat
+from ahp_profil import profil, span
+from ahp_skor import kategori, ranking
+
+ROOT_DEFAULT = os.path.join('storage', 'app', 'arsip_ahp')
+FORMAT = {'arrow': 'hasil.arrow', 'parquet': 'hasil.parquet'}
+# Versi 2: nilai_ahp mengikuti rumus controller (per role), bukan rata-rata tertimbang per kriteria
+VERSI_ARSIP = 2
+
+HasilPeriode = namedtuple(
+    'HasilPeriode',
+    ['periode_id', 'guru_ids', 'kriteria_ids', 'nilai', 'jumlah', 'bobot', 'nilai_ahp', 'ranking', 'kategori', 'cr'],
+)
+
+
+def hitung_periode(conn, periode_id, matriks=None):
+    """Menghitung HasilPeriode dari database.
+
+    Bobot kriteria diambil dari tm_kriteria seperti controller, atau dari
+    eigenvector ``matriks`` perbandingan kriteria aktif bila diberikan (CR
+    hanya tersedia pada kasus ini). ``nilai_ahp`` dihitung per role lalu
+    digabung 30/30/40; guru tanpa nilai dari role mana pun bernilai 0.
+    """
+    with span('muat', periode_id=periode_id) as s:
+        kriteria_ids, _, bobot = muat_kriteria(conn)
+        data = muat_nilai_periode(conn, periode_id, kriteria_ids)
+        agregat = agregat_pasangan(conn, periode_id)
+        s.baris = len(data.guru_ids)
+
+    with span('bobot'):
+        cr = np.nan
+        if matriks is not None:
+            hasil_ahp = hitung_ahp(matriks)
+            if len(hasil_ahp.bobot) != len(kriteria_ids):
+                raise ValueError(f'Ukuran matriks ({len(hasil_ahp.bobot)}) tidak sama dengan jumlah kriteria ({len(kriteria_ids)})')
+            bobot, cr = hasil_ahp.bobot, hasil_ahp.cr
+            # Persen seperti tm_kriteria.bobot; kriteria nonaktif tidak ikut dihitung
+            bobot_persen = {int(k): 100 * float(b) for k, b in zip(kriteria_ids, bobot)}
+        else:
+            bobot_persen = bobot_kriteria(conn)
+        bobot = np.asarray(bobot, dtype=float) / np.sum(bobot)
+
+    with span('skor', baris=len(data.guru_ids)):
+        # Guru agregat role selalu ada di data.guru_ids (terurut); guru yang hanya
+        # dinilai evaluator tanpa role tetap punya baris dengan nilai role 0
+        posisi = np.searchsorted(data.guru_ids, [int(row[0]) for row in agregat])
+        nilai_role = nilai_role_dari_agregat(len(data.guru_ids), posisi, [row[1:5] for row in agregat], bobot_persen)
+        nilai_ahp = hitung_nilai_akhir(nilai_role)
+    with span('ranking', baris=len(nilai_ahp)):
+        peringkat, kat = ranking(nilai_ahp), kategori(nilai_ahp)
+    return HasilPeriode(
+        periode_id, data.guru_ids, data.kriteria_ids, data.nilai, data.jumlah, bobot, nilai_ahp, peringkat, kat, float(cr)
+    )
+
+
+def path_periode(root, periode_id, format='arrow'):
+    """Lokasi file arsip satu periode"""
+    if format not in FORMAT:
+        raise ValueError(f'format harus salah satu dari {list(FORMAT)}')
+    return os.path.join(root, f'periode_evaluasi_id={int(periode_id)}', FORMAT[format])
+
+
+def cari_arsip(root, periode_id):
+    """Path arsip periode yang sudah ada (arrow diutamakan), atau None"""
+    for format in FORMAT:
+        path = path_periode(root, periode_id, format)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _ke_tabel(hasil):
+    import pyarrow as pa
+
+    n_kriteria = len(hasil.kriteria_ids)
+    tabel = pa.table({
+        'guru_id': pa.array(hasil.guru_ids, type=pa.int64()),
+        'nilai': pa.FixedSizeListArray.from_arrays(pa.array(np.ravel(hasil.nilai), type=pa.float64()), n_kriteria),
+        'jumlah': pa.FixedSizeListArray.from_arrays(pa.array(np.ravel(hasil.jumlah), type=pa.int64()), n_kriteria),
+        'nilai_ahp': pa.array(hasil.nilai_ahp, type=pa.float64()),
+        'ranking': pa.array(hasil.ranking, type=pa.int64()),
+        'kategori': pa.array(np.asarray(hasil.kategori, dtype=str)).dictionary_encode(),
+    })
+    meta = {
+        'versi': VERSI_ARSIP,
+        'periode_id': int(hasil.periode_id),
+        'kriteria_ids': [int(k) for k in hasil.kriteria_ids],
+        'bobot': [float(b) for b in hasil.bobot],
+        'cr': None if np.isnan(hasil.cr) else float(hasil.cr),
+    }
+    return tabel.replace_schema_metadata({'ahp': json.dumps(meta)})
+
+
+def simpan_periode(root, hasil, format='arrow'):
+    """Menulis HasilPeriode ke arsip (atomik lewat file sementara); mengembalikan path"""
+    import pyarrow as pa
+
+    path = path_periode(root, hasil.periode_id, format)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with span('arsip', baris=len(hasil.guru_ids), format=format):
+        tabel = _ke_tabel(hasil)
+        sementara = path + '.tmp'
+        if format == 'arrow':
+            # Tanpa kompresi agar bisa dibaca zero-copy lewat memory map
+            with pa.OSFile(sementara, 'wb') as sink, pa.ipc.new_file(sink, tabel.schema) as writer:
+                writer.write_table(tabel)
+        else:
+            import pyarrow.parquet as pq
+
+            pq.write_table(tabel, sementara)
+        os.replace(sementara, path)
+    return path
+
+
+def _matriks(kolom, n_kriteria):
+    # fixed_size_list (arrow) atau list (parquet) -> array (N, K)
+    nilai = kolom.combine_chunks().flatten()
+    return nilai.to_numpy(zero_copy_only=False).reshape(-1, n_kriteria)
+
+
+def baca_tabel(path):
+    """Membaca tabel arsip; file Arrow dibaca lewat memory map"""
+    import pyarrow as pa
+
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, memory_map=True)
+    return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+
+def muat_periode(root, periode_id):
+    """HasilPeriode dari arsip, atau None bila periode belum diarsipkan"""
+    path = cari_arsip(root, periode_id)
+    if path is None:
+        return None
+    tabel = baca_tabel(path)
+    meta = json.loads(tabel.schema.metadata[b'ahp'])
+    if meta['versi'] != VERSI_ARSIP:
+        return None
+    n_kriteria = len(meta['kriteria_ids'])
+    return HasilPeriode(
+        meta['periode_id'],
+        tabel.column('guru_id').to_numpy(),
+        np.array(meta['kriteria_ids'], dtype=np.int64),
+        _matriks(tabel.column('nilai'), n_kriteria),
+        _matriks(tabel.column('jumlah'), n_kriteria),
+        np.array(meta['bobot'], dtype=float),
+        tabel.column('nilai_ahp').to_numpy(),
+        tabel.column('ranking').to_numpy(),
+        np.asarray(tabel.column('kategori').cast('string').to_numpy(zero_copy_only=False), dtype=str),
+        np.nan if meta['cr'] is None else meta['cr'],
+    )
+
+
+def status_periode(conn, periode_id):
+    """Status tt_periode_evaluasi ('draft', 'aktif', 'selesai') atau None"""
+    sql = f'SELECT status FROM tt_periode_evaluasi WHERE id = {placeholder(conn)}'
+    rows = [row for chunk in iter_query(conn, sql, (periode_id,)) for row in chunk]
+    return rows[0][0] if rows else None
+
+
+def arsip_sesuai(hasil, matriks=None):
+    """True bila bobot arsip berasal dari sumber yang diminta.
+
+    Dengan ``matriks``, bobot dan CR arsip harus sama dengan eigenvector
+    matriks tersebut. Tanpa ``matriks``, arsip harus memakai bobot tm_kriteria
+    (tanpa CR); perubahan tm_kriteria.bobot sendiri tidak diperiksa karena
+    periode yang selesai memakai bobot saat diarsipkan.
+    """
+    if matriks is None:
+        return np.isnan(hasil.cr)
+    hasil_ahp = hitung_ahp(matriks)
+    return (
+        len(hasil_ahp.bobot) == len(hasil.bobot)
+        and np.allclose(hasil_ahp.bobot, hasil.bobot)
+        and np.isclose(hasil_ahp.cr, hasil.cr)
+    )
+
+
+def ambil_periode(conn, periode_id, root=ROOT_DEFAULT, format='arrow', matriks=None, paksa=False):
+    """HasilPeriode dari arsip bila ada; bila tidak, dihitung dari database.
+
+    Hasil hanya diarsipkan untuk periode berstatus 'selesai', karena periode
+    yang masih berjalan dapat berubah. ``paksa`` menghitung ulang dan menimpa
+    arsip yang ada. Arsip juga dihitung ulang bila bobotnya tidak berasal dari
+    sumber yang diminta (lihat ``arsip_sesuai``). ``conn`` boleh berupa fungsi
+    yang membuka koneksi, sehingga koneksi hanya dibuka bila arsip belum
+    tersedia.
+    """
+    if not paksa:
+        hasil = muat_periode(root, periode_id)
+        if hasil is not None and arsip_sesuai(hasil, matriks):
+            return hasil
+    if not hasattr(conn, 'cursor'):
+        conn = conn()
+    hasil = hitung_periode(conn, periode_id, matriks)
+    if status_periode(conn, periode_id) == 'selesai':
+        simpan_periode(root, hasil, format)
+    return hasil
+
+
+def buka_dataset(root=ROOT_DEFAULT, format='arrow'):
+    """Seluruh arsip sebagai pyarrow.dataset dengan kolom partisi periode_evaluasi_id"""
+    import pyarrow.dataset as ds
+
+    return ds.dataset(
+        root, format='ipc' if format == 'arrow' else 'parquet', partitioning='hive',
+        exclude_invalid_files=True,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Arsipkan hasil AHP periode yang sudah selesai ke format kolumnar')
+    parser.add_argument('--periode', type=int, nargs='*', default=[], help='ID periode evaluasi')
+    parser.add_argument('--semua', action='store_true', help="Arsipkan semua periode berstatus 'selesai'")
+    parser.add_argument('--root', default=ROOT_DEFAULT, help='Folder arsip')
+    parser.add_argument('--format', choices=list(FORMAT), default='arrow')
+    parser.add_argument('--paksa', action='store_true', help='Hitung ulang walaupun arsip sudah ada')
+    args = parser.parse_args(argv)
+
+    koneksi = []
+
+    def buka_koneksi():
+        # Koneksi dibuka sekali, dan hanya bila ada periode yang belum diarsipkan
+        if not koneksi:
+            koneksi.append(koneksi_dari_env())
+        return koneksi[0]
+
+    periode_ids = list(args.periode)
+    if args.semua:
+        conn = buka_koneksi()
+        sql = "SELECT id FROM tt_periode_evaluasi WHERE status = 'selesai' ORDER BY id"
+        periode_ids += [row[0] for chunk in iter_query(conn, sql) for row in chunk]
+
+    with profil('arsip'):
+        for periode_id in periode_ids:
+            hasil = ambil_periode(buka_koneksi, periode_id, args.root, args.format, paksa=args.paksa)
+            path = cari_arsip(args.root, periode_id)
+            print(f"Periode {periode_id}: {len(hasil.guru_ids)} guru, arsip {path or '(tidak diarsipkan, periode belum selesai)'}")
+
+
+if __name__ == '__main__':
+    main()
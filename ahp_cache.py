@@ -0,0 +1,191 @@
+"""Cache LRU hasil AHP berdasarkan sidik jari matriks perbandingan.
+
+Sebagian besar evaluator mengirim matriks yang identik atau hampir identik,
+sehingga bobot dan CR cukup dihitung sekali. Kunci cache adalah hash dari
+seluruh elemen di luar diagonal yang dibulatkan ke ``desimal`` angka. Segitiga
+bawah ikut masuk kunci karena matriks dari evaluator tidak selalu resiprokal
+sempurna (mis. 0.33 untuk 1/3), dan hasil dihitung dari matriks apa adanya,
+sama seperti ``hitung_ahp``. Matriks yang sama setelah pembulatan berbagi satu
+entri yang dihitung dari matriks pertama yang masuk cache, sehingga selisihnya
+dengan ``hitung_ahp`` hanya sebesar pembulatan tersebut. Cache disimpan di
+memori dengan opsi penyimpanan SQLite di disk, keduanya dibatasi ukurannya.
+"""
+import hashlib
+import sqlite3
+from collections import OrderedDict
+
+import numpy as np
+
+from ahp_engine import HasilAHP, hitung_ahp_batch
+
+DESIMAL_DEFAULT = 4
+
+SKEMA_CACHE = """
+CREATE TABLE IF NOT EXISTS cache_ahp (
+    kunci TEXT PRIMARY KEY,
+    n INTEGER NOT NULL,
+    bobot BLOB NOT NULL,
+    lambda_max REAL NOT NULL,
+    ci REAL NOT NULL,
+    cr REAL NOT NULL,
+    diakses INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_ahp_diakses_index ON cache_ahp (diakses);
+"""
+
+
+def luar_diagonal(matriks, desimal=DESIMAL_DEFAULT):
+    """Elemen di luar diagonal (segitiga atas lalu bawah) yang dibulatkan, berbentuk (B, n*(n-1))"""
+    matriks = np.asarray(matriks, dtype=float)
+    if matriks.ndim == 2:
+        matriks = matriks[np.newaxis]
+    i, j = np.triu_indices(matriks.shape[-1], k=1)
+    return np.round(np.concatenate([matriks[:, i, j], matriks[:, j, i]], axis=1), desimal)
+
+
+def fingerprint(matriks, desimal=DESIMAL_DEFAULT):
+    """Sidik jari satu matriks (n, n) atau list sidik jari untuk tumpukan (B, n, n)"""
+    n = np.shape(matriks)[-1]
+    kunci = [_hash_baris(baris, n) for baris in luar_diagonal(matriks, desimal)]
+    return kunci[0] if np.ndim(matriks) == 2 else kunci
+
+
+def _hash_baris(baris, n):
+    # +0.0 menyamakan -0.0 dan 0.0 sebelum diambil byte-nya
+    return f'{n}:' + hashlib.blake2b((baris + 0.0).tobytes(), digest_size=16).hexdigest()
+
+
+class CacheAHP:
+    """Cache LRU HasilAHP di memori, opsional dengan penyimpanan SQLite di disk.
+
+    ``kapasitas`` membatasi jumlah entri di memori dan ``kapasitas_disk``
+    membatasi jumlah baris di file SQLite; entri yang paling lama tidak
+    diakses dibuang lebih dulu.
+    """
+
+    def __init__(self, kapasitas=10000, path=None, kapasitas_disk=100000, desimal=DESIMAL_DEFAULT):
+        self.kapasitas = kapasitas
+        self.kapasitas_disk = kapasitas_disk
+        self.desimal = desimal
+        self._data = OrderedDict()
+        self._disk = None
+        self._jam = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        if path is not None:
+            self._disk = sqlite3.connect(path)
+            self._disk.executescript(SKEMA_CACHE)
+            row = self._disk.execute('SELECT MAX(diakses) FROM cache_ahp').fetchone()
+            self._jam = row[0] or 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def statistik(self):
+        """Counter hit/miss cache"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'evictions': self.evictions,
+            'ukuran': len(self._data),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def hitung(self, matriks):
+        """HasilAHP untuk satu matriks (n, n), dari cache bila sudah pernah dihitung"""
+        hasil = self.hitung_batch(np.asarray(matriks, dtype=float)[np.newaxis])
+        return HasilAHP(hasil.bobot[0], float(hasil.lambda_max[0]), float(hasil.ci[0]), float(hasil.cr[0]))
+
+    def hitung_batch(self, matriks):
+        """HasilAHP untuk tumpukan (B, n, n); hanya matriks unik yang belum ada di cache yang dihitung.
+
+        Matriks dihitung apa adanya (tidak dipaksa resiprokal); matriks yang
+        sama setelah dibulatkan ke ``desimal`` angka memakai hasil yang sama.
+        """
+        matriks = np.asarray(matriks, dtype=float)
+        kunci = fingerprint(matriks, self.desimal)
+
+        hasil = {}
+        hilang = {}
+        for idx, k in enumerate(kunci):
+            if k in hasil or k in hilang:
+                self.hits += 1
+                continue
+            entri = self._ambil(k)
+            if entri is not None:
+                self.hits += 1
+                hasil[k] = entri
+            else:
+                self.misses += 1
+                hilang[k] = idx
+
+        if hilang:
+            urutan = list(hilang)
+            baru = hitung_ahp_batch(matriks[[hilang[k] for k in urutan]])
+            for i, k in enumerate(urutan):
+                entri = (baru.bobot[i], float(baru.lambda_max[i]), float(baru.ci[i]), float(baru.cr[i]))
+                self._simpan(k, entri)
+                hasil[k] = entri
+
+        entri = [hasil[k] for k in kunci]
+        return HasilAHP(
+            np.array([e[0] for e in entri]),
+            np.array([e[1] for e in entri]),
+            np.array([e[2] for e in entri]),
+            np.array([e[3] for e in entri]),
+        )
+
+    def _ambil(self, kunci):
+        if kunci in self._data:
+            self._data.move_to_end(kunci)
+            return self._data[kunci]
+        if self._disk is None:
+            return None
+        row = self._disk.execute('SELECT bobot, lambda_max, ci, cr FROM cache_ahp WHERE kunci = ?', (kunci,)).fetchone()
+        if row is None:
+            return None
+        self.disk_hits += 1
+        self._jam += 1
+        self._disk.execute('UPDATE cache_ahp SET diakses = ? WHERE kunci = ?', (self._jam, kunci))
+        entri = (np.frombuffer(row[0], dtype=float).copy(), row[1], row[2], row[3])
+        self._simpan_memori(kunci, entri)
+        return entri
+
+    def _simpan_memori(self, kunci, entri):
+        self._data[kunci] = entri
+        self._data.move_to_end(kunci)
+        while len(self._data) > self.kapasitas:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def _simpan(self, kunci, entri):
+        self._simpan_memori(kunci, entri)
+        if self._disk is None:
+            return
+        self._jam += 1
+        bobot, lambda_max, ci, cr = entri
+        self._disk.execute(
+            'INSERT OR REPLACE INTO cache_ahp (kunci, n, bobot, lambda_max, ci, cr, diakses) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (kunci, len(bobot), np.asarray(bobot, dtype=float).tobytes(), lambda_max, ci, cr, self._jam),
+        )
+
+    def flush(self):
+        """Menulis perubahan ke disk dan membuang entri disk terlama di atas kapasitas"""
+        if self._disk is None:
+            return
+        self._disk.execute(
+            'DELETE FROM cache_ahp WHERE kunci IN '
+            '(SELECT kunci FROM cache_ahp ORDER BY diakses DESC LIMIT -1 OFFSET ?)',
+            (self.kapasitas_disk,),
+        )
+        self._disk.commit()
+
+    def close(self):
+        if self._disk is not None:
+            self.flush()
+            self._disk.close()
+            self._disk = None
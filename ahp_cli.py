@@ -0,0 +1,128 @@
+"""Satu pintu masuk CLI untuk seluruh skrip AHP.
+
+Modul berat (NumPy, openpyxl, python-docx, pyarrow) hanya diimpor oleh
+subperintah yang membutuhkannya, sehingga ``--help`` dan perhitungan bobot
+satu matriks tetap cepat ketika dipanggil sebagai job berumur pendek.
+
+Contoh:
+    python ahp_cli.py bobot
+    python ahp_cli.py bobot --matriks matriks.json --json
+    python ahp_cli.py skor --input guru.json
+    python ahp_cli.py form --output form.docx
+    python ahp_cli.py batch --input guru.json --output laporan/
+"""
+import argparse
+import json
+import sys
+
+# Subperintah yang diteruskan ke main(argv) modul lain: nama -> (modul, keterangan)
+PERINTAH_MODUL = {
+    'batch': ('batch_laporan', 'Render form DOCX dan ringkasan XLSX per guru secara paralel'),
+    'pdf': ('form_evaluasi_pdf', 'Render form evaluasi PDF per guru atau gabungan satu periode'),
+    'sensitivitas': ('ahp_sensitivitas', 'Analisis sensitivitas ranking terhadap bobot kriteria'),
+    'metode': ('ahp_metode', 'Bandingkan metode prioritas (eigenvector, geometrik, LLSM, fuzzy)'),
+    'arsip': ('ahp_arsip', 'Arsipkan hasil periode yang sudah selesai ke Arrow/Parquet'),
+    'inkremental': ('ahp_inkremental', 'Hitung ulang tt_hasil_evaluasi untuk guru yang berubah'),
+    'tren': ('ahp_tren', 'Tren nilai guru per periode dan tahun ajaran dari seluruh riwayat'),
+    'layanan': ('ahp_layanan', 'Jalankan layanan HTTP perhitungan AHP'),
+    'benchmark': ('benchmark_ahp', 'Benchmark bobot, skor, XLSX dan DOCX'),
+}
+
+
+def _baca_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _muat_guru(path):
+    if path:
+        return _baca_json(path)
+    from form_evaluasi_guru import GURU_DATA
+
+    return [dict(guru) for guru in GURU_DATA]
+
+
+def perintah_bobot(args):
+    """Bobot, lambda max, CI dan CR satu matriks kriteria (tanpa NumPy)"""
+    from ahp_dasar import BATAS_CR, MATRIKS_KRITERIA, NAMA_KRITERIA, hitung_ahp_murni
+
+    matriks = _baca_json(args.matriks) if args.matriks else MATRIKS_KRITERIA
+    hasil = hitung_ahp_murni(matriks)
+    konsisten = hasil.cr < BATAS_CR
+    if args.json:
+        print(json.dumps(dict(hasil._asdict(), konsisten=konsisten)))
+        return
+    nama = NAMA_KRITERIA if len(hasil.bobot) == len(NAMA_KRITERIA) else [f'K{i + 1}' for i in range(len(hasil.bobot))]
+    for n, bobot in zip(nama, hasil.bobot):
+        print(f'{n:25s} {bobot:.4f}')
+    print(f'Lambda max = {hasil.lambda_max:.4f}, CI = {hasil.ci:.4f}, CR = {hasil.cr:.4f} ({"konsisten" if konsisten else "tidak konsisten"})')
+
+
+def perintah_skor(args):
+    """Nilai AHP, ranking dan kategori seluruh guru"""
+    from ahp_engine import MATRIKS_KRITERIA, hitung_ahp
+    from ahp_skor import hitung_skor
+
+    guru_list = _muat_guru(args.input)
+    matriks = _baca_json(args.matriks) if args.matriks else MATRIKS_KRITERIA
+    hasil = hitung_skor([guru['nilai'] for guru in guru_list], hitung_ahp(matriks).bobot)
+    for i in hasil.ranking.argsort():
+        print(f"{hasil.ranking[i]:3d}. {guru_list[i]['nama']:30s} {hasil.nilai[i]:6.2f}  {hasil.kategori[i]}")
+
+
+def perintah_form(args):
+    """Form evaluasi DOCX terisi untuk daftar guru"""
+    from ahp_engine import MATRIKS_KRITERIA, hitung_ahp
+    from batch_laporan import lengkapi_nilai_ahp
+    from form_evaluasi_guru import create_form_evaluasi
+
+    guru_list = _muat_guru(args.input)
+    matriks = _baca_json(args.matriks) if args.matriks else MATRIKS_KRITERIA
+    # File input boleh tanpa nilai_ahp dan komentar, seperti pada perintah batch
+    lengkapi_nilai_ahp(guru_list, hitung_ahp(matriks).bobot)
+    for guru in guru_list:
+        guru.setdefault('komentar', [])
+    create_form_evaluasi(guru_list, args.output)
+
+
+def buat_parser():
+    parser = argparse.ArgumentParser(prog='ahp_cli.py', description='Perhitungan dan laporan AHP evaluasi guru')
+    sub = parser.add_subparsers(dest='perintah', metavar='PERINTAH')
+    sub.required = True
+
+    p = sub.add_parser('bobot', help='Bobot, lambda max, CI dan CR matriks kriteria')
+    p.add_argument('--matriks', help='File JSON matriks perbandingan (n x n); default matriks contoh K1-K5')
+    p.add_argument('--json', action='store_true', help='Keluaran dalam format JSON')
+    p.set_defaults(fungsi=perintah_bobot)
+
+    p = sub.add_parser('skor', help='Nilai AHP, ranking dan kategori guru')
+    p.add_argument('--input', help='File JSON berisi list guru (format seperti GURU_DATA); default data contoh')
+    p.add_argument('--matriks', help='File JSON matriks perbandingan kriteria')
+    p.set_defaults(fungsi=perintah_skor)
+
+    p = sub.add_parser('form', help='Form evaluasi DOCX terisi')
+    p.add_argument('--input', help='File JSON berisi list guru (format seperti GURU_DATA); default data contoh')
+    p.add_argument('--matriks', help='File JSON matriks perbandingan kriteria untuk nilai_ahp yang belum diisi')
+    p.add_argument('--output', default='Form_Evaluasi_Guru_Terisi.docx')
+    p.set_defaults(fungsi=perintah_form)
+
+    for nama, (modul, keterangan) in PERINTAH_MODUL.items():
+        # Argumen diteruskan apa adanya, termasuk --help milik modul tersebut
+        sub.add_parser(nama, help=keterangan, add_help=False).set_defaults(modul=modul)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    args, sisa = buat_parser().parse_known_args(argv)
+    if getattr(args, 'modul', None):
+        import importlib
+
+        return importlib.import_module(args.modul).main(sisa)
+    if sisa:
+        buat_parser().error(f"argumen tidak dikenal: {' '.join(sisa)}")
+    return args.fungsi(args)
+
+
+if __name__ == '__main__':
+    main()
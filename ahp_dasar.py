@@ -0,0 +1,58 @@
+"""Konstanta AHP dan perhitungan satu matriks tanpa NumPy.
+
+Modul ini sengaja hanya memakai pustaka standar agar perintah CLI yang
+berumur pendek (misalnya menghitung bobot satu matriks kriteria) tidak
+membayar waktu impor NumPy. Untuk tumpukan matriks gunakan ``ahp_engine``.
+"""
+from collections import namedtuple
+
+# Random Index (RI) Saaty, indeks = ordo matriks (n)
+RI_SAATY = (0.0, 0.0, 0.0, 0.58, 0.90, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49, 1.51, 1.48, 1.56, 1.57, 1.59)
+
+# Batas Consistency Ratio agar hasil dianggap valid
+BATAS_CR = 0.1
+
+# Matriks perbandingan berpasangan kriteria K1-K5 yang dipakai laporan sekolah
+KODE_KRITERIA = ['K1', 'K2', 'K3', 'K4', 'K5']
+NAMA_KRITERIA = ['Kedisiplinan', 'Penguasaan Materi', 'Metode Mengajar', 'Komunikasi', 'Evaluasi Pembelajaran']
+MATRIKS_KRITERIA = [
+    [1, 0.5, 2, 3, 4],
+    [2, 1, 3, 4, 5],
+    [0.5, 0.33, 1, 2, 3],
+    [0.33, 0.25, 0.5, 1, 2],
+    [0.25, 0.2, 0.33, 0.5, 1]
+]
+
+HasilAHP = namedtuple('HasilAHP', ['bobot', 'lambda_max', 'ci', 'cr'])
+
+
+def hitung_ahp_murni(matriks, toleransi=1e-13, maks_iterasi=1000):
+    """Bobot, lambda max, CI dan CR satu matriks (n, n) dengan power iteration.
+
+    Untuk matriks positif power iteration konvergen ke eigenvector Perron,
+    sama dengan hasil ``ahp_engine.hitung_ahp`` hingga toleransi numerik.
+    """
+    matriks = [[float(x) for x in baris] for baris in matriks]
+    n = len(matriks)
+    if any(len(baris) != n for baris in matriks):
+        raise ValueError('Matriks perbandingan harus berbentuk (n, n)')
+    if any(x <= 0 for baris in matriks for x in baris):
+        raise ValueError('Semua elemen matriks perbandingan harus bernilai positif')
+    if n >= len(RI_SAATY):
+        raise ValueError(f'RI Saaty hanya tersedia untuk n <= {len(RI_SAATY) - 1}, diberikan n={n}')
+
+    bobot = [1.0 / n] * n
+    for _ in range(maks_iterasi):
+        hasil_kali = [sum(a * w for a, w in zip(baris, bobot)) for baris in matriks]
+        total = sum(hasil_kali)
+        baru = [x / total for x in hasil_kali]
+        selisih = max(abs(a - b) for a, b in zip(baru, bobot))
+        bobot = baru
+        if selisih < toleransi:
+            break
+
+    hasil_kali = [sum(a * w for a, w in zip(baris, bobot)) for baris in matriks]
+    lambda_max = sum(x / w for x, w in zip(hasil_kali, bobot)) / n
+    ci = (lambda_max - n) / (n - 1) if n > 1 else 0.0
+    cr = ci / RI_SAATY[n] if RI_SAATY[n] > 0 else 0.0
+    return HasilAHP(bobot, lambda_max, ci, cr)
@@ -0,0 +1,283 @@
+"""Akses data evaluasi langsung dari skema tt_evaluasi / tt_detail_evaluasi.
+
+Nilai satu periode diambil dengan satu query agregat (GROUP BY guru_id,
+kriteria_id) yang dibaca bertahap lewat ``fetchmany`` dan server-side cursor
+(MySQL), lalu disusun menjadi array NumPy ``(n_guru, n_kriteria)``. Skema
+SQLite yang setara dengan migration Laravel disediakan untuk pengujian lokal.
+"""
+import os
+import sqlite3
+from collections import namedtuple
+
+import numpy as np
+
+NilaiPeriode = namedtuple('NilaiPeriode', ['guru_ids', 'kriteria_ids', 'nilai', 'jumlah'])
+
+# Nama role evaluator (spatie/permission) ke kolom tt_hasil_evaluasi, sama seperti HasilEvaluasiController
+ROLE_EVALUATOR = {
+    'siswa': 'siswa',
+    'guru': 'rekan',
+    'kepala_sekolah': 'pengawas',
+    'kepsek': 'pengawas',
+}
+KOLOM_ROLE = ['siswa', 'rekan', 'pengawas']
+# Bobot role untuk nilai akhir, sama seperti $configBobot di controller
+BOBOT_ROLE = {'siswa': 30, 'rekan': 30, 'pengawas': 40}
+MODEL_USER = 'App\\Models\\User'
+
+# Skema minimal yang mengikuti database/migrations, cukup untuk perhitungan AHP
+SKEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL DEFAULT '',
+    is_active TINYINT(1) NOT NULL DEFAULT 1,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS roles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(255) NOT NULL,
+    guard_name VARCHAR(255) NOT NULL DEFAULT 'web',
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS model_has_roles (
+    role_id INTEGER NOT NULL REFERENCES roles(id) ON DELETE CASCADE,
+    model_type VARCHAR(255) NOT NULL,
+    model_id INTEGER NOT NULL,
+    PRIMARY KEY (role_id, model_id, model_type)
+);
+CREATE TABLE IF NOT EXISTS tm_mata_pelajaran (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama VARCHAR(62) NOT NULL,
+    kode VARCHAR(255) NOT NULL,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS tm_guru (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    nip VARCHAR(20) NOT NULL,
+    mata_pelajaran_id INTEGER NOT NULL REFERENCES tm_mata_pelajaran(id),
+    tanggal_bergabung DATE NOT NULL,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS tm_kriteria (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama VARCHAR(255) NOT NULL,
+    deskripsi TEXT NOT NULL DEFAULT '',
+    bobot DECIMAL(5, 2) NOT NULL,
+    aktif TINYINT(1) NOT NULL DEFAULT 1,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS tm_sub_kriteria (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kriteria_id INTEGER NOT NULL REFERENCES tm_kriteria(id) ON DELETE CASCADE,
+    nama VARCHAR(100) NOT NULL,
+    deskripsi TEXT,
+    bobot DECIMAL(5, 2) NOT NULL DEFAULT 0,
+    urutan INTEGER NOT NULL DEFAULT 0,
+    aktif TINYINT(1) NOT NULL DEFAULT 1,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE INDEX IF NOT EXISTS tm_sub_kriteria_kriteria_id_index ON tm_sub_kriteria (kriteria_id);
+CREATE TABLE IF NOT EXISTS tt_periode_evaluasi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    judul VARCHAR(255) NOT NULL,
+    tanggal_mulai DATE NOT NULL,
+    tanggal_selesai DATE NOT NULL,
+    status VARCHAR(10) NOT NULL CHECK (status IN ('draft', 'aktif', 'selesai')),
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS tt_evaluasi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    periode_evaluasi_id INTEGER NOT NULL REFERENCES tt_periode_evaluasi(id),
+    evaluator_id INTEGER NOT NULL REFERENCES users(id),
+    jenis VARCHAR(10) CHECK (jenis IN ('siswa', 'rekan', 'kepsek', 'pengawas')),
+    guru_id INTEGER NOT NULL REFERENCES tm_guru(id),
+    status VARCHAR(10) NOT NULL DEFAULT 'draft' CHECK (status IN ('draft', 'selesai')),
+    komentar_umum TEXT,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE IF NOT EXISTS tt_detail_evaluasi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    evaluasi_id INTEGER NOT NULL REFERENCES tt_evaluasi(id),
+    kriteria_id INTEGER NOT NULL REFERENCES tm_kriteria(id),
+    sub_kriteria_id INTEGER REFERENCES tm_sub_kriteria(id) ON DELETE CASCADE,
+    nilai DECIMAL(5, 2) NOT NULL,
+    komentar TEXT,
+    created_at DATETIME, updated_at DATETIME
+);
+CREATE INDEX IF NOT EXISTS tt_detail_evaluasi_sub_kriteria_id_index ON tt_detail_evaluasi (sub_kriteria_id);
+CREATE TABLE IF NOT EXISTS tt_hasil_evaluasi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guru_id INTEGER NOT NULL REFERENCES tm_guru(id),
+    periode_evaluasi_id INTEGER NOT NULL REFERENCES tt_periode_evaluasi(id),
+    nilai_siswa DECIMAL(5, 2) NOT NULL,
+    nilai_rekan DECIMAL(5, 2) NOT NULL,
+    nilai_pengawas DECIMAL(5, 2) NOT NULL,
+    nilai_akhir DECIMAL(5, 2) NOT NULL,
+    created_at DATETIME, updated_at DATETIME
+);
+"""
+
+
+def buat_database_sqlite(path=':memory:'):
+    """Membuat database SQLite dengan skema yang sama seperti migration Laravel"""
+    conn = sqlite3.connect(path)
+    conn.executescript(SKEMA_SQLITE)
+    return conn
+
+
+def koneksi_dari_env(env=None, base_dir=None):
+    """Membuka koneksi DB-API sesuai variabel DB_* di .env Laravel (sqlite atau mysql)"""
+    env = os.environ if env is None else env
+    base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+    driver = env.get('DB_CONNECTION', 'sqlite')
+
+    if driver == 'sqlite':
+        database = env.get('DB_DATABASE') or os.path.join(base_dir, 'database', 'database.sqlite')
+        return sqlite3.connect(database)
+    if driver in ('mysql', 'mariadb'):
+        import pymysql
+
+        return pymysql.connect(
+            host=env.get('DB_HOST', '127.0.0.1'),
+            port=int(env.get('DB_PORT', 3306)),
+            user=env.get('DB_USERNAME', 'root'),
+            password=env.get('DB_PASSWORD', ''),
+            database=env.get('DB_DATABASE', 'laravel'),
+        )
+    raise ValueError(f'DB_CONNECTION tidak didukung: {driver}')
+
+
+def placeholder(conn):
+    """Placeholder parameter query sesuai driver (sqlite3: ?, MySQL: %s)"""
+    return '?' if isinstance(conn, sqlite3.Connection) else '%s'
+
+
+def buka_cursor(conn):
+    """Membuka server-side cursor bila driver mendukung, agar hasil tidak dimuat sekaligus"""
+    modul = type(conn).__module__
+    if modul.startswith('pymysql'):
+        from pymysql.cursors import SSCursor
+
+        return conn.cursor(SSCursor)
+    if modul.startswith('MySQLdb'):
+        from MySQLdb.cursors import SSCursor
+
+        return conn.cursor(SSCursor)
+    return conn.cursor()
+
+
+def iter_query(conn, sql, params=(), ukuran_chunk=5000):
+    """Menjalankan query dan menghasilkan baris per chunk lewat fetchmany"""
+    cursor = buka_cursor(conn)
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(ukuran_chunk)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cursor.close()
+
+
+def muat_kriteria(conn, aktif=True):
+    """Mengambil (ids, nama, bobot) kriteria dari tm_kriteria, terurut berdasarkan id"""
+    sql = 'SELECT id, nama, bobot FROM tm_kriteria'
+    if aktif:
+        sql += ' WHERE aktif = 1'
+    sql += ' ORDER BY id'
+    rows = [row for chunk in iter_query(conn, sql) for row in chunk]
+    ids = np.array([row[0] for row in rows], dtype=np.int64)
+    bobot = np.array([float(row[2]) for row in rows], dtype=float)
+    return ids, [row[1] for row in rows], bobot
+
+
+def muat_sub_kriteria(conn, aktif=True):
+    """Mengambil sub kriteria per kriteria induk: {kriteria_id: [(id, nama, bobot), ...]}"""
+    sql = 'SELECT id, kriteria_id, nama, bobot FROM tm_sub_kriteria'
+    if aktif:
+        sql += ' WHERE aktif = 1'
+    sql += ' ORDER BY kriteria_id, urutan, id'
+    hasil = {}
+    for chunk in iter_query(conn, sql):
+        for sub_id, kriteria_id, nama, bobot in chunk:
+            hasil.setdefault(kriteria_id, []).append((sub_id, nama, float(bobot)))
+    return hasil
+
+
+def sql_agregat_periode(conn, per_role=False):
+    """Query agregat SUM/COUNT nilai per (guru_id, kriteria_id) untuk satu periode"""
+    ph = placeholder(conn)
+    if not per_role:
+        return (
+            'SELECT e.guru_id, de.kriteria_id, SUM(de.nilai), COUNT(de.nilai) '
+            'FROM tt_detail_evaluasi de '
+            'JOIN tt_evaluasi e ON de.evaluasi_id = e.id '
+            f'WHERE e.periode_evaluasi_id = {ph} '
+            'GROUP BY e.guru_id, de.kriteria_id '
+            'ORDER BY e.guru_id, de.kriteria_id'
+        )
+    return (
+        'SELECT e.guru_id, de.kriteria_id, r.name, SUM(de.nilai), COUNT(de.nilai) '
+        'FROM tt_detail_evaluasi de '
+        'JOIN tt_evaluasi e ON de.evaluasi_id = e.id '
+        'JOIN model_has_roles mr ON mr.model_id = e.evaluator_id '
+        'JOIN roles r ON mr.role_id = r.id '
+        f'WHERE e.periode_evaluasi_id = {ph} AND mr.model_type = {ph} '
+        'GROUP BY e.guru_id, de.kriteria_id, r.name '
+        'ORDER BY e.guru_id, de.kriteria_id'
+    )
+
+
+def iter_agregat_periode(conn, periode_id, ukuran_chunk=5000, per_role=False):
+    """Menghasilkan chunk baris agregat (guru_id, kriteria_id, [role,] total, jumlah)"""
+    params = (periode_id, MODEL_USER) if per_role else (periode_id,)
+    return iter_query(conn, sql_agregat_periode(conn, per_role), params, ukuran_chunk)
+
+
+def _pivot(guru, kriteria, total, jumlah, kriteria_ids):
+    guru_ids, idx_guru = np.unique(guru, return_inverse=True)
+    # Detail untuk kriteria yang tidak aktif / tidak diminta diabaikan
+    idx_kriteria = np.minimum(np.searchsorted(kriteria_ids, kriteria), len(kriteria_ids) - 1)
+    valid = kriteria_ids[idx_kriteria] == kriteria
+
+    sum_nilai = np.zeros((len(guru_ids), len(kriteria_ids)))
+    count = np.zeros((len(guru_ids), len(kriteria_ids)), dtype=np.int64)
+    np.add.at(sum_nilai, (idx_guru[valid], idx_kriteria[valid]), total[valid])
+    np.add.at(count, (idx_guru[valid], idx_kriteria[valid]), jumlah[valid])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rata = np.where(count > 0, sum_nilai / np.maximum(count, 1), np.nan)
+    return guru_ids, rata, count
+
+
+def muat_nilai_periode(conn, periode_id, kriteria_ids=None, ukuran_chunk=5000):
+    """Memuat rata-rata nilai per (guru, kriteria) satu periode sebagai NilaiPeriode.
+
+    ``nilai`` berbentuk (n_guru, n_kriteria) dengan NaN untuk kriteria yang
+    belum dinilai, ``jumlah`` berisi banyaknya detail evaluasi per sel.
+    """
+    if kriteria_ids is None:
+        kriteria_ids, _, _ = muat_kriteria(conn)
+    kriteria_ids = np.asarray(kriteria_ids, dtype=np.int64)
+
+    kolom = [[], [], [], []]
+    for chunk in iter_agregat_periode(conn, periode_id, ukuran_chunk):
+        for i, values in enumerate(zip(*chunk)):
+            kolom[i].append(np.asarray(values, dtype=float))
+    if not kolom[0]:
+        return NilaiPeriode(np.array([], dtype=np.int64), kriteria_ids, np.empty((0, len(kriteria_ids))), np.empty((0, len(kriteria_ids)), dtype=np.int64))
+
+    guru, kriteria, total, jumlah = (np.concatenate(k) for k in kolom)
+    guru_ids, rata, count = _pivot(guru.astype(np.int64), kriteria.astype(np.int64), total, jumlah.astype(np.int64), kriteria_ids)
+    return NilaiPeriode(guru_ids, kriteria_ids, rata, count)
+
+
+def ke_dataframe(nilai_periode, nama_kriteria=None):
+    """Mengubah NilaiPeriode menjadi pandas DataFrame (index guru_id, kolom kriteria)"""
+    import pandas as pd
+
+    kolom = nama_kriteria if nama_kriteria is not None else nilai_periode.kriteria_ids
+    return pd.DataFrame(nilai_periode.nilai, index=pd.Index(nilai_periode.guru_ids, name='guru_id'), columns=kolom)
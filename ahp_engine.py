@@ -0,0 +1,76 @@
+"""Mesin perhitungan AHP: bobot prioritas (eigenvector), lambda max, CI dan CR.
+
+Semua fungsi menerima satu matriks perbandingan berpasangan ``(n, n)`` atau
+tumpukan matriks ``(B, n, n)`` sehingga ribuan matriks evaluator dalam satu
+periode dapat dihitung sekaligus tanpa loop Python.
+"""
+import numpy as np
+
+# Konstanta dan HasilAHP didefinisikan di ahp_dasar (tanpa NumPy) dan diekspor ulang di sini
+from ahp_dasar import BATAS_CR, KODE_KRITERIA, MATRIKS_KRITERIA, NAMA_KRITERIA, HasilAHP
+from ahp_dasar import RI_SAATY as _RI_SAATY
+
+RI_SAATY = np.array(_RI_SAATY)
+
+
+def ke_matriks(matrix_data):
+    """Mengubah baris matriks (boleh diawali label seperti 'K1') menjadi array float"""
+    rows = [row[1:] if row and isinstance(row[0], str) else row for row in matrix_data]
+    return np.asarray(rows, dtype=float)
+
+
+def random_index(n):
+    """Mengambil nilai RI Saaty untuk matriks berordo n"""
+    if n >= len(RI_SAATY):
+        raise ValueError(f'RI Saaty hanya tersedia untuk n <= {len(RI_SAATY) - 1}, diberikan n={n}')
+    return RI_SAATY[n]
+
+
+def _validasi(matriks):
+    matriks = np.asarray(matriks, dtype=float)
+    if matriks.ndim not in (2, 3) or matriks.shape[-1] != matriks.shape[-2]:
+        raise ValueError(f'Matriks perbandingan harus berbentuk (n, n) atau (B, n, n), diberikan {matriks.shape}')
+    if not np.all(matriks > 0):
+        raise ValueError('Semua elemen matriks perbandingan harus bernilai positif')
+    return matriks
+
+
+def hitung_ahp_batch(matriks):
+    """Menghitung bobot, lambda max, CI dan CR untuk tumpukan matriks (B, n, n).
+
+    Bobot diambil dari eigenvector utama (Perron) tiap matriks dan dinormalisasi
+    sehingga berjumlah 1. Mengembalikan HasilAHP dengan ``bobot`` berbentuk
+    (B, n) dan ``lambda_max``, ``ci``, ``cr`` berbentuk (B,).
+    """
+    matriks = _validasi(matriks)
+    if matriks.ndim == 2:
+        matriks = matriks[np.newaxis]
+    n = matriks.shape[-1]
+
+    eigval, eigvec = np.linalg.eig(matriks)
+    idx = np.argmax(eigval.real, axis=-1)
+    lambda_max = np.take_along_axis(eigval.real, idx[:, np.newaxis], axis=-1)[:, 0]
+    vektor = np.abs(np.take_along_axis(eigvec.real, idx[:, np.newaxis, np.newaxis], axis=-1)[:, :, 0])
+    bobot = vektor / vektor.sum(axis=-1, keepdims=True)
+
+    if n <= 1:
+        ci = np.zeros_like(lambda_max)
+    else:
+        ci = (lambda_max - n) / (n - 1)
+    ri = random_index(n)
+    cr = ci / ri if ri > 0 else np.zeros_like(ci)
+    return HasilAHP(bobot, lambda_max, ci, cr)
+
+
+def hitung_ahp(matriks):
+    """Menghitung bobot, lambda max, CI dan CR untuk satu matriks (n, n)"""
+    matriks = _validasi(matriks)
+    if matriks.ndim == 3:
+        return hitung_ahp_batch(matriks)
+    hasil = hitung_ahp_batch(matriks[np.newaxis])
+    return HasilAHP(hasil.bobot[0], float(hasil.lambda_max[0]), float(hasil.ci[0]), float(hasil.cr[0]))
+
+
+def is_konsisten(cr, batas=BATAS_CR):
+    """True jika CR di bawah batas konsistensi (berlaku juga untuk array CR)"""
+    return np.asarray(cr) < batas
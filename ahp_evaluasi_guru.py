@@ -1,9 +1,10 @@
-import pandas as pd
-import numpy as np
 from openpyxl import Workbook
 from openpyxl.styles import Font, Fill, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-import math
+
+from ahp_engine import KODE_KRITERIA, MATRIKS_KRITERIA, NAMA_KRITERIA, hitung_ahp, ke_matriks, is_konsisten
+from ahp_profil import span
+from ahp_ranking import rekomendasi
+from ahp_skor import hitung_skor
 
 # Membuat workbook baru
 wb = Workbook()
@@ -34,14 +35,23 @@ for row in range(1, 4):
     cell.font = Font(bold=True, size=14)
     cell.alignment = Alignment(horizontal='center')
 
+# Data matriks perbandingan (contoh)
+matrix_data = [[kode] + list(baris) for kode, baris in zip(KODE_KRITERIA, MATRIKS_KRITERIA)]
+
+# Bobot kriteria dihitung dari eigenvector matriks perbandingan
+with span('bobot'):
+    hasil_ahp = hitung_ahp(ke_matriks(matrix_data))
+
 # Data Kriteria Evaluasi
 kriteria_data = [
-    ['K1', 'Kedisiplinan', 'Ketepatan waktu masuk, absensi, kepatuhan aturan', 0.25],
-    ['K2', 'Penguasaan Materi', 'Kemampuan menguasai mata pelajaran yang diampu', 0.30],
-    ['K3', 'Metode Mengajar', 'Variasi metode, penggunaan media, interaksi siswa', 0.20],
-    ['K4', 'Komunikasi', 'Kemampuan berkomunikasi dengan siswa dan rekan', 0.15],
-    ['K5', 'Evaluasi Pembelajaran', 'Sistem penilaian, feedback, remedial', 0.10]
+    ['K1', 'Kedisiplinan', 'Ketepatan waktu masuk, absensi, kepatuhan aturan'],
+    ['K2', 'Penguasaan Materi', 'Kemampuan menguasai mata pelajaran yang diampu'],
+    ['K3', 'Metode Mengajar', 'Variasi metode, penggunaan media, interaksi siswa'],
+    ['K4', 'Komunikasi', 'Kemampuan berkomunikasi dengan siswa dan rekan'],
+    ['K5', 'Evaluasi Pembelajaran', 'Sistem penilaian, feedback, remedial']
 ]
+for row_data, bobot in zip(kriteria_data, hasil_ahp.bobot):
+    row_data.append(round(float(bobot), 4))
 
 # Header tabel kriteria
 headers_kriteria = ['Kode', 'Kriteria', 'Deskripsi', 'Bobot AHP']
@@ -91,15 +101,6 @@ for col, code in enumerate(kriteria_codes, 1):
     cell.alignment = Alignment(horizontal='center', vertical='center')
     cell.border = border
 
-# Data matriks perbandingan (contoh)
-matrix_data = [
-    ['K1', 1, 0.5, 2, 3, 4],
-    ['K2', 2, 1, 3, 4, 5],
-    ['K3', 0.5, 0.33, 1, 2, 3],
-    ['K4', 0.33, 0.25, 0.5, 1, 2],
-    ['K5', 0.25, 0.2, 0.33, 0.5, 1]
-]
-
 for i, row_data in enumerate(matrix_data, row_start_matrix + 1):
     for j, value in enumerate(row_data, 1):
         cell = ws2.cell(row=i, column=j, value=value)
@@ -125,15 +126,20 @@ for row in range(1, 3):
     cell.font = Font(bold=True, size=12)
     cell.alignment = Alignment(horizontal='center')
 
-# Data guru contoh - GUNAKAN INI (nilai manual dengan format yang benar)
+# Data guru contoh: nilai per kriteria K1-K5, Nilai AHP dihitung dari bobot
 guru_data = [
-    [1, 'Ahmad Fauzi, S.Pd', 'Matematika', 85, 90, 80, 75, 85, 84.25],
-    [2, 'Siti Nurhaliza, S.Pd', 'Bahasa Indonesia', 90, 85, 85, 80, 90, 86.0],
-    [3, 'Budi Santoso, S.Pd', 'IPA', 80, 95, 90, 85, 80, 87.0],
-    [4, 'Rina Wati, S.Pd', 'Bahasa Inggris', 95, 80, 75, 90, 85, 84.25],
-    [5, 'Dedi Kurnia, S.Pd', 'IPS', 75, 85, 95, 80, 90, 83.25]
+    [1, 'Ahmad Fauzi, S.Pd', 'Matematika', 85, 90, 80, 75, 85],
+    [2, 'Siti Nurhaliza, S.Pd', 'Bahasa Indonesia', 90, 85, 85, 80, 90],
+    [3, 'Budi Santoso, S.Pd', 'IPA', 80, 95, 90, 85, 80],
+    [4, 'Rina Wati, S.Pd', 'Bahasa Inggris', 95, 80, 75, 90, 85],
+    [5, 'Dedi Kurnia, S.Pd', 'IPS', 75, 85, 95, 80, 90]
 ]
 
+# Nilai AHP, ranking dan kategori seluruh guru dalam satu perkalian matriks
+hasil_skor = hitung_skor([row[3:8] for row in guru_data], hasil_ahp.bobot)
+for row_data, nilai in zip(guru_data, hasil_skor.nilai):
+    row_data.append(round(float(nilai), 2))
+
 # Header tabel evaluasi
 headers_evaluasi = ['No', 'Nama Guru', 'Mata Pelajaran', 'Kedisiplinan', 'Penguasaan Materi', 'Metode Mengajar', 'Komunikasi', 'Evaluasi Pembelajaran', 'Nilai AHP']
 row_start_eval = 4
@@ -186,14 +192,17 @@ for col, header in enumerate(headers_ranking, 1):
     cell.alignment = Alignment(horizontal='center', vertical='center')
     cell.border = border
 
-# Data ranking - sesuaikan dengan nilai yang benar
-ranking_data = [
-    [1, 'Budi Santoso, S.Pd', 87.0, 'Sangat Baik', 'Pertahankan kinerja, jadikan mentor'],
-    [2, 'Siti Nurhaliza, S.Pd', 86.0, 'Baik', 'Variasikan metode mengajar'],
-    [3, 'Ahmad Fauzi, S.Pd', 84.25, 'Baik', 'Perbaiki komunikasi dengan siswa'],
-    [4, 'Rina Wati, S.Pd', 84.25, 'Baik', 'Tingkatkan penguasaan materi'],
-    [5, 'Dedi Kurnia, S.Pd', 83.25, 'Cukup', 'Tingkatkan kedisiplinan dan evaluasi']
-]
+# Rekomendasi per guru dari kriteria terlemah (berbobot) masing-masing
+rekomendasi_guru = rekomendasi([row[3:8] for row in guru_data], NAMA_KRITERIA, hasil_ahp.bobot)
+
+# Data ranking diurutkan berdasarkan hasil perhitungan; guru bernilai seri berbagi peringkat
+ranking_data = sorted(
+    [
+        [int(peringkat), row_data[1], row_data[8], str(kat), saran]
+        for row_data, peringkat, kat, saran in zip(guru_data, hasil_skor.ranking, hasil_skor.kategori, rekomendasi_guru)
+    ],
+    key=lambda row: row[0],
+)
 
 # Input data ranking
 for i, row_data in enumerate(ranking_data, row_start_rank + 1):
@@ -214,12 +223,17 @@ ws1['A' + str(len(kriteria_data) + row_start + 3)] = 'Keterangan AHP:'
 ws1['A' + str(len(kriteria_data) + row_start + 4)] = 'AHP = Analytical Hierarchy Process'
 ws1['A' + str(len(kriteria_data) + row_start + 5)] = 'Metode pengambilan keputusan dengan perbandingan berpasangan'
 ws1['A' + str(len(kriteria_data) + row_start + 6)] = 'Consistency Ratio (CR) harus < 0.1 untuk validitas hasil'
+ws1['A' + str(len(kriteria_data) + row_start + 7)] = (
+    f'Lambda max = {hasil_ahp.lambda_max:.4f}, CI = {hasil_ahp.ci:.4f}, CR = {hasil_ahp.cr:.4f} '
+    f'({"konsisten" if is_konsisten(hasil_ahp.cr) else "TIDAK konsisten"})'
+)
 
 # Style keterangan
-for row in range(len(kriteria_data) + row_start + 3, len(kriteria_data) + row_start + 7):
+for row in range(len(kriteria_data) + row_start + 3, len(kriteria_data) + row_start + 8):
     ws1[f'A{row}'].font = Font(italic=True)
 
 # Save file
-wb.save('/Users/flashcode/Documents/project-destra/AHP_Evaluasi_Guru_SMP_PENIDA_KATAPANG_NEW.xlsx')
+with span('xlsx', baris=len(guru_data)):
+    wb.save('/Users/flashcode/Documents/project-destra/AHP_Evaluasi_Guru_SMP_PENIDA_KATAPANG_NEW.xlsx')
 print('File Excel AHP Evaluasi Guru berhasil dibuat!')
 print('File tersimpan di: /Users/flashcode/Documents/project-destra/AHP_Evaluasi_Guru_SMP_PENIDA_KATAPANG_NEW.xlsx')
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""Ekspor laporan AHP ke Excel dalam mode streaming (openpyxl write_only).
+
+Sheet "Hasil Evaluasi" dan "Ranking" ditulis baris per baris dari generator
+memakai WriteOnlyCell dan named style bersama, sehingga pemakaian memori
+tetap datar berapapun jumlah guru yang diekspor.
+"""
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+from ahp_profil import span
+from ahp_skor import hitung_nilai, kategori, ranking
+
+HEADERS_KRITERIA = ['Kode', 'Kriteria', 'Deskripsi', 'Bobot AHP']
+HEADERS_EVALUASI = ['No', 'Nama Guru', 'Mata Pelajaran', 'Kedisiplinan', 'Penguasaan Materi', 'Metode Mengajar', 'Komunikasi', 'Evaluasi Pembelajaran', 'Nilai AHP']
+HEADERS_RANKING = ['Ranking', 'Nama Guru', 'Nilai AHP', 'Kategori', 'Rekomendasi']
+
+LEBAR_KOLOM_KRITERIA = [8, 20, 50, 12]
+LEBAR_KOLOM_EVALUASI = [5, 20, 15, 12, 15, 12, 12, 18, 12]
+LEBAR_KOLOM_RANKING = [10, 20, 12, 15, 40]
+
+# Style kolom per sheet, diterapkan ke setiap baris data
+STYLE_KRITERIA = ['isi_tengah', 'isi_tengah', 'isi_kiri', 'angka_tengah']
+STYLE_EVALUASI = ['isi_tengah'] * 3 + ['angka_kanan'] * 6
+STYLE_RANKING = ['isi_tengah', 'isi_tengah', 'angka_tengah', 'isi_tengah', 'isi_kiri']
+
+
+def buat_named_styles():
+    """Membuat named style bersama untuk seluruh sel laporan"""
+    border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+    tengah = Alignment(horizontal='center', vertical='center')
+
+    judul = NamedStyle(name='judul', font=Font(bold=True, size=14), alignment=Alignment(horizontal='center'))
+    header = NamedStyle(
+        name='header',
+        font=Font(bold=True, color='FFFFFF'),
+        fill=PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
+        alignment=tengah,
+        border=border,
+    )
+    isi_tengah = NamedStyle(name='isi_tengah', alignment=tengah, border=border)
+    isi_kiri = NamedStyle(name='isi_kiri', alignment=Alignment(horizontal='left', vertical='center'), border=border)
+    angka_tengah = NamedStyle(name='angka_tengah', alignment=tengah, border=border, number_format='0.00')
+    angka_kanan = NamedStyle(
+        name='angka_kanan',
+        alignment=Alignment(horizontal='right', vertical='center'),
+        border=border,
+        number_format='0.00',
+    )
+    return [judul, header, isi_tengah, isi_kiri, angka_tengah, angka_kanan]
+
+
+def _sel(ws, value, style):
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def _tulis_sheet(wb, title, judul, headers, lebar_kolom, styles, rows):
+    """Menulis satu sheet write_only: judul, header lalu baris data dari iterable"""
+    ws = wb.create_sheet(title=title)
+    for i, lebar in enumerate(lebar_kolom, 1):
+        ws.column_dimensions[chr(64 + i)].width = lebar
+
+    kolom_akhir = chr(64 + len(headers))
+    for i, teks in enumerate(judul, 1):
+        ws.append([_sel(ws, teks, 'judul')])
+        ws.merged_cells.add(f'A{i}:{kolom_akhir}{i}')
+    ws.append([])
+    ws.append([_sel(ws, header, 'header') for header in headers])
+
+    jumlah = 0
+    for row_data in rows:
+        ws.append([_sel(ws, value, style) for value, style in zip(row_data, styles)])
+        jumlah += 1
+    return jumlah
+
+
+def iter_baris_hasil(guru_iter, bobot, ukuran_chunk=10000):
+    """Menghasilkan baris sheet Hasil Evaluasi dari iterable (nama, mapel, skor_kriteria).
+
+    Nilai AHP dihitung per chunk dengan satu perkalian matriks, sehingga data
+    guru tidak perlu dimuat seluruhnya ke memori.
+    """
+    nomor = 1
+    chunk = []
+    for item in guru_iter:
+        chunk.append(item)
+        if len(chunk) >= ukuran_chunk:
+            yield from _baris_chunk(chunk, bobot, nomor)
+            nomor += len(chunk)
+            chunk = []
+    if chunk:
+        yield from _baris_chunk(chunk, bobot, nomor)
+
+
+def _baris_chunk(chunk, bobot, nomor_awal):
+    nilai = hitung_nilai([skor for _, _, skor in chunk], bobot)
+    for i, ((nama, mapel, skor), n) in enumerate(zip(chunk, nilai)):
+        yield [nomor_awal + i, nama, mapel, *[float(s) for s in skor], round(float(n), 2)]
+
+
+def iter_baris_ranking(nama, nilai, rekomendasi=None):
+    """Menghasilkan baris sheet Ranking terurut dari nilai tertinggi; guru bernilai seri berbagi peringkat"""
+    nilai = np.asarray(nilai, dtype=float)
+    peringkat = ranking(nilai)
+    urutan = np.argsort(peringkat, kind='stable')
+    kategori_guru = kategori(nilai)
+    for idx in urutan:
+        saran = rekomendasi[idx] if rekomendasi is not None else ''
+        yield [int(peringkat[idx]), nama[idx], round(float(nilai[idx]), 2), str(kategori_guru[idx]), saran]
+
+
+def daftar_sheet(baris_hasil, baris_ranking, kriteria_data=None, matrix_data=None):
+    """Definisi sheet laporan: list (title, judul, headers, lebar_kolom, styles, rows)"""
+    sheets = []
+    if kriteria_data is not None:
+        sheets.append((
+            'Kriteria AHP', ['SIMULASI PERHITUNGAN AHP', 'SISTEM EVALUASI GURU SMP PENIDA KATAPANG', 'ANALISIS KRITERIA EVALUASI'],
+            HEADERS_KRITERIA, LEBAR_KOLOM_KRITERIA, STYLE_KRITERIA, kriteria_data,
+        ))
+    if matrix_data is not None:
+        kode = [row[0] for row in matrix_data]
+        sheets.append((
+            'Matriks Perbandingan', ['MATRIKS PERBANDINGAN BERPASANGAN KRITERIA'],
+            [''] + kode, [], ['isi_tengah'] + ['angka_tengah'] * len(kode), matrix_data,
+        ))
+    sheets.append((
+        'Hasil Evaluasi', ['HASIL EVALUASI GURU', 'BERDASARKAN METODE AHP'],
+        HEADERS_EVALUASI, LEBAR_KOLOM_EVALUASI, STYLE_EVALUASI, baris_hasil,
+    ))
+    sheets.append((
+        'Ranking', ['RANKING GURU BERDASARKAN AHP', 'DAN REKOMENDASI PERBAIKAN'],
+        HEADERS_RANKING, LEBAR_KOLOM_RANKING, STYLE_RANKING, baris_ranking,
+    ))
+    return sheets
+
+
+def tulis_laporan_streaming(path, baris_hasil, baris_ranking, kriteria_data=None, matrix_data=None, backend='openpyxl'):
+    """Menyimpan laporan AHP ke ``path`` dengan workbook write_only.
+
+    ``baris_hasil`` dan ``baris_ranking`` boleh berupa generator (lihat
+    ``iter_baris_hasil`` dan ``iter_baris_ranking``). ``backend='xml'``
+    memakai penulis XML langsung di ``ahp_xlsx_xml`` yang beberapa kali lebih
+    cepat. Mengembalikan jumlah baris yang ditulis ke sheet Hasil Evaluasi
+    dan Ranking.
+    """
+    if backend not in ('openpyxl', 'xml'):
+        raise ValueError("backend harus 'openpyxl' atau 'xml'")
+    sheets = daftar_sheet(baris_hasil, baris_ranking, kriteria_data, matrix_data)
+    with span('xlsx', backend=backend) as s:
+        if backend == 'xml':
+            from ahp_xlsx_xml import tulis_workbook
+
+            jumlah = tulis_workbook(path, sheets)
+        else:
+            wb = Workbook(write_only=True)
+            for style in buat_named_styles():
+                wb.add_named_style(style)
+            jumlah = [_tulis_sheet(wb, *sheet) for sheet in sheets]
+            wb.save(path)
+        s.baris = sum(jumlah)
+    return jumlah[-2], jumlah[-1]
+
+
+HEADERS_RINGKASAN = ['Kriteria', 'Bobot AHP', 'Nilai', 'Nilai x Bobot']
+LEBAR_KOLOM_RINGKASAN = [25, 12, 12, 15]
+STYLE_RINGKASAN = ['isi_kiri', 'angka_tengah', 'angka_kanan', 'angka_kanan']
+
+
+def tulis_ringkasan_guru(path, nama, mapel, nama_kriteria, bobot, skor):
+    """Menyimpan ringkasan nilai AHP satu guru (kontribusi tiap kriteria dan total)"""
+    bobot = np.asarray(bobot, dtype=float)
+    bobot = bobot / bobot.sum()
+    skor = np.asarray(skor, dtype=float)
+    kontribusi = bobot * skor
+
+    rows = [[k, float(b), float(s), float(c)] for k, b, s, c in zip(nama_kriteria, bobot, skor, kontribusi)]
+    rows.append(['TOTAL NILAI AHP', float(bobot.sum()), None, round(float(kontribusi.sum()), 2)])
+
+    wb = Workbook(write_only=True)
+    for style in buat_named_styles():
+        wb.add_named_style(style)
+    _tulis_sheet(
+        wb, 'Ringkasan', ['RINGKASAN EVALUASI GURU', f'{nama} - {mapel}'],
+        HEADERS_RINGKASAN, LEBAR_KOLOM_RINGKASAN, STYLE_RINGKASAN, rows,
+    )
+    wb.save(path)
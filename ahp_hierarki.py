@@ -0,0 +1,224 @@
+"""Hierarki AHP bertingkat: kriteria -> sub kriteria -> ... -> indikator.
+
+Setiap node internal memiliki bobot lokal untuk anak-anaknya, baik dari
+matriks perbandingan berpasangan (eigenvector) maupun langsung dari bobot
+relatif seperti kolom ``tm_sub_kriteria.bobot``. Bobot global setiap daun
+adalah hasil kali bobot lokal sepanjang jalur dari akar.
+
+Daun disusun berurutan secara depth-first sehingga setiap subtree menempati
+potongan bersambung pada vektor bobot global. Bila judgment satu node
+berubah, hanya potongan subtree node tersebut yang dihitung ulang, dan
+menilai guru terhadap ratusan indikator cukup satu perkalian
+``skor (N, L) @ bobot (L,)``.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from ahp_engine import hitung_ahp_batch
+
+AKAR = 'akar'
+
+BobotLokal = namedtuple('BobotLokal', ['bobot', 'cr'])
+
+
+class HierarkiAHP:
+    """Pohon AHP dengan cache bobot lokal dan vektor bobot global daun"""
+
+    def __init__(self, nama_akar='Tujuan'):
+        self.nama = {AKAR: nama_akar}
+        self.induk = {AKAR: None}
+        self.anak = {AKAR: []}
+        self._matriks = {}
+        self._bobot_input = {}
+        self._lokal = {}
+        self._kotor = set()
+        self._daun = None
+        self._rentang = None
+        self._global = None
+        # Jumlah daun yang bobot globalnya dihitung ulang, untuk memantau invalidasi
+        self.jumlah_hitung_ulang = 0
+
+    def __len__(self):
+        return len(self.induk)
+
+    def tambah(self, kunci, induk=AKAR, nama=None):
+        """Menambahkan node di bawah ``induk``; mengembalikan ``kunci``"""
+        if kunci in self.induk:
+            raise ValueError(f'Node {kunci!r} sudah ada')
+        if induk not in self.induk:
+            raise ValueError(f'Induk {induk!r} tidak ditemukan')
+        self.nama[kunci] = kunci if nama is None else nama
+        self.induk[kunci] = induk
+        self.anak[kunci] = []
+        self.anak[induk].append(kunci)
+        # Jumlah anak induk berubah, sehingga judgment lamanya tidak berlaku lagi
+        self._matriks.pop(induk, None)
+        self._bobot_input.pop(induk, None)
+        self._tandai(induk)
+        self._daun = None
+        return kunci
+
+    def atur_matriks(self, kunci, matriks):
+        """Mengatur matriks perbandingan (n_anak, n_anak) untuk anak-anak node ``kunci``"""
+        matriks = np.asarray(matriks, dtype=float)
+        n = len(self.anak[kunci])
+        if matriks.shape != (n, n):
+            raise ValueError(f'Node {kunci!r} memiliki {n} anak, matriks berbentuk {matriks.shape}')
+        self._matriks[kunci] = matriks
+        self._bobot_input.pop(kunci, None)
+        self._tandai(kunci)
+
+    def atur_bobot(self, kunci, bobot):
+        """Mengatur bobot lokal anak-anak node ``kunci`` secara langsung (akan dinormalisasi)"""
+        bobot = np.asarray(bobot, dtype=float)
+        if bobot.shape != (len(self.anak[kunci]),):
+            raise ValueError(f'Node {kunci!r} memiliki {len(self.anak[kunci])} anak, bobot berukuran {bobot.shape}')
+        if bobot.sum() <= 0:
+            raise ValueError('Jumlah bobot harus positif')
+        self._bobot_input[kunci] = bobot / bobot.sum()
+        self._matriks.pop(kunci, None)
+        self._tandai(kunci)
+
+    def _tandai(self, kunci):
+        self._kotor.add(kunci)
+        self._lokal.pop(kunci, None)
+
+    def _hitung_lokal(self, kunci_list):
+        # Node bermatriks dengan ordo sama dihitung bersamaan sebagai satu tumpukan
+        per_ordo = {}
+        for kunci in kunci_list:
+            if kunci in self._matriks:
+                per_ordo.setdefault(len(self.anak[kunci]), []).append(kunci)
+            elif kunci in self._bobot_input:
+                self._lokal[kunci] = BobotLokal(self._bobot_input[kunci], None)
+            elif self.anak[kunci]:
+                # Tanpa judgment, anak-anak dianggap sama penting
+                n = len(self.anak[kunci])
+                self._lokal[kunci] = BobotLokal(np.full(n, 1.0 / n), None)
+        for kunci_ordo in per_ordo.values():
+            hasil = hitung_ahp_batch(np.stack([self._matriks[k] for k in kunci_ordo]))
+            for i, kunci in enumerate(kunci_ordo):
+                self._lokal[kunci] = BobotLokal(hasil.bobot[i], float(hasil.cr[i]))
+
+    def bobot_lokal(self, kunci):
+        """BobotLokal (bobot anak, CR atau None) untuk node ``kunci``"""
+        if kunci not in self._lokal:
+            self._hitung_lokal([kunci])
+        return self._lokal[kunci]
+
+    def _susun_daun(self):
+        # Urutan daun depth-first dan rentang [mulai, selesai) daun untuk setiap node
+        daun = []
+        rentang = {}
+        tumpukan = [(AKAR, False)]
+        mulai = {}
+        while tumpukan:
+            kunci, selesai = tumpukan.pop()
+            if selesai:
+                rentang[kunci] = (mulai[kunci], len(daun))
+                continue
+            mulai[kunci] = len(daun)
+            if not self.anak[kunci]:
+                daun.append(kunci)
+                rentang[kunci] = (mulai[kunci], len(daun))
+                continue
+            tumpukan.append((kunci, True))
+            tumpukan.extend((anak, False) for anak in reversed(self.anak[kunci]))
+        self._daun = daun
+        self._rentang = rentang
+        self._global = np.ones(len(daun))
+        self._kotor = {AKAR}
+
+    def _perbarui_subtree(self, kunci, faktor):
+        # Bobot global daun di bawah ``kunci`` = faktor x hasil kali bobot lokal di bawahnya
+        mulai, selesai = self._rentang[kunci]
+        self._global[mulai:selesai] = faktor
+        tumpukan = [kunci]
+        internal = []
+        while tumpukan:
+            node = tumpukan.pop()
+            if self.anak[node]:
+                internal.append(node)
+                tumpukan.extend(self.anak[node])
+        self._hitung_lokal([node for node in internal if node not in self._lokal])
+        for node in internal:
+            for anak, bobot in zip(self.anak[node], self._lokal[node].bobot):
+                a, b = self._rentang[anak]
+                self._global[a:b] *= bobot
+        self.jumlah_hitung_ulang += selesai - mulai
+
+    def _faktor(self, kunci):
+        # Bobot global node = hasil kali bobot lokal dari akar sampai node ini
+        faktor = 1.0
+        while self.induk[kunci] is not None:
+            induk = self.induk[kunci]
+            faktor *= self.bobot_lokal(induk).bobot[self.anak[induk].index(kunci)]
+            kunci = induk
+        return faktor
+
+    def _segarkan(self):
+        if self._daun is None:
+            self._susun_daun()
+        if not self._kotor:
+            return
+        kotor = self._kotor
+        self._kotor = set()
+        # Subtree yang berada di dalam subtree kotor lain cukup dihitung sekali dari leluhurnya
+        for kunci in kotor:
+            leluhur = self.induk[kunci]
+            while leluhur is not None and leluhur not in kotor:
+                leluhur = self.induk[leluhur]
+            if leluhur is None:
+                self._perbarui_subtree(kunci, self._faktor(kunci))
+
+    def daun(self):
+        """Kunci daun (indikator) sesuai urutan kolom vektor bobot global"""
+        self._segarkan()
+        return list(self._daun)
+
+    def bobot_global(self):
+        """Vektor bobot global daun (L,) yang berjumlah 1"""
+        self._segarkan()
+        return self._global.copy()
+
+    def rentang(self, kunci):
+        """Potongan [mulai, selesai) kolom daun milik subtree ``kunci``"""
+        self._segarkan()
+        return self._rentang[kunci]
+
+    def skor(self, skor_daun):
+        """Nilai (N,) dari skor per daun (N, L) dalam satu perkalian matriks"""
+        self._segarkan()
+        skor_daun = np.asarray(skor_daun, dtype=float)
+        if skor_daun.shape[-1] != len(self._daun):
+            raise ValueError(f'Jumlah kolom skor ({skor_daun.shape[-1]}) tidak sama dengan jumlah daun ({len(self._daun)})')
+        return skor_daun @ self._global
+
+    def konsistensi(self):
+        """{kunci: CR} untuk setiap node yang bobotnya berasal dari matriks perbandingan"""
+        self._segarkan()
+        return {kunci: self.bobot_lokal(kunci).cr for kunci in self._matriks}
+
+    @classmethod
+    def dari_database(cls, conn, aktif=True):
+        """Hierarki dua tingkat dari tm_kriteria dan tm_sub_kriteria.
+
+        Kunci node adalah ('kriteria', id) dan ('sub', id); bobot sub kriteria
+        relatif terhadap kriteria induknya seperti di HasilEvaluasiController.
+        """
+        from ahp_db import muat_kriteria, muat_sub_kriteria
+
+        ids, nama, bobot = muat_kriteria(conn, aktif)
+        sub = muat_sub_kriteria(conn, aktif)
+        hierarki = cls()
+        for kriteria_id, nama_kriteria in zip(ids, nama):
+            kunci = hierarki.tambah(('kriteria', int(kriteria_id)), nama=nama_kriteria)
+            for sub_id, nama_sub, _ in sub.get(int(kriteria_id), []):
+                hierarki.tambah(('sub', sub_id), kunci, nama_sub)
+        hierarki.atur_bobot(AKAR, bobot)
+        for kriteria_id in ids:
+            daftar = sub.get(int(kriteria_id), [])
+            if daftar and sum(b for _, _, b in daftar) > 0:
+                hierarki.atur_bobot(('kriteria', int(kriteria_id)), [b for _, _, b in daftar])
+        return hierarki
@@ -0,0 +1,441 @@
+"""Perhitungan ulang tt_hasil_evaluasi secara inkremental.
+
+Jumlah berjalan per (guru, periode, kriteria, role) disimpan di database
+state terpisah (SQLite). Setiap run hanya mencari pasangan (guru, periode)
+yang baris tt_detail_evaluasi / tt_evaluasi-nya berubah sejak watermark
+``updated_at`` terakhir, mengagregasi ulang pasangan tersebut saja, lalu
+menulis baris tt_hasil_evaluasi yang terdampak.
+
+Baris yang dihapus tidak meninggalkan ``updated_at``, sehingga state juga
+menyimpan jumlah baris detail per pasangan. Jumlah itu dibandingkan dengan
+satu query COUNT ... GROUP BY setiap run; pasangan yang jumlahnya berbeda
+ikut dihitung ulang, dan pasangan yang seluruh detailnya terhapus dihapus
+dari tt_hasil_evaluasi. Dengan ``--lewati-cek-hapus`` pemeriksaan ini
+dilewati, dan penghapusan baru terlihat setelah run ``--penuh``.
+
+Nilai juga bergantung pada tm_kriteria.bobot, tm_sub_kriteria.bobot dan role
+evaluator di model_has_roles (yang tidak punya ``updated_at``). Nilai
+terakhir ketiganya disimpan di tabel ``referensi`` state dan dibandingkan
+setiap run; pasangan yang memakai kriteria, sub kriteria atau evaluator yang
+berubah ikut dihitung ulang.
+
+Rumus nilai mengikuti HasilEvaluasiController::generateHasilForGuruAndPeriode:
+rata-rata tertimbang bobot kriteria (x bobot sub kriteria) per role, lalu
+nilai akhir siswa 30% / rekan 30% / pengawas 40% yang dinormalisasi ulang
+bila ada role tanpa nilai.
+
+Contoh:
+    python ahp_inkremental.py --state storage/app/ahp_inkremental.sqlite
+"""
+import argparse
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+
+from ahp_db import BOBOT_ROLE as BOBOT_ROLE_DEFAULT, KOLOM_ROLE, MODEL_USER, iter_query, koneksi_dari_env, placeholder
+from ahp_profil import profil, span
+
+BOBOT_ROLE = np.array([BOBOT_ROLE_DEFAULT[role] for role in KOLOM_ROLE], dtype=float)
+
+SKEMA_STATE = """
+CREATE TABLE IF NOT EXISTS agregat (
+    guru_id INTEGER NOT NULL,
+    periode_id INTEGER NOT NULL,
+    kriteria_id INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    sum_nilai_bobot REAL NOT NULL,
+    sum_bobot REAL NOT NULL,
+    jumlah INTEGER NOT NULL,
+    PRIMARY KEY (guru_id, periode_id, kriteria_id, role)
+);
+CREATE TABLE IF NOT EXISTS jumlah_detail (
+    guru_id INTEGER NOT NULL,
+    periode_id INTEGER NOT NULL,
+    jumlah INTEGER NOT NULL,
+    PRIMARY KEY (guru_id, periode_id)
+);
+CREATE TABLE IF NOT EXISTS watermark (
+    nama TEXT PRIMARY KEY,
+    nilai TEXT
+);
+CREATE TABLE IF NOT EXISTS referensi (
+    tabel TEXT NOT NULL,
+    kunci INTEGER NOT NULL,
+    nilai TEXT NOT NULL,
+    PRIMARY KEY (tabel, kunci)
+);
+"""
+
+# Data referensi yang memengaruhi nilai: tabel -> (query {kunci: nilai}, kolom detail yang memakainya)
+REFERENSI = {
+    'tm_kriteria': ('SELECT id, bobot FROM tm_kriteria', 'de.kriteria_id'),
+    'tm_sub_kriteria': ('SELECT id, bobot FROM tm_sub_kriteria', 'de.sub_kriteria_id'),
+    'model_has_roles': (
+        'SELECT mr.model_id, r.name FROM model_has_roles mr JOIN roles r ON mr.role_id = r.id WHERE mr.model_type = {ph}',
+        'e.evaluator_id',
+    ),
+}
+
+# Role spatie/permission dipetakan ke kolom tt_hasil_evaluasi langsung di SQL
+_CASE_ROLE = (
+    "CASE r.name WHEN 'siswa' THEN 'siswa' WHEN 'guru' THEN 'rekan' "
+    "WHEN 'kepala_sekolah' THEN 'pengawas' WHEN 'kepsek' THEN 'pengawas' END"
+)
+_FAKTOR_SUB = 'CASE WHEN de.sub_kriteria_id IS NOT NULL THEN sk.bobot / 100.0 ELSE 1 END'
+
+UKURAN_BATCH_GURU = 500
+
+
+def buka_state(path):
+    """Membuka (dan membuat bila perlu) database state inkremental"""
+    state = sqlite3.connect(path)
+    state.executescript(SKEMA_STATE)
+    return state
+
+
+def baca_watermark(state):
+    row = state.execute("SELECT nilai FROM watermark WHERE nama = 'detail_updated_at'").fetchone()
+    return row[0] if row else None
+
+
+def simpan_watermark(state, nilai):
+    state.execute(
+        "INSERT INTO watermark (nama, nilai) VALUES ('detail_updated_at', ?) "
+        "ON CONFLICT(nama) DO UPDATE SET nilai = excluded.nilai",
+        (nilai,),
+    )
+
+
+def watermark_terbaru(conn):
+    """updated_at terbesar dari tt_detail_evaluasi dan tt_evaluasi"""
+    nilai = []
+    for tabel in ('tt_detail_evaluasi', 'tt_evaluasi'):
+        for chunk in iter_query(conn, f'SELECT MAX(updated_at) FROM {tabel}'):
+            nilai.extend(str(row[0]) for row in chunk if row[0] is not None)
+    return max(nilai) if nilai else None
+
+
+def pasangan_berubah(conn, watermark, periode_id=None):
+    """Pasangan (guru_id, periode_id) yang detailnya berubah sejak watermark.
+
+    Memakai ``>=`` agar baris yang ditulis pada detik yang sama dengan
+    watermark tidak terlewat; pasangan tersebut cukup dihitung ulang lagi.
+    """
+    ph = placeholder(conn)
+    sql = (
+        'SELECT DISTINCT e.guru_id, e.periode_evaluasi_id '
+        'FROM tt_detail_evaluasi de JOIN tt_evaluasi e ON de.evaluasi_id = e.id'
+    )
+    kondisi = []
+    params = []
+    if watermark is not None:
+        kondisi.append(f'(de.updated_at >= {ph} OR e.updated_at >= {ph})')
+        params += [watermark, watermark]
+    if periode_id is not None:
+        kondisi.append(f'e.periode_evaluasi_id = {ph}')
+        params.append(periode_id)
+    if kondisi:
+        sql += ' WHERE ' + ' AND '.join(kondisi)
+    return sorted({(int(g), int(p)) for chunk in iter_query(conn, sql, params) for g, p in chunk})
+
+
+def jumlah_detail_db(conn, periode_id=None):
+    """{(guru_id, periode_id): jumlah baris tt_detail_evaluasi} dari database"""
+    sql = (
+        'SELECT e.guru_id, e.periode_evaluasi_id, COUNT(de.id) '
+        'FROM tt_detail_evaluasi de JOIN tt_evaluasi e ON de.evaluasi_id = e.id'
+    )
+    params = []
+    if periode_id is not None:
+        sql += f' WHERE e.periode_evaluasi_id = {placeholder(conn)}'
+        params.append(periode_id)
+    sql += ' GROUP BY e.guru_id, e.periode_evaluasi_id'
+    return {(int(g), int(p)): int(n) for chunk in iter_query(conn, sql, params) for g, p, n in chunk}
+
+
+def pasangan_selisih_jumlah(state, jumlah_db, periode_id=None):
+    """Pasangan yang jumlah detailnya di state berbeda dengan database (mis. karena baris dihapus)"""
+    sql = 'SELECT guru_id, periode_id, jumlah FROM jumlah_detail'
+    params = []
+    if periode_id is not None:
+        sql += ' WHERE periode_id = ?'
+        params.append(periode_id)
+    jumlah_state = {(g, p): n for g, p, n in state.execute(sql, params)}
+    return sorted(p for p in jumlah_state.keys() | jumlah_db.keys() if jumlah_state.get(p) != jumlah_db.get(p))
+
+
+def _simpan_jumlah_detail(state, pasangan, jumlah_db):
+    state.executemany('DELETE FROM jumlah_detail WHERE guru_id = ? AND periode_id = ?', pasangan)
+    state.executemany(
+        'INSERT INTO jumlah_detail (guru_id, periode_id, jumlah) VALUES (?, ?, ?)',
+        [(g, p, jumlah_db[(g, p)]) for g, p in pasangan if (g, p) in jumlah_db],
+    )
+
+
+def referensi_db(conn, tabel):
+    """{kunci: nilai} data referensi saat ini; role seorang evaluator digabung terurut"""
+    sql, _ = REFERENSI[tabel]
+    params = (MODEL_USER,) if '{ph}' in sql else ()
+    hasil = {}
+    for chunk in iter_query(conn, sql.format(ph=placeholder(conn)), params):
+        for kunci, nilai in chunk:
+            hasil.setdefault(int(kunci), []).append(str(float(nilai)) if tabel != 'model_has_roles' else str(nilai))
+    return {kunci: ','.join(sorted(nilai)) for kunci, nilai in hasil.items()}
+
+
+def kunci_referensi_berubah(state, tabel, nilai_db):
+    """Kunci yang nilainya di state berbeda dengan database (baru, berubah atau dihapus)"""
+    nilai_state = dict(state.execute('SELECT kunci, nilai FROM referensi WHERE tabel = ?', (tabel,)))
+    return sorted(k for k in nilai_state.keys() | nilai_db.keys() if nilai_state.get(k) != nilai_db.get(k))
+
+
+def simpan_referensi(state, tabel, nilai_db):
+    state.execute('DELETE FROM referensi WHERE tabel = ?', (tabel,))
+    state.executemany('INSERT INTO referensi (tabel, kunci, nilai) VALUES (?, ?, ?)', [(tabel, k, v) for k, v in nilai_db.items()])
+
+
+def pasangan_memakai(conn, kolom, kunci, periode_id=None):
+    """Pasangan (guru_id, periode_id) yang detailnya memakai salah satu ``kunci`` pada ``kolom``"""
+    ph = placeholder(conn)
+    hasil = set()
+    for i in range(0, len(kunci), UKURAN_BATCH_GURU):
+        batch = list(kunci[i:i + UKURAN_BATCH_GURU])
+        sql = (
+            'SELECT DISTINCT e.guru_id, e.periode_evaluasi_id '
+            'FROM tt_detail_evaluasi de JOIN tt_evaluasi e ON de.evaluasi_id = e.id '
+            f"WHERE {kolom} IN ({', '.join([ph] * len(batch))})"
+        )
+        if periode_id is not None:
+            sql += f' AND e.periode_evaluasi_id = {ph}'
+            batch.append(periode_id)
+        hasil.update((int(g), int(p)) for chunk in iter_query(conn, sql, batch) for g, p in chunk)
+    return hasil
+
+
+def pasangan_referensi_berubah(conn, state, periode_id=None):
+    """Pasangan yang terdampak perubahan bobot kriteria, bobot sub kriteria atau role evaluator.
+
+    Mengembalikan (pasangan, referensi) dengan ``referensi`` berisi nilai
+    database saat ini per tabel, untuk disimpan setelah run berhasil.
+    """
+    pasangan = set()
+    referensi = {}
+    for tabel, (_, kolom) in REFERENSI.items():
+        referensi[tabel] = referensi_db(conn, tabel)
+        berubah = kunci_referensi_berubah(state, tabel, referensi[tabel])
+        if berubah:
+            pasangan |= pasangan_memakai(conn, kolom, berubah, periode_id)
+    return pasangan, referensi
+
+
+def agregat_pasangan(conn, periode_id, guru_ids=None):
+    """Agregat SUM nilai x bobot sub kriteria per (guru, kriteria, role), untuk guru tertentu atau seluruh periode"""
+    ph = placeholder(conn)
+    sql = (
+        f'SELECT e.guru_id, de.kriteria_id, {_CASE_ROLE} AS role, '
+        f'SUM(de.nilai * {_FAKTOR_SUB}), SUM({_FAKTOR_SUB}), COUNT(de.nilai) '
+        'FROM tt_detail_evaluasi de '
+        'JOIN tt_evaluasi e ON de.evaluasi_id = e.id '
+        'LEFT JOIN tm_sub_kriteria sk ON de.sub_kriteria_id = sk.id '
+        'JOIN model_has_roles mr ON mr.model_id = e.evaluator_id '
+        'JOIN roles r ON mr.role_id = r.id '
+        f'WHERE e.periode_evaluasi_id = {ph} AND mr.model_type = {ph} '
+        "AND r.name IN ('siswa', 'guru', 'kepala_sekolah', 'kepsek') "
+    )
+    if guru_ids is None:
+        return [row for chunk in iter_query(conn, sql + 'GROUP BY e.guru_id, de.kriteria_id, role', [periode_id, MODEL_USER]) for row in chunk]
+    hasil = []
+    for i in range(0, len(guru_ids), UKURAN_BATCH_GURU):
+        batch = guru_ids[i:i + UKURAN_BATCH_GURU]
+        sql_batch = sql + f"AND e.guru_id IN ({', '.join([ph] * len(batch))}) GROUP BY e.guru_id, de.kriteria_id, role"
+        for chunk in iter_query(conn, sql_batch, [periode_id, MODEL_USER, *batch]):
+            hasil.extend(chunk)
+    return hasil
+
+
+def _ganti_agregat(state, pasangan, rows_per_periode):
+    state.executemany('DELETE FROM agregat WHERE guru_id = ? AND periode_id = ?', pasangan)
+    state.executemany(
+        'INSERT INTO agregat (guru_id, periode_id, kriteria_id, role, sum_nilai_bobot, sum_bobot, jumlah) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [
+            (guru_id, periode_id, kriteria_id, role, float(snb or 0), float(sb or 0), int(jumlah))
+            for periode_id, rows in rows_per_periode.items()
+            for guru_id, kriteria_id, role, snb, sb, jumlah in rows
+        ],
+    )
+
+
+def bobot_kriteria(conn):
+    """{kriteria_id: bobot} seluruh kriteria, seperti join tm_kriteria di controller"""
+    return {int(k): float(b) for chunk in iter_query(conn, 'SELECT id, bobot FROM tm_kriteria') for k, b in chunk}
+
+
+def hitung_nilai_role(state, pasangan, bobot):
+    """Menghitung nilai per role (P, 3) untuk daftar pasangan dari jumlah berjalan di state"""
+    indeks = {p: i for i, p in enumerate(pasangan)}
+    if not pasangan:
+        return np.zeros((0, len(KOLOM_ROLE)))
+
+    state.execute('CREATE TEMP TABLE IF NOT EXISTS _pasangan (guru_id INTEGER, periode_id INTEGER)')
+    state.execute('DELETE FROM _pasangan')
+    state.executemany('INSERT INTO _pasangan VALUES (?, ?)', pasangan)
+    rows = state.execute(
+        'SELECT a.guru_id, a.periode_id, a.kriteria_id, a.role, a.sum_nilai_bobot, a.sum_bobot '
+        'FROM agregat a JOIN _pasangan p ON a.guru_id = p.guru_id AND a.periode_id = p.periode_id'
+    ).fetchall()
+    posisi = [indeks[(g, p)] for g, p, *_ in rows]
+    return nilai_role_dari_agregat(len(pasangan), posisi, [row[2:6] for row in rows], bobot)
+
+
+def nilai_role_dari_agregat(n, posisi, agregat, bobot):
+    """Nilai per role (n, 3) dari baris agregat (kriteria_id, role, sum_nilai_bobot, sum_bobot).
+
+    ``posisi`` adalah indeks baris hasil (0 .. n-1) untuk setiap baris agregat
+    dan ``bobot`` berisi {kriteria_id: bobot} dalam persen seperti
+    tm_kriteria; kriteria tanpa bobot diabaikan seperti join di controller.
+    Role tanpa nilai bernilai 0.
+    """
+    num = np.zeros((n, len(KOLOM_ROLE)))
+    den = np.zeros((n, len(KOLOM_ROLE)))
+    if not agregat:
+        return num
+    idx_pasangan = np.asarray(posisi, dtype=np.int64)
+    idx_role = np.array([KOLOM_ROLE.index(row[1]) for row in agregat])
+    bobot_k = np.array([bobot.get(row[0], 0.0) / 100 for row in agregat])
+    np.add.at(num, (idx_pasangan, idx_role), bobot_k * np.array([float(row[2] or 0) for row in agregat]))
+    np.add.at(den, (idx_pasangan, idx_role), bobot_k * np.array([float(row[3] or 0) for row in agregat]))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(den > 0, num / np.where(den > 0, den, 1), 0.0)
+
+
+def hitung_nilai_akhir(nilai_role):
+    """Nilai akhir dari nilai per role (P, 3), dinormalisasi bila sebagian role kosong"""
+    ada = nilai_role > 0
+    akhir = (nilai_role * BOBOT_ROLE / 100).sum(axis=1)
+    total_bobot = (ada * BOBOT_ROLE).sum(axis=1)
+    skala = np.where((total_bobot > 0) & (total_bobot < 100), 100 / np.where(total_bobot > 0, total_bobot, 1), 1.0)
+    return akhir * skala
+
+
+def tulis_hasil(conn, pasangan, nilai_role, nilai_akhir):
+    """Update / insert baris tt_hasil_evaluasi hanya untuk pasangan yang terdampak"""
+    ph = placeholder(conn)
+    sekarang = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    cursor = conn.cursor()
+    try:
+        for (guru_id, periode_id), role, akhir in zip(pasangan, nilai_role, nilai_akhir):
+            nilai = [round(float(v), 2) for v in role] + [round(float(akhir), 2)]
+            cursor.execute(
+                f'SELECT id FROM tt_hasil_evaluasi WHERE guru_id = {ph} AND periode_evaluasi_id = {ph}',
+                (guru_id, periode_id),
+            )
+            existing = cursor.fetchone()
+            if existing:
+                cursor.execute(
+                    f'UPDATE tt_hasil_evaluasi SET nilai_siswa = {ph}, nilai_rekan = {ph}, nilai_pengawas = {ph}, '
+                    f'nilai_akhir = {ph}, updated_at = {ph} WHERE id = {ph}',
+                    (*nilai, sekarang, existing[0]),
+                )
+            else:
+                cursor.execute(
+                    'INSERT INTO tt_hasil_evaluasi (guru_id, periode_evaluasi_id, nilai_siswa, nilai_rekan, '
+                    f'nilai_pengawas, nilai_akhir, created_at, updated_at) VALUES ({", ".join([ph] * 8)})',
+                    (guru_id, periode_id, *nilai, sekarang, sekarang),
+                )
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def hapus_hasil(conn, pasangan):
+    """Menghapus baris tt_hasil_evaluasi untuk pasangan yang tidak lagi memiliki detail evaluasi"""
+    ph = placeholder(conn)
+    cursor = conn.cursor()
+    try:
+        for guru_id, periode_id in pasangan:
+            cursor.execute(f'DELETE FROM tt_hasil_evaluasi WHERE guru_id = {ph} AND periode_evaluasi_id = {ph}', (guru_id, periode_id))
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def perbarui(conn, state, periode_id=None, penuh=False, cek_hapus=True):
+    """Menjalankan satu putaran inkremental; mengembalikan pasangan (guru, periode) yang ditulis atau dihapus.
+
+    ``cek_hapus`` membandingkan jumlah detail per pasangan dengan state agar
+    baris yang dihapus ikut terdeteksi.
+    """
+    with span('muat') as s:
+        watermark = None if penuh else baca_watermark(state)
+        watermark_baru = watermark_terbaru(conn)
+        pasangan = set(pasangan_berubah(conn, watermark, periode_id))
+        referensi_berubah, referensi = pasangan_referensi_berubah(conn, state, periode_id)
+        pasangan |= referensi_berubah
+        jumlah_db = None
+        if cek_hapus or penuh:
+            jumlah_db = jumlah_detail_db(conn, periode_id)
+            pasangan.update(pasangan_selisih_jumlah(state, jumlah_db, periode_id))
+            if penuh:
+                # Termasuk pasangan lama di state yang belum tercatat di jumlah_detail
+                sql = 'SELECT DISTINCT guru_id, periode_id FROM agregat'
+                params = () if periode_id is None else (periode_id,)
+                pasangan.update(state.execute(sql + (' WHERE periode_id = ?' if periode_id is not None else ''), params))
+        pasangan = sorted(pasangan)
+        if not pasangan:
+            if periode_id is None:
+                for tabel, nilai_db in referensi.items():
+                    simpan_referensi(state, tabel, nilai_db)
+                state.commit()
+            return []
+
+        per_periode = {}
+        for guru_id, pid in pasangan:
+            per_periode.setdefault(pid, []).append(guru_id)
+        rows_per_periode = {pid: agregat_pasangan(conn, pid, guru_ids) for pid, guru_ids in per_periode.items()}
+        s.baris = sum(len(rows) for rows in rows_per_periode.values())
+
+    # Pasangan yang seluruh detailnya terhapus tidak lagi punya hasil evaluasi
+    terhapus = [p for p in pasangan if jumlah_db is not None and p not in jumlah_db]
+    ditulis = [p for p in pasangan if jumlah_db is None or p in jumlah_db]
+    with span('skor', baris=len(ditulis)):
+        _ganti_agregat(state, pasangan, rows_per_periode)
+        if jumlah_db is not None:
+            _simpan_jumlah_detail(state, pasangan, jumlah_db)
+        nilai_role = hitung_nilai_role(state, ditulis, bobot_kriteria(conn))
+        nilai_akhir = hitung_nilai_akhir(nilai_role)
+    with span('tulis', baris=len(pasangan)):
+        tulis_hasil(conn, ditulis, nilai_role, nilai_akhir)
+        hapus_hasil(conn, terhapus)
+
+    if periode_id is None:
+        # Seperti watermark, referensi hanya disimpan bila semua periode ikut diperiksa
+        if watermark_baru is not None:
+            simpan_watermark(state, watermark_baru)
+        for tabel, nilai_db in referensi.items():
+            simpan_referensi(state, tabel, nilai_db)
+    state.commit()
+    return pasangan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Hitung ulang tt_hasil_evaluasi hanya untuk guru yang evaluasinya berubah')
+    parser.add_argument('--state', default='storage/app/ahp_inkremental.sqlite', help='File SQLite penyimpan jumlah berjalan')
+    parser.add_argument('--periode', type=int, default=None, help='Batasi ke satu periode evaluasi')
+    parser.add_argument('--penuh', action='store_true', help='Abaikan watermark dan hitung ulang semua')
+    parser.add_argument(
+        '--lewati-cek-hapus', action='store_true',
+        help='Lewati query COUNT pendeteksi baris terhapus (penghapusan baru terlihat setelah --penuh)',
+    )
+    args = parser.parse_args(argv)
+
+    conn = koneksi_dari_env()
+    state = buka_state(args.state)
+    with profil('inkremental'):
+        pasangan = perbarui(conn, state, periode_id=args.periode, penuh=args.penuh, cek_hapus=not args.lewati_cek_hapus)
+    print(f'{len(pasangan)} hasil evaluasi diperbarui')
+
+
+if __name__ == '__main__':
+    main()
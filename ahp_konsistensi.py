@@ -0,0 +1,114 @@
+"""Perbaikan otomatis matriks perbandingan yang tidak konsisten (CR >= 0.1).
+
+Pada setiap iterasi, untuk setiap matriks yang masih gagal dicari judgment
+dengan deviasi terbesar terhadap rasio bobot w_i / w_j, yaitu
+max |log(a_ij * w_j / w_i)|. Hanya judgment itu (dan resiproknya) yang diganti
+dengan rasio konsisten yang dibatasi ke 1/9 .. 9 dan dibulatkan ke skala
+Saaty. Judgment yang pembulatannya tidak mengubah apa pun, atau yang baru saja
+diubah, dilewati dan diganti judgment terburuk berikutnya. Semua
+matriks gagal dalam satu periode diproses bersamaan sebagai tumpukan
+(B, n, n), tanpa loop Python per matriks.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from ahp_engine import BATAS_CR, HasilAHP, hitung_ahp_batch
+
+# Skala Saaty 1/9 .. 9
+SKALA_SAATY = np.array([1 / 9, 1 / 8, 1 / 7, 1 / 6, 1 / 5, 1 / 4, 1 / 3, 1 / 2, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+HasilPerbaikan = namedtuple('HasilPerbaikan', ['matriks', 'hasil', 'iterasi', 'berubah', 'berhasil'])
+
+
+def bulatkan_saaty(nilai):
+    """Membulatkan nilai ke skala Saaty terdekat (jarak logaritmik)"""
+    nilai = np.asarray(nilai, dtype=float)
+    jarak = np.abs(np.log(SKALA_SAATY) - np.log(nilai)[..., np.newaxis])
+    return SKALA_SAATY[np.argmin(jarak, axis=-1)]
+
+
+def judgment_terburuk(matriks, bobot, skala_saaty=True, tabu=None):
+    """Judgment segitiga atas dengan deviasi terbesar yang masih bisa diubah, per matriks.
+
+    Target setiap judgment adalah rasio konsisten w_i / w_j yang dibatasi ke
+    rentang skala 1/9 .. 9 (dan dibulatkan ke skala Saaty bila
+    ``skala_saaty``). Judgment yang targetnya sama dengan nilai sekarang atau
+    yang ditandai ``tabu`` (B, n_pasangan) dilewati, sehingga dipilih judgment
+    terburuk berikutnya. Mengembalikan (i, j, target, ada, posisi), masing-masing
+    berukuran (B,): indeks baris dan kolom judgment, nilai targetnya, ``ada``
+    False bila tidak ada judgment yang bisa diubah, dan ``posisi`` yaitu indeks
+    pasangan di urutan ``np.triu_indices(n, k=1)`` (dipakai sebagai tabu).
+    """
+    n = matriks.shape[-1]
+    iu, ju = np.triu_indices(n, k=1)
+    rasio = bobot[:, :, np.newaxis] / bobot[:, np.newaxis, :]
+    sekarang = matriks[:, iu, ju]
+    target = np.clip(rasio[:, iu, ju], SKALA_SAATY[0], SKALA_SAATY[-1])
+    if skala_saaty:
+        target = bulatkan_saaty(target)
+    deviasi = np.abs(np.log(sekarang / rasio[:, iu, ju]))
+    bisa = ~np.isclose(target, sekarang)
+    if tabu is not None:
+        bisa &= ~tabu
+    deviasi = np.where(bisa, deviasi, -np.inf)
+    posisi = np.argmax(deviasi, axis=1)
+    baris = np.arange(len(posisi))
+    return iu[posisi], ju[posisi], target[baris, posisi], bisa[baris, posisi], posisi
+
+
+def perbaiki_konsistensi(matriks, batas=BATAS_CR, maks_iterasi=None, skala_saaty=True):
+    """Mengusulkan perbaikan minimal agar CR setiap matriks di bawah ``batas``.
+
+    Menerima satu matriks (n, n) atau tumpukan (B, n, n). Matriks yang sudah
+    konsisten tidak diubah. Judgment yang baru saja diubah tidak dipilih lagi
+    pada iterasi berikutnya agar perbaikan tidak bolak-balik di antara dua
+    nilai, dan semua judgment hasil perbaikan berada di rentang 1/9 .. 9.
+    Mengembalikan HasilPerbaikan berisi matriks hasil perbaikan, HasilAHP
+    akhirnya, jumlah iterasi per matriks, mask boolean sel yang berubah dan
+    ``berhasil`` (CR akhir < ``batas``); matriks yang tidak berhasil
+    diperbaiki tetap perlu ditinjau evaluatornya.
+    """
+    asli = np.asarray(matriks, dtype=float)
+    tunggal = asli.ndim == 2
+    matriks = asli[np.newaxis].copy() if tunggal else asli.copy()
+    n = matriks.shape[-1]
+    # Pembulatan ke skala Saaty kadang butuh lebih dari satu putaran per judgment
+    maks_iterasi = n * (n - 1) if maks_iterasi is None else maks_iterasi
+
+    hasil = hitung_ahp_batch(matriks)
+    bobot, lambda_max, ci, cr = (np.array(x) for x in hasil)
+    iterasi = np.zeros(len(matriks), dtype=np.int64)
+    aktif = cr >= batas
+    # Posisi pasangan segitiga atas yang diubah pada iterasi terakhir, -1 bila belum ada
+    terakhir = np.full(len(matriks), -1)
+    pasangan = np.arange(n * (n - 1) // 2)
+
+    for _ in range(maks_iterasi):
+        idx = np.flatnonzero(aktif)
+        if len(idx) == 0:
+            break
+        tabu = pasangan[np.newaxis, :] == terakhir[idx, np.newaxis]
+        i, j, target, ada, posisi = judgment_terburuk(matriks[idx], bobot[idx], skala_saaty, tabu)
+        # Tanpa judgment yang bisa diubah, matriks tersebut berhenti sebagai tidak berhasil
+        aktif[idx[~ada]] = False
+        idx, i, j, target, posisi = idx[ada], i[ada], j[ada], target[ada], posisi[ada]
+        if len(idx) == 0:
+            break
+        matriks[idx, i, j] = target
+        matriks[idx, j, i] = 1.0 / target
+        terakhir[idx] = posisi
+        iterasi[idx] += 1
+
+        baru = hitung_ahp_batch(matriks[idx])
+        bobot[idx], lambda_max[idx], ci[idx], cr[idx] = baru
+        aktif[idx] = baru.cr >= batas
+
+    berhasil = cr < batas
+    berubah = ~np.isclose(matriks, asli if not tunggal else asli[np.newaxis])
+    if tunggal:
+        return HasilPerbaikan(
+            matriks[0], HasilAHP(bobot[0], float(lambda_max[0]), float(ci[0]), float(cr[0])), int(iterasi[0]), berubah[0],
+            bool(berhasil[0]),
+        )
+    return HasilPerbaikan(matriks, HasilAHP(bobot, lambda_max, ci, cr), iterasi, berubah, berhasil)
@@ -0,0 +1,285 @@
+"""Layanan HTTP lokal (asyncio) untuk perhitungan bobot dan nilai AHP.
+
+Kriteria dan bobot dimuat sekali saat start (dari database bila ``--db``,
+atau dari matriks perbandingan contoh) lalu disimpan di memori, sehingga
+setiap permintaan hanya menjalankan perhitungan NumPy-nya saja.
+
+Endpoint:
+    POST /weights  {"matriks": [[...]] atau [[[...]], ...]}
+    POST /score    {"skor": [[...], ...], "bobot": [...]?, "matriks": [[...]]?, "sub_bobot": [...]?}
+    GET  /metrics  histogram latensi format Prometheus
+    GET  /health
+
+Permintaan identik yang datang bersamaan (path dan body sama) digabung:
+hanya satu yang dihitung dan semuanya menerima jawaban yang sama.
+
+Contoh:
+    python ahp_layanan.py --port 8765
+    curl -X POST localhost:8765/score -d '{"skor": [[85, 90, 80, 75, 85]]}'
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from http import HTTPStatus
+
+import numpy as np
+
+from ahp_cache import CacheAHP
+from ahp_engine import BATAS_CR, MATRIKS_KRITERIA, NAMA_KRITERIA, hitung_ahp
+from ahp_skor import hitung_skor
+
+# Batas atas bucket histogram latensi (detik)
+BUCKET_LATENSI = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+MAKS_BODY = 32 * 1024 * 1024
+
+
+class Histogram:
+    """Histogram kumulatif seperti tipe histogram Prometheus"""
+
+    def __init__(self, bucket=BUCKET_LATENSI):
+        self.bucket = tuple(bucket)
+        self.hitung = [0] * len(self.bucket)
+        self.jumlah = 0.0
+        self.total = 0
+
+    def amati(self, nilai):
+        for i, batas in enumerate(self.bucket):
+            if nilai <= batas:
+                self.hitung[i] += 1
+        self.jumlah += nilai
+        self.total += 1
+
+    def teks(self, nama, label):
+        baris = [f'{nama}_bucket{{{label},le="{batas}"}} {n}' for batas, n in zip(self.bucket, self.hitung)]
+        baris.append(f'{nama}_bucket{{{label},le="+Inf"}} {self.total}')
+        baris.append(f'{nama}_sum{{{label}}} {self.jumlah}')
+        baris.append(f'{nama}_count{{{label}}} {self.total}')
+        return baris
+
+
+def _daftar(array):
+    return np.asarray(array).tolist()
+
+
+def _array_hingga(nilai, field):
+    """Array float dari field JSON; null, NaN dan Infinity ditolak sebagai ValueError (400)"""
+    array = np.asarray(nilai, dtype=float)
+    if not np.isfinite(array).all():
+        raise ValueError(f'field {field} harus berisi angka hingga (tanpa null/NaN/Infinity)')
+    return array
+
+
+class LayananAHP:
+    """State layanan: bobot default, cache AHP, permintaan yang sedang berjalan dan metrik"""
+
+    def __init__(self, nama_kriteria, bobot, matriks=None, kapasitas_cache=10000):
+        self.nama_kriteria = list(nama_kriteria)
+        self.bobot = np.asarray(bobot, dtype=float)
+        self.matriks = matriks
+        self.cache = CacheAHP(kapasitas_cache)
+        # Perhitungan berjalan di thread executor, sedangkan CacheAHP tidak thread-safe
+        self._kunci_cache = threading.Lock()
+        self._berjalan = {}
+        self.latensi = {}
+        self.status = {}
+        self.digabung = 0
+
+    @classmethod
+    def dari_database(cls, conn, kapasitas_cache=10000):
+        """Memuat nama dan bobot kriteria aktif dari tm_kriteria"""
+        from ahp_db import muat_kriteria
+
+        _, nama, bobot = muat_kriteria(conn)
+        return cls(nama, bobot, kapasitas_cache=kapasitas_cache)
+
+    @classmethod
+    def dari_matriks(cls, matriks=MATRIKS_KRITERIA, nama_kriteria=NAMA_KRITERIA, kapasitas_cache=10000):
+        """Bobot default dari eigenvector matriks perbandingan kriteria"""
+        return cls(nama_kriteria, hitung_ahp(matriks).bobot, matriks, kapasitas_cache)
+
+    def weights(self, data):
+        """Bobot, lambda_max, CI dan CR untuk satu matriks atau tumpukan matriks, dihitung apa adanya seperti ``hitung_ahp``"""
+        matriks = _array_hingga(data['matriks'], 'matriks')
+        tunggal = matriks.ndim == 2
+        with self._kunci_cache:
+            hasil = self.cache.hitung_batch(matriks[np.newaxis] if tunggal else matriks)
+        jawaban = {
+            'bobot': _daftar(hasil.bobot),
+            'lambda_max': _daftar(hasil.lambda_max),
+            'ci': _daftar(hasil.ci),
+            'cr': _daftar(hasil.cr),
+            'konsisten': _daftar(hasil.cr < BATAS_CR),
+        }
+        return {k: v[0] for k, v in jawaban.items()} if tunggal else jawaban
+
+    def score(self, data):
+        """Nilai AHP, ranking dan kategori untuk batch guru"""
+        skor = _array_hingga(data['skor'], 'skor')
+        if 'bobot' in data:
+            bobot = _array_hingga(data['bobot'], 'bobot')
+        elif 'matriks' in data:
+            matriks = _array_hingga(data['matriks'], 'matriks')
+            with self._kunci_cache:
+                bobot = self.cache.hitung(matriks).bobot
+        else:
+            bobot = self.bobot
+        sub_bobot = data.get('sub_bobot')
+        if sub_bobot is not None:
+            sub_bobot = [None if sub is None else _array_hingga(sub, 'sub_bobot') for sub in sub_bobot]
+        hasil = hitung_skor(skor, bobot, sub_bobot)
+        return {'nilai': _daftar(hasil.nilai), 'ranking': _daftar(hasil.ranking), 'kategori': _daftar(hasil.kategori)}
+
+    def info(self):
+        return {'status': 'ok', 'kriteria': self.nama_kriteria, 'bobot': _daftar(self.bobot), 'cache': self.cache.statistik()}
+
+    def metrics(self):
+        """Metrik dalam format teks Prometheus"""
+        baris = [
+            '# HELP ahp_request_duration_seconds Latensi permintaan per endpoint',
+            '# TYPE ahp_request_duration_seconds histogram',
+        ]
+        for path, histogram in sorted(self.latensi.items()):
+            baris += histogram.teks('ahp_request_duration_seconds', f'path="{path}"')
+        baris += ['# HELP ahp_requests_total Jumlah permintaan per endpoint dan status', '# TYPE ahp_requests_total counter']
+        baris += [f'ahp_requests_total{{path="{p}",status="{s}"}} {n}' for (p, s), n in sorted(self.status.items())]
+        baris += ['# HELP ahp_coalesced_total Permintaan yang digabung dengan permintaan identik', '# TYPE ahp_coalesced_total counter']
+        baris.append(f'ahp_coalesced_total {self.digabung}')
+        statistik = self.cache.statistik()
+        baris += ['# TYPE ahp_cache_hits_total counter', f"ahp_cache_hits_total {statistik['hits']}"]
+        baris += ['# TYPE ahp_cache_misses_total counter', f"ahp_cache_misses_total {statistik['misses']}"]
+        return '\n'.join(baris) + '\n'
+
+    async def proses(self, method, path, body):
+        """Menjalankan satu permintaan; mengembalikan (status, content_type, body_bytes)"""
+        rute = {'/weights': self.weights, '/score': self.score}
+        if path == '/metrics' and method == 'GET':
+            return HTTPStatus.OK, 'text/plain; version=0.0.4', self.metrics().encode()
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, 'application/json', json.dumps(self.info(), allow_nan=False).encode()
+        if path not in rute:
+            return HTTPStatus.NOT_FOUND, 'application/json', b'{"error": "endpoint tidak ditemukan"}'
+        if method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED, 'application/json', b'{"error": "gunakan POST"}'
+
+        kunci = (path, hashlib.blake2b(body, digest_size=16).digest())
+        future = self._berjalan.get(kunci)
+        if future is not None:
+            self.digabung += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._berjalan[kunci] = future
+        try:
+            hasil = await self._hitung(rute[path], body)
+            future.set_result(hasil)
+        except Exception as exc:
+            future.set_exception(exc)
+            # Ditandai sudah dibaca agar tidak ada peringatan bila tidak ada permintaan yang digabung
+            future.exception()
+            raise
+        finally:
+            del self._berjalan[kunci]
+        return hasil
+
+    async def _hitung(self, fungsi, body):
+        try:
+            data = json.loads(body)
+            if not isinstance(data, dict):
+                raise ValueError('body harus berupa objek JSON')
+            # Perhitungan NumPy dijalankan di thread agar event loop tetap responsif
+            jawaban = await asyncio.get_running_loop().run_in_executor(None, fungsi, data)
+        except (ValueError, KeyError, TypeError, IndexError) as exc:
+            pesan = f'field {exc} wajib diisi' if isinstance(exc, KeyError) else str(exc)
+            return HTTPStatus.BAD_REQUEST, 'application/json', json.dumps({'error': pesan}).encode()
+        # allow_nan=False: NaN/Infinity bukan JSON yang sah, lebih baik gagal (500) daripada dikirim
+        return HTTPStatus.OK, 'application/json', json.dumps(jawaban, allow_nan=False).encode()
+
+    def catat(self, path, status, durasi):
+        self.latensi.setdefault(path, Histogram()).amati(durasi)
+        self.status[(path, int(status))] = self.status.get((path, int(status)), 0) + 1
+
+    async def tangani(self, reader, writer):
+        """Handler koneksi HTTP/1.1 sederhana dengan keep-alive"""
+        try:
+            while True:
+                baris = await reader.readline()
+                if not baris:
+                    break
+                mulai = time.perf_counter()
+                try:
+                    method, target, versi = baris.decode('latin-1').split()
+                except ValueError:
+                    break
+                header = {}
+                while True:
+                    baris = await reader.readline()
+                    if baris in (b'\r\n', b'\n', b''):
+                        break
+                    nama, _, nilai = baris.decode('latin-1').partition(':')
+                    header[nama.strip().lower()] = nilai.strip()
+
+                panjang = int(header.get('content-length', 0) or 0)
+                path = target.split('?', 1)[0]
+                if panjang > MAKS_BODY:
+                    status, tipe, isi = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'application/json', b'{"error": "body terlalu besar"}'
+                    header['connection'] = 'close'
+                else:
+                    body = await reader.readexactly(panjang) if panjang else b''
+                    try:
+                        status, tipe, isi = await self.proses(method, path, body)
+                    except Exception as exc:
+                        status, tipe, isi = HTTPStatus.INTERNAL_SERVER_ERROR, 'application/json', json.dumps({'error': str(exc)}).encode()
+
+                tutup = header.get('connection', '').lower() == 'close' or versi == 'HTTP/1.0'
+                writer.write(
+                    f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+                    f'Content-Type: {tipe}\r\n'
+                    f'Content-Length: {len(isi)}\r\n'
+                    f"Connection: {'close' if tutup else 'keep-alive'}\r\n\r\n".encode('latin-1') + isi
+                )
+                await writer.drain()
+                self.catat(path, status, time.perf_counter() - mulai)
+                if tutup:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def jalankan(layanan, host='127.0.0.1', port=8765):
+    """Menjalankan server sampai dihentikan"""
+    server = await asyncio.start_server(layanan.tangani, host, port)
+    alamat = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print(f'Layanan AHP berjalan di {alamat}')
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Layanan HTTP perhitungan bobot dan nilai AHP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--db', action='store_true', help='Muat kriteria dan bobot dari database (variabel DB_* .env)')
+    parser.add_argument('--cache', type=int, default=10000, help='Kapasitas cache hasil AHP per matriks')
+    args = parser.parse_args(argv)
+
+    if args.db:
+        from ahp_db import koneksi_dari_env
+
+        conn = koneksi_dari_env()
+        layanan = LayananAHP.dari_database(conn, args.cache)
+        conn.close()
+    else:
+        layanan = LayananAHP.dari_matriks(kapasitas_cache=args.cache)
+    try:
+        asyncio.run(jalankan(layanan, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""Metode prioritas AHP alternatif sebagai backend yang bisa dipilih.
+
+Semua backend menerima tumpukan matriks perbandingan ``(B, n, n)`` (atau
+satu matriks ``(n, n)``) dan mengembalikan bobot ternormalisasi ``(B, n)``:
+
+- 'eigenvector': eigenvector utama Saaty (``ahp_engine``).
+- 'geometrik': rata-rata geometrik baris (row geometric mean).
+- 'llsm': logarithmic least squares; mendukung judgment kosong (NaN) dan
+  pada matriks resiprokal lengkap hasilnya sama dengan 'geometrik'.
+- 'fuzzy_buckley': AHP fuzzy segitiga, rata-rata geometrik fuzzy Buckley.
+- 'fuzzy_chang': AHP fuzzy segitiga, extent analysis Chang.
+
+Judgment tegas (crisp) difuzzifikasi menjadi bilangan fuzzy segitiga
+(x - delta, x, x + delta) pada skala Saaty, atau input dapat langsung berupa
+matriks fuzzy ``(B, n, n, 3)`` berisi (l, m, u).
+
+Contoh:
+    python ahp_metode.py --batch 10000 --kriteria 5
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ahp_engine import MATRIKS_KRITERIA, NAMA_KRITERIA, hitung_ahp_batch
+
+
+def _tumpukan(matriks, fuzzy=False):
+    matriks = np.asarray(matriks, dtype=float)
+    ndim = 3 if fuzzy else 2
+    tunggal = matriks.ndim == ndim
+    return (matriks[np.newaxis] if tunggal else matriks), tunggal
+
+
+def _normalisasi(bobot):
+    return bobot / bobot.sum(axis=-1, keepdims=True)
+
+
+def prioritas_eigenvector(matriks):
+    """Bobot eigenvector utama (Saaty)"""
+    return hitung_ahp_batch(matriks).bobot
+
+
+def prioritas_geometrik(matriks):
+    """Bobot rata-rata geometrik baris"""
+    return _normalisasi(np.exp(np.log(matriks).mean(axis=-1)))
+
+
+def prioritas_llsm(matriks):
+    """Bobot logarithmic least squares: min sum (ln a_ij - v_i + v_j)^2 atas judgment yang terisi.
+
+    Judgment kosong ditandai NaN (atau <= 0). Sistem normalnya berupa
+    Laplacian graf judgment, diselesaikan sekaligus untuk seluruh tumpukan.
+    """
+    ada = np.isfinite(matriks) & (matriks > 0)
+    n = matriks.shape[-1]
+    ada &= ~np.eye(n, dtype=bool)
+    log_a = np.where(ada, np.log(np.where(ada, matriks, 1.0)), 0.0)
+    # Simetrikan: pakai a_ij dan 1/a_ji bila keduanya ada
+    ada_sim = ada | np.swapaxes(ada, -1, -2)
+    jumlah = ada.astype(float) + np.swapaxes(ada, -1, -2)
+    log_sim = np.where(ada_sim, (log_a - np.swapaxes(log_a, -1, -2)) / np.maximum(jumlah, 1), 0.0)
+
+    laplacian = np.where(ada_sim, -1.0, 0.0)
+    laplacian[..., np.arange(n), np.arange(n)] = ada_sim.sum(axis=-1)
+    # Tambahan 1/n agar solusi unik dengan sum(v) = 0 (graf terhubung)
+    v = np.linalg.solve(laplacian + 1.0 / n, log_sim.sum(axis=-1)[..., np.newaxis])[..., 0]
+    return _normalisasi(np.exp(v))
+
+
+def fuzzifikasi(matriks, delta=1.0):
+    """Matriks tegas (B, n, n) -> matriks fuzzy segitiga (B, n, n, 3) berisi (l, m, u).
+
+    Judgment x >= 1 menjadi (max(1, x - delta), x, min(9, x + delta)); judgment
+    x < 1 menjadi kebalikan fuzzy dari judgment resiproknya. Diagonal (1, 1, 1).
+    """
+    matriks = np.asarray(matriks, dtype=float)
+    besar = np.maximum(matriks, 1.0 / matriks)
+    l = np.maximum(1.0, besar - delta)
+    u = np.minimum(9.0, besar + delta)
+    kecil = matriks < 1.0
+    hasil = np.stack([np.where(kecil, 1.0 / u, l), matriks, np.where(kecil, 1.0 / l, u)], axis=-1)
+    n = matriks.shape[-1]
+    hasil[..., np.arange(n), np.arange(n), :] = 1.0
+    return hasil
+
+
+def _fuzzy(matriks, delta):
+    # Tumpukan fuzzy (B, n, n, 3) dipakai apa adanya, tumpukan tegas (B, n, n) difuzzifikasi
+    matriks = np.asarray(matriks, dtype=float)
+    return matriks if matriks.ndim == 4 else fuzzifikasi(matriks, delta)
+
+
+def prioritas_fuzzy_buckley(matriks, delta=1.0):
+    """Bobot AHP fuzzy Buckley: rata-rata geometrik fuzzy lalu defuzzifikasi centroid"""
+    fuzzy = _fuzzy(matriks, delta)
+    r = np.exp(np.log(fuzzy).mean(axis=-2))  # (B, n, 3)
+    total = r.sum(axis=-2, keepdims=True)
+    w = np.stack([r[..., 0] / total[..., 2], r[..., 1] / total[..., 1], r[..., 2] / total[..., 0]], axis=-1)
+    return _normalisasi(w.mean(axis=-1))
+
+
+def prioritas_fuzzy_chang(matriks, delta=1.0):
+    """Bobot AHP fuzzy dengan extent analysis Chang (derajat kemungkinan minimum)"""
+    fuzzy = _fuzzy(matriks, delta)
+    baris = fuzzy.sum(axis=-2)  # (B, n, 3)
+    total = baris.sum(axis=-2, keepdims=True)
+    s = np.stack([baris[..., 0] / total[..., 2], baris[..., 1] / total[..., 1], baris[..., 2] / total[..., 0]], axis=-1)
+
+    l, m, u = s[..., 0], s[..., 1], s[..., 2]
+    # V(S_i >= S_k) untuk semua pasangan (B, n, n)
+    li, mi, ui = l[..., :, np.newaxis], m[..., :, np.newaxis], u[..., :, np.newaxis]
+    lk, mk = l[..., np.newaxis, :], m[..., np.newaxis, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        antara = (lk - ui) / ((mi - ui) - (mk - lk))
+    v = np.where(mi >= mk, 1.0, np.where(lk >= ui, 0.0, antara))
+    n = v.shape[-1]
+    v[..., np.arange(n), np.arange(n)] = 1.0
+    d = v.min(axis=-1)
+    total_d = d.sum(axis=-1, keepdims=True)
+    # Extent analysis bisa memberi bobot nol semua; tidak ada prioritas yang bisa diturunkan
+    return np.where(total_d > 0, d / np.where(total_d > 0, total_d, 1.0), np.nan)
+
+
+METODE_PRIORITAS = {
+    'eigenvector': prioritas_eigenvector,
+    'geometrik': prioritas_geometrik,
+    'llsm': prioritas_llsm,
+    'fuzzy_buckley': prioritas_fuzzy_buckley,
+    'fuzzy_chang': prioritas_fuzzy_chang,
+}
+
+
+def daftarkan_metode(nama, fungsi):
+    """Menambahkan backend prioritas baru: fungsi (B, n, n) -> bobot (B, n)"""
+    METODE_PRIORITAS[nama] = fungsi
+
+
+def hitung_prioritas(matriks, metode='eigenvector', fuzzy=False, **opsi):
+    """Bobot prioritas satu matriks (n,) atau tumpukan matriks (B, n) dengan backend ``metode``.
+
+    ``fuzzy=True`` menandakan input berupa matriks fuzzy (n, n, 3) atau
+    (B, n, n, 3), hanya untuk metode fuzzy.
+    """
+    if metode not in METODE_PRIORITAS:
+        raise ValueError(f'Metode tidak dikenal: {metode}, harus salah satu dari {list(METODE_PRIORITAS)}')
+    if fuzzy and not metode.startswith('fuzzy'):
+        raise ValueError(f'Metode {metode} tidak menerima matriks fuzzy')
+    tumpukan, tunggal = _tumpukan(matriks, fuzzy)
+    bobot = METODE_PRIORITAS[metode](tumpukan, **opsi)
+    return bobot[0] if tunggal else bobot
+
+
+def _urutan_sama(a, b):
+    return np.all(np.argsort(-a, axis=-1, kind='stable') == np.argsort(-b, axis=-1, kind='stable'), axis=-1)
+
+
+def bandingkan_metode(matriks_uji, matriks_kriteria=MATRIKS_KRITERIA, metode=None):
+    """Throughput tiap backend pada ``matriks_uji`` (B, n, n) dan kesesuaiannya dengan eigenvector.
+
+    Mengembalikan list dict berisi metode, durasi, matriks/detik, selisih bobot
+    maksimum rata-rata terhadap eigenvector, persentase urutan prioritas yang
+    sama, dan bobot pada ``matriks_kriteria``.
+    """
+    metode = list(METODE_PRIORITAS) if metode is None else metode
+    acuan = prioritas_eigenvector(matriks_uji)
+    hasil = []
+    for nama in metode:
+        mulai = time.perf_counter()
+        bobot = METODE_PRIORITAS[nama](matriks_uji)
+        durasi = time.perf_counter() - mulai
+        hasil.append({
+            'metode': nama,
+            'durasi': durasi,
+            'matriks_per_detik': len(matriks_uji) / durasi if durasi > 0 else None,
+            'selisih_rata': float(np.nanmean(np.abs(bobot - acuan).max(axis=-1))),
+            'urutan_sama': float(np.mean(_urutan_sama(bobot, acuan))),
+            'bobot_kriteria': hitung_prioritas(matriks_kriteria, nama).tolist(),
+        })
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bandingkan throughput dan kesesuaian metode prioritas AHP')
+    parser.add_argument('--batch', type=int, default=10000, help='Jumlah matriks acak untuk uji throughput')
+    parser.add_argument('--kriteria', type=int, default=5, help='Ordo matriks acak')
+    parser.add_argument('--metode', nargs='+', choices=list(METODE_PRIORITAS), default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from benchmark_ahp import matriks_acak
+
+    matriks = matriks_acak(np.random.default_rng(args.seed), args.batch, args.kriteria)
+    hasil = bandingkan_metode(matriks, metode=args.metode)
+
+    print(f'{"Metode":15s} {"matriks/detik":>14s} {"selisih bobot":>14s} {"urutan sama":>12s}')
+    for h in hasil:
+        print(f"{h['metode']:15s} {h['matriks_per_detik'] or 0:14.0f} {h['selisih_rata']:14.4f} {h['urutan_sama']:12.1%}")
+    print()
+    print(f'Bobot kriteria sekolah ({len(MATRIKS_KRITERIA)} kriteria):')
+    print(f'{"":25s}' + ''.join(f"{h['metode'][:13]:>14s}" for h in hasil))
+    for i, nama in enumerate(NAMA_KRITERIA):
+        print(f'{nama:25s}' + ''.join(f"{h['bobot_kriteria'][i]:14.4f}" for h in hasil))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""Instrumentasi waktu per tahap pipeline AHP.
+
+Setiap tahap (muat, bobot, skor, ranking, xlsx, docx, pdf, ...) dibungkus
+``span`` yang mencatat durasi, jumlah baris, RSS saat ini dan RSS puncak
+proses, lalu dikirim sebagai satu baris JSON. Span bisa bersarang; nama
+lengkapnya berupa jalur seperti ``batch/render/docx``.
+
+Diatur lewat variabel lingkungan sehingga job produksi tidak perlu diubah:
+
+- ``AHP_PROFIL=1``: aktifkan log JSON span (default ke stderr).
+- ``AHP_PROFIL_LOG=path``: tulis log JSON ke file (ditambahkan di akhir);
+  mengaktifkan log walaupun AHP_PROFIL tidak diisi.
+- ``AHP_PROFIL_CPROFILE=folder``: bungkus ``profil(...)`` dengan cProfile dan
+  simpan hasilnya sebagai ``<nama>-<pid>.prof`` untuk dibuka dengan
+  ``python -m pstats``, snakeviz, atau diubah menjadi flamegraph
+  (mis. ``flameprof``).
+
+Aktif tidaknya log span (``AKTIF``) ditentukan sekali saat modul diimpor;
+worker ProcessPoolExecutor ikut mewarisi variabelnya. Path AHP_PROFIL_LOG
+dibaca setiap kali satu catatan ditulis, sedangkan AHP_PROFIL_CPROFILE
+dibaca saat blok ``profil(...)`` dimulai dan foldernya dipakai lagi saat
+blok selesai. Tanpa variabel tersebut span hanya berupa context manager
+kosong seharga satu pemeriksaan flag. Modul ini hanya memakai pustaka
+standar agar bisa diimpor dari modul mana pun.
+
+Contoh:
+    AHP_PROFIL=1 python batch_laporan.py --input guru.json
+    AHP_PROFIL_LOG=profil.jsonl AHP_PROFIL_CPROFILE=storage/app/profil python ahp_arsip.py --semua
+"""
+import contextvars
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENV_AKTIF = 'AHP_PROFIL'
+ENV_LOG = 'AHP_PROFIL_LOG'
+ENV_CPROFILE = 'AHP_PROFIL_CPROFILE'
+
+_jalur = contextvars.ContextVar('ahp_profil_jalur', default=())
+# Ringkasan per jalur span di proses ini: jalur -> [jumlah, durasi, baris]
+_ringkasan = {}
+
+
+def aktif(env=None):
+    """True bila log span JSON diaktifkan lewat variabel lingkungan"""
+    env = os.environ if env is None else env
+    return env.get(ENV_AKTIF, '') not in ('', '0') or bool(env.get(ENV_LOG))
+
+
+AKTIF = aktif()
+
+
+def rss_mb():
+    """RSS proses saat ini dalam MB (Linux), None bila tidak tersedia"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def rss_puncak_mb():
+    """RSS puncak proses sejak mulai dalam MB, None bila tidak tersedia"""
+    if resource is None:
+        return None
+    # ru_maxrss dalam KiB di Linux, byte di macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def _bulat(mb):
+    return None if mb is None else round(mb, 2)
+
+
+def tulis_log(catatan, env=None):
+    """Menulis satu catatan sebagai baris JSON ke AHP_PROFIL_LOG atau stderr"""
+    env = os.environ if env is None else env
+    baris = json.dumps(catatan, ensure_ascii=False, default=str) + '\n'
+    path = env.get(ENV_LOG)
+    if path:
+        # Satu write per baris dengan mode append, aman untuk beberapa proses worker
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(baris)
+    else:
+        sys.stderr.write(baris)
+        sys.stderr.flush()
+
+
+class Span:
+    """Context manager satu tahap; ``baris`` dan ``atribut`` boleh diisi di dalam blok"""
+
+    __slots__ = ('nama', 'baris', 'atribut', 'aktif', '_mulai', '_puncak_awal', '_token')
+
+    def __init__(self, nama, baris=None, atribut=None):
+        self.nama = nama
+        self.baris = baris
+        self.atribut = atribut
+        self.aktif = AKTIF
+
+    def __enter__(self):
+        if self.aktif:
+            self._token = _jalur.set(_jalur.get() + (self.nama,))
+            self._puncak_awal = rss_puncak_mb()
+            self._mulai = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.aktif:
+            return
+        durasi = time.perf_counter() - self._mulai
+        jalur = '/'.join(_jalur.get())
+        _jalur.reset(self._token)
+        puncak = rss_puncak_mb()
+        catatan = {
+            'waktu': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'span': jalur,
+            'nama': self.nama,
+            'durasi': round(durasi, 6),
+            'baris': self.baris,
+            'baris_per_detik': round(self.baris / durasi, 1) if self.baris and durasi > 0 else None,
+            'rss_mb': _bulat(rss_mb()),
+            'rss_puncak_mb': _bulat(puncak),
+            'naik_puncak_mb': _bulat(puncak - self._puncak_awal) if puncak is not None else None,
+            'pid': os.getpid(),
+            'status': 'ok' if exc_type is None else 'error',
+        }
+        if exc_type is not None:
+            catatan['error'] = exc_type.__name__
+        if self.atribut:
+            catatan.update(self.atribut)
+        tulis_log(catatan)
+
+        total = _ringkasan.setdefault(jalur, [0, 0.0, 0])
+        total[0] += 1
+        total[1] += durasi
+        total[2] += self.baris or 0
+
+
+def span(nama, baris=None, **atribut):
+    """Span untuk satu tahap, mis. ``with span('xlsx', baris=n):``"""
+    return Span(nama, baris, atribut)
+
+
+def ringkasan():
+    """Total per jalur span di proses ini: {jalur: {'jumlah', 'durasi', 'baris'}}"""
+    return {jalur: {'jumlah': n, 'durasi': round(d, 6), 'baris': b} for jalur, (n, d, b) in _ringkasan.items()}
+
+
+class profil:
+    """Span tingkat atas untuk satu job; menulis ringkasan per tahap dan dump cProfile bila diminta.
+
+    Dipakai sekali di ``main()`` setiap skrip, mis. ``with profil('batch'):``.
+    """
+
+    def __init__(self, nama):
+        self.nama = nama
+        self._span = span(nama)
+        self._profiler = None
+        self._folder = None
+
+    def __enter__(self):
+        folder = os.environ.get(ENV_CPROFILE)
+        if folder:
+            self._folder = folder
+            import cProfile
+
+            os.makedirs(folder, exist_ok=True)
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._span.__enter__()
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        self._span.__exit__(exc_type, exc, tb)
+        if self._span.aktif:
+            tulis_log({'span': self.nama, 'ringkasan': ringkasan(), 'pid': os.getpid()})
+        if self._profiler is not None:
+            self._profiler.disable()
+            path = os.path.join(self._folder, f'{self.nama}-{os.getpid()}.prof')
+            self._profiler.dump_stats(path)
+            print(f'Profil cProfile tersimpan di: {path}', file=sys.stderr)
@@ -0,0 +1,208 @@
+"""Ranking, kategori, top-k per kelompok dan rekomendasi guru secara vektor.
+
+Semua fungsi bekerja pada array ``(N,)`` / ``(N, K)`` sekaligus, sehingga
+100 ribu baris guru x periode cukup beberapa operasi NumPy:
+
+- ``peringkat``: ranking dengan penanganan nilai seri (default: nilai sama
+  mendapat peringkat sama, 1, 2, 2, 4), opsional per kelompok (mis. periode).
+- ``kategori``: Sangat Baik (90-100), Baik (80-89), Cukup (70-79), Kurang (<70)
+  seperti kolom checkbox di form DOCX; NaN menjadi "Belum dinilai".
+- ``top_k``: k teratas / terbawah per kelompok (mis. mata pelajaran) dengan
+  ``argpartition``, tanpa mengurutkan seluruh kelompok.
+- ``rekomendasi``: saran dari kriteria terlemah setiap guru.
+
+Nilai dianggap seri bila sama setelah dibulatkan ke ``DESIMAL_SERI`` angka
+desimal, yaitu ketelitian yang ditampilkan di laporan (84.25 dan
+84.2500000001 hasil perkalian matriks tetap seri). Kategori juga ditentukan
+dari nilai yang sudah dibulatkan, sehingga 89.999 yang tampil sebagai 90.00
+masuk Sangat Baik.
+"""
+import numpy as np
+
+# Batas kategori sesuai form evaluasi: Sangat Baik (90-100), Baik (80-89), Cukup (70-79), Kurang (<70)
+BATAS_KATEGORI = np.array([70.0, 80.0, 90.0])
+NAMA_KATEGORI = np.array(['Kurang', 'Cukup', 'Baik', 'Sangat Baik'])
+# Kategori guru tanpa nilai (NaN), kodenya -1
+KATEGORI_BELUM_DINILAI = 'Belum dinilai'
+
+DESIMAL_SERI = 2
+METODE_PERINGKAT = ('min', 'dense', 'urut')
+
+# Saran per kriteria (nama seperti tm_kriteria / NAMA_KRITERIA); kriteria lain memakai "tingkatkan <nama>"
+SARAN_KRITERIA = {
+    'Kedisiplinan': 'tingkatkan kedisiplinan',
+    'Penguasaan Materi': 'tingkatkan penguasaan materi',
+    'Metode Mengajar': 'variasikan metode mengajar',
+    'Komunikasi': 'perbaiki komunikasi dengan siswa',
+    'Evaluasi Pembelajaran': 'perbaiki sistem evaluasi pembelajaran',
+}
+SARAN_UNGGUL = 'Pertahankan kinerja, jadikan mentor'
+
+
+def kode_kategori(nilai, desimal=DESIMAL_SERI):
+    """Indeks kategori 0 (Kurang) .. 3 (Sangat Baik) untuk setiap nilai, -1 untuk NaN"""
+    nilai = np.asarray(nilai, dtype=float)
+    if desimal is not None:
+        nilai = np.round(nilai, desimal)
+    return np.where(np.isnan(nilai), -1, np.digitize(nilai, BATAS_KATEGORI))
+
+
+def kategori(nilai, desimal=DESIMAL_SERI):
+    """Mengelompokkan nilai ke kategori Sangat Baik/Baik/Cukup/Kurang, atau Belum dinilai"""
+    kode = kode_kategori(nilai, desimal)
+    return np.where(kode < 0, KATEGORI_BELUM_DINILAI, NAMA_KATEGORI[kode])
+
+
+def _kunci(nilai, desimal):
+    # Kunci urut naik: nilai tertinggi lebih dulu, NaN (belum dinilai) paling akhir
+    nilai = np.asarray(nilai, dtype=float)
+    if desimal is not None:
+        nilai = np.round(nilai, desimal)
+    return np.where(np.isnan(nilai), np.inf, -nilai)
+
+
+def _kode_kelompok(kelompok, n):
+    if kelompok is None:
+        return np.array([None], dtype=object), np.zeros(n, dtype=np.int64)
+    nama, kode = np.unique(np.asarray(kelompok), return_inverse=True)
+    return nama, kode.reshape(-1)
+
+
+def peringkat(nilai, kelompok=None, metode='min', desimal=DESIMAL_SERI):
+    """Peringkat (1 = tertinggi) setiap nilai, per kelompok bila ``kelompok`` diberikan.
+
+    ``metode`` untuk nilai seri: 'min' (1, 2, 2, 4), 'dense' (1, 2, 2, 3)
+    atau 'urut' (1, 2, 3, 4; seri diurutkan sesuai urutan input). NaN
+    mendapat peringkat terakhir dalam kelompoknya.
+    """
+    if metode not in METODE_PERINGKAT:
+        raise ValueError(f'metode harus salah satu dari {METODE_PERINGKAT}')
+    kunci = _kunci(nilai, desimal)
+    n = len(kunci)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    _, kode = _kode_kelompok(kelompok, n)
+
+    urutan = np.lexsort((kunci, kode))
+    kode_urut = kode[urutan]
+    kunci_urut = kunci[urutan]
+    awal_kelompok = np.r_[True, kode_urut[1:] != kode_urut[:-1]]
+    awal_seri = awal_kelompok | np.r_[True, kunci_urut[1:] != kunci_urut[:-1]]
+    posisi = np.arange(n)
+    mulai_kelompok = np.maximum.accumulate(np.where(awal_kelompok, posisi, 0))
+    if metode == 'urut':
+        urut = posisi - mulai_kelompok + 1
+    elif metode == 'min':
+        urut = np.maximum.accumulate(np.where(awal_seri, posisi, 0)) - mulai_kelompok + 1
+    else:
+        nomor_seri = np.cumsum(awal_seri)
+        urut = nomor_seri - nomor_seri[mulai_kelompok] + 1
+
+    hasil = np.empty(n, dtype=np.int64)
+    hasil[urutan] = urut
+    return hasil
+
+
+def _top_k_satu(kunci, indeks, k, seri):
+    if k < len(kunci):
+        batas = kunci[np.argpartition(kunci, k - 1)[k - 1]]
+        if seri:
+            # Nilai yang seri dengan posisi ke-k ikut terpilih
+            pilih = np.flatnonzero(kunci <= batas)
+        else:
+            # Dari nilai yang seri dengan posisi ke-k, urutan input lebih dulu yang terpilih
+            lebih = np.flatnonzero(kunci < batas)
+            pilih = np.r_[lebih, np.flatnonzero(kunci == batas)[:k - len(lebih)]]
+    else:
+        pilih = np.arange(len(kunci))
+    pilih = pilih[np.lexsort((indeks[pilih], kunci[pilih]))]
+    return indeks[pilih]
+
+
+def top_k(nilai, k, kelompok=None, terbawah=False, seri=True, desimal=DESIMAL_SERI):
+    """Indeks k guru dengan nilai tertinggi (``terbawah=True``: terendah), terurut.
+
+    Dengan ``kelompok`` (mis. mata pelajaran) hasilnya dict {kelompok: indeks}.
+    ``seri=True`` ikut menyertakan guru yang nilainya sama dengan guru ke-k,
+    sehingga hasil bisa lebih dari k; dengan ``seri=False`` guru yang seri
+    dipilih sesuai urutan input. Nilai NaN tidak pernah terpilih.
+    """
+    if k < 1:
+        raise ValueError('k harus >= 1')
+    kunci = _kunci(nilai, desimal)
+    if terbawah:
+        kunci = np.where(np.isinf(kunci), np.inf, -kunci)
+    valid = np.flatnonzero(np.isfinite(kunci))
+    if kelompok is None:
+        return _top_k_satu(kunci[valid], valid, k, seri)
+
+    nama, kode = _kode_kelompok(kelompok, len(kunci))
+    kode = kode[valid]
+    urutan = np.argsort(kode, kind='stable')
+    batas = np.searchsorted(kode[urutan], np.arange(len(nama) + 1))
+    hasil = {}
+    for i, nama_kelompok in enumerate(nama.tolist()):
+        anggota = valid[urutan[batas[i]:batas[i + 1]]]
+        hasil[nama_kelompok] = _top_k_satu(kunci[anggota], anggota, k, seri)
+    return hasil
+
+
+def kriteria_terlemah(skor, bobot=None, n=2, batas=None):
+    """Indeks ``n`` kriteria terlemah setiap guru (N, n), terlemah lebih dulu.
+
+    Tanpa ``bobot`` kriteria diurutkan dari skor terendah. Dengan ``bobot``
+    diurutkan dari potensi kenaikan nilai AHP terbesar, (100 - skor) x bobot,
+    sehingga kriteria berbobot besar lebih diutamakan. Kriteria dengan skor
+    >= ``batas`` (bila diberikan) dan skor NaN ditempatkan paling akhir.
+    """
+    skor = np.asarray(skor, dtype=float)
+    celah = 100.0 - skor
+    if bobot is not None:
+        bobot = np.asarray(bobot, dtype=float)
+        celah = celah * (bobot / bobot.sum())
+    abaikan = np.isnan(skor) if batas is None else ~(skor < batas)
+    celah = np.where(abaikan, -np.inf, celah)
+    return np.argsort(-celah, axis=-1, kind='stable')[..., :min(n, skor.shape[-1])]
+
+
+def _saran(nama_kriteria):
+    return SARAN_KRITERIA.get(nama_kriteria, f'tingkatkan {nama_kriteria.lower()}')
+
+
+def rekomendasi(skor, nama_kriteria, bobot=None, n=2, batas=90.0):
+    """Teks rekomendasi (N,) dari kriteria terlemah setiap guru.
+
+    Hanya kriteria dengan skor di bawah ``batas`` (default: di bawah Sangat
+    Baik) yang disarankan; guru tanpa kriteria seperti itu mendapat
+    SARAN_UNGGUL. Teks dibentuk sekali per kombinasi kriteria yang unik,
+    lalu disebarkan ke seluruh guru dengan indeks.
+    """
+    skor = np.asarray(skor, dtype=float)
+    if skor.shape[-1] != len(nama_kriteria):
+        raise ValueError(f'Jumlah kolom skor ({skor.shape[-1]}) tidak sama dengan jumlah kriteria ({len(nama_kriteria)})')
+    lemah = kriteria_terlemah(skor, bobot, n, batas)
+    perlu = np.take_along_axis(skor, lemah, axis=-1) < batas
+
+    # Kode kombinasi: setiap slot bernilai indeks kriteria + 1, atau 0 bila tidak perlu
+    basis = len(nama_kriteria) + 1
+    slot = np.where(perlu, lemah + 1, 0)
+    kode = (slot * basis ** np.arange(slot.shape[-1])).sum(axis=-1)
+    unik, kembali = np.unique(kode, return_inverse=True)
+
+    teks = []
+    for nilai_kode in unik.tolist():
+        saran = []
+        kerja_sebelum = None
+        while nilai_kode:
+            nilai_kode, sisa = divmod(nilai_kode, basis)
+            if sisa:
+                # Kata kerja yang sama tidak diulang: "tingkatkan kedisiplinan dan penguasaan materi"
+                kerja, _, objek = _saran(nama_kriteria[sisa - 1]).partition(' ')
+                saran.append(objek if kerja == kerja_sebelum else f'{kerja} {objek}')
+                kerja_sebelum = kerja
+        if not saran:
+            teks.append(SARAN_UNGGUL)
+            continue
+        kalimat = saran[0] if len(saran) == 1 else ', '.join(saran[:-1]) + ' dan ' + saran[-1]
+        teks.append(kalimat[:1].upper() + kalimat[1:])
+    return np.array(teks, dtype=object)[kembali.reshape(kode.shape)]
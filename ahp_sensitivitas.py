@@ -0,0 +1,213 @@
+"""Analisis sensitivitas bobot AHP dengan simulasi Monte Carlo.
+
+Ranking guru dihitung ulang untuk puluhan ribu vektor bobot hasil gangguan,
+sehingga terlihat seberapa rapuh urutan pada sheet Ranking terhadap bobot
+kriteria. Sampel bobot dibuat dengan dua cara:
+
+- 'dirichlet': bobot diambil dari distribusi Dirichlet berpusat di bobot
+  dasar; ``konsentrasi`` yang besar berarti gangguan kecil.
+- 'matriks': setiap judgment segitiga atas matriks perbandingan dikalikan
+  faktor log-normal (``sebaran`` = simpangan baku log), lalu bobot dihitung
+  ulang dengan eigenvector secara batch.
+
+Seluruh sampel satu chunk dinilai dengan satu perkalian matriks
+(S, K) x (K, N), dan frekuensi peringkat dijumlahkan per chunk sehingga
+memori tetap kecil. Chunk dapat dibagi ke beberapa proses worker.
+
+Contoh:
+    python ahp_sensitivitas.py --sampel 50000 --metode matriks --sebaran 0.2 --workers 4
+"""
+import argparse
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp, hitung_ahp_batch
+from ahp_ranking import DESIMAL_SERI, peringkat
+
+METODE = ('dirichlet', 'matriks')
+
+HasilSensitivitas = namedtuple(
+    'HasilSensitivitas',
+    ['peringkat_dasar', 'peluang_peringkat', 'peluang_tetap', 'rata_peringkat', 'rentang_peringkat', 'n_sampel'],
+)
+
+
+def sampel_dirichlet(rng, bobot, n_sampel, konsentrasi=100.0):
+    """Sampel bobot (S, K) dari Dirichlet dengan rata-rata ``bobot``"""
+    bobot = np.asarray(bobot, dtype=float)
+    return rng.dirichlet(konsentrasi * bobot / bobot.sum(), size=n_sampel)
+
+
+def matriks_resiprokal(matriks):
+    """Matriks (n, n) yang disusun ulang dari segitiga atasnya: a_ji = 1 / a_ij, diagonal 1"""
+    matriks = np.asarray(matriks, dtype=float)
+    n = matriks.shape[-1]
+    i, j = np.triu_indices(n, k=1)
+    hasil = np.ones((n, n))
+    hasil[i, j] = matriks[i, j]
+    hasil[j, i] = 1.0 / matriks[i, j]
+    return hasil
+
+
+def sampel_matriks(rng, matriks, n_sampel, sebaran=0.1):
+    """Sampel bobot (S, K) dari matriks perbandingan yang judgment-nya diganggu log-normal.
+
+    Hanya segitiga atas ``matriks`` yang dipakai; segitiga bawah setiap sampel
+    disusun ulang sebagai kebalikannya, seperti ``matriks_resiprokal``.
+    """
+    matriks = np.asarray(matriks, dtype=float)
+    n = matriks.shape[-1]
+    i, j = np.triu_indices(n, k=1)
+    atas = matriks[i, j] * np.exp(rng.normal(0.0, sebaran, (n_sampel, len(i))))
+    sampel = np.ones((n_sampel, n, n))
+    sampel[:, i, j] = atas
+    sampel[:, j, i] = 1.0 / atas
+    return hitung_ahp_batch(sampel).bobot
+
+
+def peringkat_batch(nilai, desimal=DESIMAL_SERI):
+    """Peringkat (1 = tertinggi) per baris dari nilai (S, N) dengan ``ahp_ranking.peringkat``.
+
+    Setiap baris menjadi satu kelompok, sehingga aturan seri dan NaN persis
+    sama dengan sheet Ranking.
+    """
+    nilai = np.asarray(nilai, dtype=float)
+    baris = np.repeat(np.arange(nilai.shape[0]), nilai.shape[1])
+    return peringkat(nilai.ravel(), kelompok=baris, desimal=desimal).reshape(nilai.shape)
+
+
+def frekuensi_peringkat(skor, bobot_sampel):
+    """Matriks frekuensi (N, N): berapa kali guru i menempati peringkat r+1 (guru seri berbagi peringkat)"""
+    nilai = bobot_sampel @ skor.T
+    n = skor.shape[0]
+    peringkat = peringkat_batch(nilai) - 1
+    indeks = np.arange(n)[np.newaxis, :] * n + peringkat
+    return np.bincount(indeks.ravel(), minlength=n * n).reshape(n, n)
+
+
+def _hitung_chunk(skor, n_sampel, metode, parameter, seed):
+    # Dijalankan di proses worker; setiap chunk punya seed turunan sendiri
+    rng = np.random.default_rng(seed)
+    if metode == 'dirichlet':
+        bobot = sampel_dirichlet(rng, parameter['bobot'], n_sampel, parameter['konsentrasi'])
+    else:
+        bobot = sampel_matriks(rng, parameter['matriks'], n_sampel, parameter['sebaran'])
+    return frekuensi_peringkat(skor, bobot)
+
+
+def _persentil_peringkat(peluang, q):
+    # Peringkat terkecil yang peluang kumulatifnya mencapai q, per guru
+    return np.argmax(np.cumsum(peluang, axis=1) >= q - 1e-12, axis=1) + 1
+
+
+def analisis_sensitivitas(
+    skor,
+    bobot=None,
+    matriks=None,
+    n_sampel=10000,
+    metode='dirichlet',
+    konsentrasi=100.0,
+    sebaran=0.1,
+    ukuran_chunk=5000,
+    workers=1,
+    seed=None,
+):
+    """Menghitung peluang setiap guru menempati setiap peringkat di bawah gangguan bobot.
+
+    ``skor`` berbentuk (n_guru, n_kriteria). Untuk metode 'dirichlet' dipakai
+    ``bobot`` (atau bobot eigenvector dari ``matriks``); metode 'matriks'
+    membutuhkan ``matriks`` perbandingan kriteria. Karena sampel metode
+    'matriks' hanya mengganggu segitiga atas, bobot dan peringkat dasarnya juga
+    dihitung dari matriks yang disusun ulang secara resiprokal. ``rentang_peringkat``
+    berisi peringkat persentil 5 dan 95 per guru.
+    """
+    if metode not in METODE:
+        raise ValueError(f'metode harus salah satu dari {list(METODE)}')
+    skor = np.asarray(skor, dtype=float)
+    if metode == 'matriks':
+        if matriks is None:
+            raise ValueError("metode 'matriks' membutuhkan matriks perbandingan")
+        matriks = matriks_resiprokal(matriks)
+    if bobot is None:
+        if matriks is None:
+            raise ValueError('bobot atau matriks harus diberikan')
+        bobot = hitung_ahp(matriks).bobot
+    bobot = np.asarray(bobot, dtype=float)
+    if skor.shape[1] != len(bobot):
+        raise ValueError(f'Jumlah kolom skor ({skor.shape[1]}) tidak sama dengan jumlah bobot ({len(bobot)})')
+
+    parameter = {'bobot': bobot, 'konsentrasi': konsentrasi, 'matriks': matriks, 'sebaran': sebaran}
+    ukuran = [min(ukuran_chunk, n_sampel - mulai) for mulai in range(0, n_sampel, ukuran_chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(ukuran))
+
+    frekuensi = np.zeros((len(skor), len(skor)), dtype=np.int64)
+    if workers == 1 or len(ukuran) == 1:
+        for n, s in zip(ukuran, seeds):
+            frekuensi += _hitung_chunk(skor, n, metode, parameter, s)
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [executor.submit(_hitung_chunk, skor, n, metode, parameter, s) for n, s in zip(ukuran, seeds)]
+            for future in futures:
+                frekuensi += future.result()
+
+    peluang = frekuensi / n_sampel
+    # Peringkat dasar sama dengan sheet Ranking (ahp_skor.ranking)
+    dasar = peringkat(skor @ (bobot / bobot.sum()))
+    rentang = np.stack([_persentil_peringkat(peluang, 0.05), _persentil_peringkat(peluang, 0.95)], axis=1)
+    return HasilSensitivitas(
+        dasar,
+        peluang,
+        peluang[np.arange(len(skor)), dasar - 1],
+        peluang @ np.arange(1, len(skor) + 1),
+        rentang,
+        n_sampel,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Analisis sensitivitas ranking guru terhadap bobot kriteria AHP')
+    parser.add_argument('--input', help='File JSON berisi list guru (format seperti GURU_DATA); default data contoh')
+    parser.add_argument('--sampel', type=int, default=10000, help='Jumlah vektor bobot yang disimulasikan')
+    parser.add_argument('--metode', choices=METODE, default='dirichlet')
+    parser.add_argument('--konsentrasi', type=float, default=100.0, help='Konsentrasi Dirichlet (besar = gangguan kecil)')
+    parser.add_argument('--sebaran', type=float, default=0.1, help='Simpangan baku log gangguan judgment (metode matriks)')
+    parser.add_argument('--chunk', type=int, default=5000, help='Jumlah sampel per chunk')
+    parser.add_argument('--workers', type=int, default=1, help='Jumlah proses worker (0 = jumlah CPU)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.input:
+        with open(args.input, encoding='utf-8') as f:
+            guru_list = json.load(f)
+    else:
+        from form_evaluasi_guru import GURU_DATA
+
+        guru_list = GURU_DATA
+
+    hasil = analisis_sensitivitas(
+        [guru['nilai'] for guru in guru_list],
+        matriks=MATRIKS_KRITERIA,
+        n_sampel=args.sampel,
+        metode=args.metode,
+        konsentrasi=args.konsentrasi,
+        sebaran=args.sebaran,
+        ukuran_chunk=args.chunk,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    print(f'{"Nama Guru":30s} {"Peringkat":>9s} {"P(tetap)":>9s} {"Rata-rata":>9s} {"P5-P95":>8s}')
+    for i in np.argsort(hasil.peringkat_dasar, kind='stable'):
+        guru = guru_list[i]
+        bawah, atas = hasil.rentang_peringkat[i]
+        print(
+            f"{guru['nama'][:30]:30s} {hasil.peringkat_dasar[i]:9d} {hasil.peluang_tetap[i]:9.1%} "
+            f"{hasil.rata_peringkat[i]:9.2f} {f'{bawah}-{atas}':>8s}"
+        )
+
+
+if __name__ == '__main__':
+    main()
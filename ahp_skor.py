@@ -0,0 +1,74 @@
+"""Perhitungan nilai akhir AHP seluruh guru dalam satu perkalian matriks.
+
+Nilai kriteria seluruh guru disusun sebagai array ``(n_guru, n_kriteria)``
+(atau ``(n_guru, n_indikator)`` bila memakai sub kriteria) lalu dikalikan
+dengan vektor bobot, sehingga puluhan ribu baris guru x periode selesai
+dalam satu operasi vektor.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from ahp_profil import span
+from ahp_ranking import BATAS_KATEGORI, KATEGORI_BELUM_DINILAI, NAMA_KATEGORI, kategori, peringkat
+
+HasilSkor = namedtuple('HasilSkor', ['nilai', 'ranking', 'kategori'])
+
+
+def bobot_global(bobot_kriteria, sub_bobot=None):
+    """Menurunkan bobot indikator (daun) dari bobot kriteria dan bobot sub kriteria.
+
+    ``sub_bobot`` adalah list sejajar dengan ``bobot_kriteria``; tiap elemen
+    berisi bobot sub kriteria (seperti kolom ``tm_sub_kriteria.bobot``, relatif
+    terhadap kriteria induk) atau None bila kriteria tidak memiliki sub kriteria.
+    Mengembalikan tuple (bobot_daun, indeks_induk).
+    """
+    bobot_kriteria = np.asarray(bobot_kriteria, dtype=float)
+    bobot_kriteria = bobot_kriteria / bobot_kriteria.sum()
+    if sub_bobot is None:
+        return bobot_kriteria, np.arange(len(bobot_kriteria))
+    if len(sub_bobot) != len(bobot_kriteria):
+        raise ValueError('Jumlah sub_bobot harus sama dengan jumlah kriteria')
+
+    daun = []
+    induk = []
+    for i, (bobot, sub) in enumerate(zip(bobot_kriteria, sub_bobot)):
+        if sub is None or len(sub) == 0:
+            daun.append(np.array([bobot]))
+            induk.append(np.array([i]))
+            continue
+        sub = np.asarray(sub, dtype=float)
+        daun.append(bobot * sub / sub.sum())
+        induk.append(np.full(len(sub), i))
+    return np.concatenate(daun), np.concatenate(induk)
+
+
+def hitung_nilai(skor, bobot):
+    """Menghitung nilai AHP (N,) dari skor (N, K) dan vektor bobot (K,)"""
+    skor = np.asarray(skor, dtype=float)
+    bobot = np.asarray(bobot, dtype=float)
+    if skor.shape[-1] != bobot.shape[-1]:
+        raise ValueError(f'Jumlah kolom skor ({skor.shape[-1]}) tidak sama dengan jumlah bobot ({bobot.shape[-1]})')
+    return skor @ (bobot / bobot.sum())
+
+
+def ranking(nilai):
+    """Mengembalikan peringkat (1 = tertinggi) untuk setiap nilai; nilai seri mendapat peringkat sama.
+
+    Aturan seri yang sama dipakai ``ahp_sensitivitas.peringkat_batch`` untuk
+    sampel bobot, sehingga peluang peringkat tetap sebanding dengan sheet Ranking.
+    """
+    return peringkat(nilai)
+
+
+def hitung_skor(skor, bobot_kriteria, sub_bobot=None):
+    """Menghitung nilai, ranking dan kategori seluruh guru dalam satu langkah vektor.
+
+    ``skor`` berbentuk (n_guru, n_kriteria), atau (n_guru, n_indikator) bila
+    ``sub_bobot`` diberikan dengan kolom berurutan sesuai kriteria induknya.
+    """
+    with span('skor', baris=len(skor)):
+        bobot, _ = bobot_global(bobot_kriteria, sub_bobot)
+        nilai = hitung_nilai(skor, bobot)
+    with span('ranking', baris=len(nilai)):
+        return HasilSkor(nilai, ranking(nilai), kategori(nilai))
@@ -0,0 +1,369 @@
+"""Tren nilai guru lintas periode dan tahun ajaran dari seluruh riwayat evaluasi.
+
+Baris tt_detail_evaluasi setiap periode dibaca bertahap per chunk (server-side
+cursor, ``fetchmany``) dan langsung diringkas menjadi jumlah, rata-rata dan
+varian berjalan per (guru, periode, kriteria). Statistik satu chunk dihitung
+sekaligus dengan NumPy, lalu digabung ke statistik sebelumnya dengan rumus
+gabungan Chan (bentuk paralel dari algoritma Welford), sehingga tidak ada
+nilai mentah yang disimpan dan hasilnya stabil secara numerik.
+
+Periode diproses satu per satu sesuai ``tanggal_mulai``. Yang disimpan di
+antara periode hanya rata-rata tertimbang terakhir setiap guru (untuk delta antar
+periode), akumulator tahun ajaran berjalan dan ringkasan tahun ajaran
+sebelumnya (untuk delta tahun ke tahun). Memori dibatasi oleh ukuran chunk
+dan jumlah guru x kriteria, bukan oleh panjang riwayat. Hasil ditulis
+bertahap ke dua file CSV:
+
+- ``tren_periode.csv``: satu baris per (guru, periode) berisi rata-rata
+  tertimbang, delta terhadap periode sebelumnya, serta rata-rata dan
+  simpangan baku setiap kriteria.
+- ``tren_tahunan.csv``: satu baris per (guru, tahun ajaran) dengan delta
+  rata-rata tertimbang dan setiap kriteria terhadap tahun ajaran sebelumnya.
+
+Rata-rata tertimbang adalah rata-rata per kriteria dikali bobot kriteria,
+tanpa pembagian role dan bobot sub kriteria, sehingga berbeda dengan
+``tt_hasil_evaluasi.nilai_akhir``; nilai akhir versi controller per periode
+tersedia lewat ``ahp_arsip``.
+
+Contoh:
+    python ahp_tren.py --output storage/app/tren
+    python ahp_tren.py --periode 1 2 3 4 --ukuran-chunk 20000
+"""
+import argparse
+import csv
+import os
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+
+from ahp_db import iter_query, koneksi_dari_env, muat_kriteria, placeholder
+from ahp_profil import profil, span
+
+OUTPUT_DIR = os.path.join('storage', 'app', 'tren')
+UKURAN_CHUNK = 20000
+# Tahun ajaran dimulai bulan Juli: periode yang mulai Juli 2024 - Juni 2025 masuk 2024/2025
+BULAN_AWAL_TAHUN_AJARAN = 7
+DESIMAL_CSV = 4
+
+Periode = namedtuple('Periode', ['id', 'judul', 'tanggal_mulai', 'tahun_ajaran'])
+StatistikNilai = namedtuple('StatistikNilai', ['guru_ids', 'kriteria_ids', 'jumlah', 'rata', 'simpangan_baku'])
+TrenPeriode = namedtuple('TrenPeriode', ['periode', 'statistik', 'rata_tertimbang', 'delta'])
+TrenTahunan = namedtuple('TrenTahunan', ['tahun_ajaran', 'statistik', 'rata_tertimbang', 'delta', 'delta_kriteria'])
+
+
+def tahun_ajaran(tanggal):
+    """Label tahun ajaran ('2024/2025') dari tanggal mulai periode (date atau 'YYYY-MM-DD')"""
+    if not isinstance(tanggal, date):
+        tanggal = date.fromisoformat(str(tanggal)[:10])
+    awal = tanggal.year if tanggal.month >= BULAN_AWAL_TAHUN_AJARAN else tanggal.year - 1
+    return f'{awal}/{awal + 1}'
+
+
+def daftar_periode(conn, periode_ids=None):
+    """Periode evaluasi terurut tanggal_mulai, opsional hanya ``periode_ids``"""
+    sql = 'SELECT id, judul, tanggal_mulai FROM tt_periode_evaluasi ORDER BY tanggal_mulai, id'
+    pilih = None if periode_ids is None else {int(p) for p in periode_ids}
+    return [
+        Periode(row[0], row[1], row[2], tahun_ajaran(row[2]))
+        for chunk in iter_query(conn, sql) for row in chunk
+        if pilih is None or row[0] in pilih
+    ]
+
+
+def iter_detail_periode(conn, periode_id, ukuran_chunk=UKURAN_CHUNK):
+    """Menghasilkan chunk detail satu periode sebagai array (guru_id, kriteria_id, nilai).
+
+    Tanpa ORDER BY agar database tidak perlu mengurutkan seluruh periode;
+    urutan baris tidak memengaruhi hasil statistik.
+    """
+    sql = (
+        'SELECT e.guru_id, de.kriteria_id, de.nilai '
+        'FROM tt_detail_evaluasi de '
+        'JOIN tt_evaluasi e ON de.evaluasi_id = e.id '
+        f'WHERE e.periode_evaluasi_id = {placeholder(conn)}'
+    )
+    for chunk in iter_query(conn, sql, (periode_id,), ukuran_chunk):
+        guru, kriteria, nilai = zip(*chunk)
+        yield (
+            np.asarray(guru, dtype=np.int64),
+            np.asarray(kriteria, dtype=np.int64),
+            np.asarray(nilai, dtype=float),
+        )
+
+
+def gabung_statistik(a, b):
+    """Menggabungkan dua ringkasan (kunci, n, rata, m2) dengan rumus Chan.
+
+    ``kunci`` setiap ringkasan terurut dan unik; ``m2`` adalah jumlah kuadrat
+    selisih terhadap rata-rata. Kunci yang hanya ada di salah satu sisi
+    disalin apa adanya.
+    """
+    kunci_a, n_a, rata_a, m2_a = a
+    kunci_b, n_b, rata_b, m2_b = b
+    kunci = np.union1d(kunci_a, kunci_b)
+    n = np.zeros(len(kunci), dtype=np.int64)
+    rata = np.zeros(len(kunci))
+    m2 = np.zeros(len(kunci))
+    ia = np.searchsorted(kunci, kunci_a)
+    n[ia], rata[ia], m2[ia] = n_a, rata_a, m2_a
+
+    ib = np.searchsorted(kunci, kunci_b)
+    n_lama = n[ib]
+    n_baru = n_lama + n_b
+    delta = rata_b - rata[ib]
+    rata[ib] += delta * n_b / n_baru
+    m2[ib] += m2_b + delta ** 2 * n_lama * n_b / n_baru
+    n[ib] = n_baru
+    return kunci, n, rata, m2
+
+
+class StatistikOnline:
+    """Jumlah, rata-rata dan varian berjalan per (guru, kriteria), diisi per chunk"""
+
+    def __init__(self, kriteria_ids):
+        self.kriteria_ids = np.asarray(kriteria_ids, dtype=np.int64)
+        # Kunci = guru_id x n_kriteria + indeks kriteria, terurut
+        self._ringkasan = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0), np.empty(0))
+
+    def __len__(self):
+        return len(self._ringkasan[0])
+
+    def tambah(self, guru, kriteria, nilai):
+        """Menambahkan satu chunk detail; kriteria di luar ``kriteria_ids`` dan nilai NaN diabaikan"""
+        guru = np.asarray(guru, dtype=np.int64)
+        kriteria = np.asarray(kriteria, dtype=np.int64)
+        nilai = np.asarray(nilai, dtype=float)
+        n_kriteria = len(self.kriteria_ids)
+        idx_kriteria = np.minimum(np.searchsorted(self.kriteria_ids, kriteria), n_kriteria - 1)
+        valid = (self.kriteria_ids[idx_kriteria] == kriteria) & ~np.isnan(nilai)
+        if not valid.any():
+            return self
+
+        nilai = nilai[valid]
+        unik, kembali = np.unique(guru[valid] * n_kriteria + idx_kriteria[valid], return_inverse=True)
+        n = np.bincount(kembali, minlength=len(unik))
+        rata = np.bincount(kembali, nilai, len(unik)) / n
+        m2 = np.bincount(kembali, (nilai - rata[kembali]) ** 2, len(unik))
+        self._ringkasan = gabung_statistik(self._ringkasan, (unik, n, rata, m2))
+        return self
+
+    def gabung(self, lain):
+        """Menggabungkan akumulator lain dengan kriteria yang sama (mis. periode ke tahun ajaran)"""
+        if not np.array_equal(self.kriteria_ids, lain.kriteria_ids):
+            raise ValueError('Kriteria kedua akumulator tidak sama')
+        self._ringkasan = gabung_statistik(self._ringkasan, lain._ringkasan)
+        return self
+
+    def hasil(self):
+        """StatistikNilai berbentuk (n_guru, n_kriteria); NaN untuk sel tanpa nilai.
+
+        Simpangan baku memakai pembagi n - 1 (sampel), NaN bila n < 2.
+        """
+        kunci, n, rata, m2 = self._ringkasan
+        n_kriteria = len(self.kriteria_ids)
+        guru_ids, idx_guru = np.unique(kunci // n_kriteria, return_inverse=True)
+        idx_kriteria = kunci % n_kriteria
+        bentuk = (len(guru_ids), n_kriteria)
+
+        jumlah = np.zeros(bentuk, dtype=np.int64)
+        rata_sel = np.full(bentuk, np.nan)
+        sb = np.full(bentuk, np.nan)
+        jumlah[idx_guru, idx_kriteria] = n
+        rata_sel[idx_guru, idx_kriteria] = rata
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sb[idx_guru, idx_kriteria] = np.where(n > 1, np.sqrt(m2 / np.maximum(n - 1, 1)), np.nan)
+        return StatistikNilai(guru_ids, self.kriteria_ids, jumlah, rata_sel, sb)
+
+
+def rata_tertimbang(rata, bobot):
+    """Rata-rata tertimbang (N,) dari rata-rata per kriteria (N, K), NaN bila guru belum dinilai.
+
+    Kriteria tanpa nilai tidak ikut dihitung dan bobot kriteria lainnya
+    dinormalisasi ulang. Bukan nilai akhir controller (tanpa role dan sub
+    kriteria), hanya ukuran tren yang konsisten antar periode.
+    """
+    ada = ~np.isnan(rata)
+    total_bobot = (ada * bobot).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total_bobot > 0, np.where(ada, rata, 0.0) @ bobot / np.where(total_bobot > 0, total_bobot, 1), np.nan)
+
+
+def _selisih(guru_lama, nilai_lama, guru_baru, nilai_baru):
+    # Selisih nilai_baru terhadap nilai guru yang sama di ringkasan lama (NaN bila belum ada)
+    if len(guru_lama) == 0:
+        return np.full(nilai_baru.shape, np.nan)
+    posisi = np.minimum(np.searchsorted(guru_lama, guru_baru), len(guru_lama) - 1)
+    ada = guru_lama[posisi] == guru_baru
+    sebelum = nilai_lama[posisi]
+    if nilai_baru.ndim > 1:
+        ada = ada[:, np.newaxis]
+    return np.where(ada, nilai_baru - sebelum, np.nan)
+
+
+def _perbarui_terakhir(guru_lama, nilai_lama, guru_baru, nilai_baru):
+    # Nilai terakhir per guru; guru yang tidak dinilai pada periode ini mempertahankan nilai lamanya
+    guru = np.union1d(guru_lama, guru_baru)
+    nilai = np.full(len(guru), np.nan)
+    nilai[np.searchsorted(guru, guru_lama)] = nilai_lama
+    baru = np.searchsorted(guru, guru_baru)
+    nilai[baru] = np.where(np.isnan(nilai_baru), nilai[baru], nilai_baru)
+    return guru, nilai
+
+
+def _tutup_tahun(label, akumulator, bobot, sebelumnya):
+    statistik = akumulator.hasil()
+    nilai = rata_tertimbang(statistik.rata, bobot)
+    if sebelumnya is None:
+        delta = np.full(len(nilai), np.nan)
+        delta_kriteria = np.full(statistik.rata.shape, np.nan)
+    else:
+        delta = _selisih(sebelumnya.statistik.guru_ids, sebelumnya.rata_tertimbang, statistik.guru_ids, nilai)
+        delta_kriteria = _selisih(sebelumnya.statistik.guru_ids, sebelumnya.statistik.rata, statistik.guru_ids, statistik.rata)
+    return TrenTahunan(label, statistik, nilai, delta, delta_kriteria)
+
+
+def iter_tren(conn, periode=None, kriteria_ids=None, bobot=None, ukuran_chunk=UKURAN_CHUNK):
+    """Menghasilkan TrenPeriode untuk setiap periode, dan TrenTahunan setiap kali satu
+    tahun ajaran selesai diproses.
+
+    ``periode`` berupa list Periode (default: semua periode dari
+    ``daftar_periode``). Bobot diambil dari tm_kriteria bila tidak diberikan.
+    ``TrenPeriode.delta`` adalah selisih rata-rata tertimbang terhadap periode terakhir
+    guru tersebut dinilai; ``TrenTahunan.delta`` dan ``delta_kriteria``
+    terhadap tahun ajaran sebelumnya.
+    """
+    if kriteria_ids is None or bobot is None:
+        ids, _, bobot_db = muat_kriteria(conn)
+        kriteria_ids = ids if kriteria_ids is None else kriteria_ids
+        bobot = bobot_db if bobot is None else bobot
+    kriteria_ids = np.asarray(kriteria_ids, dtype=np.int64)
+    bobot = np.asarray(bobot, dtype=float)
+    if len(bobot) != len(kriteria_ids):
+        raise ValueError(f'Jumlah bobot ({len(bobot)}) tidak sama dengan jumlah kriteria ({len(kriteria_ids)})')
+    bobot = bobot / bobot.sum()
+    periode = daftar_periode(conn) if periode is None else periode
+
+    guru_terakhir = np.empty(0, dtype=np.int64)
+    nilai_terakhir = np.empty(0)
+    tahun = None
+    akumulator_tahun = None
+    tahun_sebelumnya = None
+    for p in periode:
+        if p.tahun_ajaran != tahun:
+            if akumulator_tahun is not None:
+                with span('tahunan', baris=len(akumulator_tahun), tahun_ajaran=tahun):
+                    tahun_sebelumnya = _tutup_tahun(tahun, akumulator_tahun, bobot, tahun_sebelumnya)
+                yield tahun_sebelumnya
+            tahun = p.tahun_ajaran
+            akumulator_tahun = StatistikOnline(kriteria_ids)
+
+        with span('muat', periode_id=p.id) as s:
+            akumulator = StatistikOnline(kriteria_ids)
+            baris = 0
+            for guru, kriteria, nilai in iter_detail_periode(conn, p.id, ukuran_chunk):
+                akumulator.tambah(guru, kriteria, nilai)
+                baris += len(nilai)
+            s.baris = baris
+        with span('skor', periode_id=p.id):
+            statistik = akumulator.hasil()
+            nilai = rata_tertimbang(statistik.rata, bobot)
+            delta = _selisih(guru_terakhir, nilai_terakhir, statistik.guru_ids, nilai)
+            guru_terakhir, nilai_terakhir = _perbarui_terakhir(guru_terakhir, nilai_terakhir, statistik.guru_ids, nilai)
+            akumulator_tahun.gabung(akumulator)
+        yield TrenPeriode(p, statistik, nilai, delta)
+
+    if akumulator_tahun is not None:
+        with span('tahunan', baris=len(akumulator_tahun), tahun_ajaran=tahun):
+            tahun_akhir = _tutup_tahun(tahun, akumulator_tahun, bobot, tahun_sebelumnya)
+        yield tahun_akhir
+
+
+def _angka(nilai):
+    return '' if np.isnan(nilai) else round(float(nilai), DESIMAL_CSV)
+
+
+def header_periode(nama_kriteria):
+    """Header CSV tren_periode: identitas, rata-rata tertimbang, lalu rata-rata dan simpangan baku per kriteria"""
+    header = ['guru_id', 'periode_id', 'periode', 'tahun_ajaran', 'jumlah_detail', 'rata_tertimbang', 'delta_rata_tertimbang']
+    for nama in nama_kriteria:
+        header += [f'rata {nama}', f'sb {nama}']
+    return header
+
+
+def header_tahunan(nama_kriteria):
+    """Header CSV tren_tahunan: rata-rata tertimbang tahunan dan delta tahun ke tahun per kriteria"""
+    header = ['guru_id', 'tahun_ajaran', 'jumlah_detail', 'rata_tertimbang', 'delta_rata_tertimbang']
+    for nama in nama_kriteria:
+        header += [f'rata {nama}', f'sb {nama}', f'delta {nama}']
+    return header
+
+
+def iter_baris_periode(tren):
+    """Baris CSV tren_periode dari satu TrenPeriode"""
+    statistik = tren.statistik
+    jumlah = statistik.jumlah.sum(axis=1)
+    for i, guru_id in enumerate(statistik.guru_ids.tolist()):
+        row = [guru_id, tren.periode.id, tren.periode.judul, tren.periode.tahun_ajaran, int(jumlah[i]), _angka(tren.rata_tertimbang[i]), _angka(tren.delta[i])]
+        for rata, sb in zip(statistik.rata[i], statistik.simpangan_baku[i]):
+            row += [_angka(rata), _angka(sb)]
+        yield row
+
+
+def iter_baris_tahunan(tren):
+    """Baris CSV tren_tahunan dari satu TrenTahunan"""
+    statistik = tren.statistik
+    jumlah = statistik.jumlah.sum(axis=1)
+    for i, guru_id in enumerate(statistik.guru_ids.tolist()):
+        row = [guru_id, tren.tahun_ajaran, int(jumlah[i]), _angka(tren.rata_tertimbang[i]), _angka(tren.delta[i])]
+        for rata, sb, delta in zip(statistik.rata[i], statistik.simpangan_baku[i], tren.delta_kriteria[i]):
+            row += [_angka(rata), _angka(sb), _angka(delta)]
+        yield row
+
+
+def tulis_tren(conn, output_dir=OUTPUT_DIR, periode_ids=None, ukuran_chunk=UKURAN_CHUNK):
+    """Menulis tren_periode.csv dan tren_tahunan.csv secara bertahap.
+
+    Mengembalikan (path_periode, path_tahunan, jumlah_periode, jumlah_tahun).
+    """
+    kriteria_ids, nama_kriteria, bobot = muat_kriteria(conn)
+    if len(kriteria_ids) == 0:
+        raise ValueError('Tidak ada kriteria aktif di tm_kriteria')
+    periode = daftar_periode(conn, periode_ids)
+    os.makedirs(output_dir, exist_ok=True)
+    path_periode = os.path.join(output_dir, 'tren_periode.csv')
+    path_tahunan = os.path.join(output_dir, 'tren_tahunan.csv')
+
+    jumlah_periode = jumlah_tahun = 0
+    with open(path_periode, 'w', newline='', encoding='utf-8') as f_periode, open(path_tahunan, 'w', newline='', encoding='utf-8') as f_tahunan:
+        csv_periode = csv.writer(f_periode)
+        csv_tahunan = csv.writer(f_tahunan)
+        csv_periode.writerow(header_periode(nama_kriteria))
+        csv_tahunan.writerow(header_tahunan(nama_kriteria))
+        for tren in iter_tren(conn, periode, kriteria_ids, bobot, ukuran_chunk):
+            with span('tulis', baris=len(tren.statistik.guru_ids)):
+                if isinstance(tren, TrenPeriode):
+                    csv_periode.writerows(iter_baris_periode(tren))
+                    jumlah_periode += 1
+                else:
+                    csv_tahunan.writerows(iter_baris_tahunan(tren))
+                    jumlah_tahun += 1
+    return path_periode, path_tahunan, jumlah_periode, jumlah_tahun
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tren nilai guru per periode dan tahun ajaran dari seluruh riwayat evaluasi')
+    parser.add_argument('--output', default=OUTPUT_DIR, help='Folder output CSV')
+    parser.add_argument('--periode', type=int, nargs='*', help='ID periode evaluasi (default: semua)')
+    parser.add_argument('--ukuran-chunk', type=int, default=UKURAN_CHUNK, help='Jumlah baris detail per fetchmany')
+    args = parser.parse_args(argv)
+
+    conn = koneksi_dari_env()
+    with profil('tren'):
+        path_periode, path_tahunan, jumlah_periode, jumlah_tahun = tulis_tren(conn, args.output, args.periode, args.ukuran_chunk)
+    print(f'{jumlah_periode} periode -> {path_periode}')
+    print(f'{jumlah_tahun} tahun ajaran -> {path_tahunan}')
+
+
+if __name__ == '__main__':
+    main()
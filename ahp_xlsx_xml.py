@@ -0,0 +1,193 @@
+"""Penulis XLSX cepat: XML sheet dialirkan langsung ke dalam kontainer zip.
+
+Backend alternatif untuk ``ahp_excel.tulis_laporan_streaming`` pada ekspor
+besar. Tidak ada objek sel per nilai; setiap baris langsung dirangkai menjadi
+potongan XML SpreadsheetML dan ditulis ke entri zip secara bertahap. Tabel
+style (judul, header biru 4472C4, border tipis, format 0.00) sudah dihitung
+sebelumnya dan sama dengan named style di ``ahp_excel.buat_named_styles``,
+sehingga tampilan workbook identik dengan hasil openpyxl.
+"""
+import math
+import zipfile
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+# Indeks cellXfs di styles.xml untuk setiap nama style ahp_excel
+STYLE_XF = {'judul': 1, 'header': 2, 'isi_tengah': 3, 'isi_kiri': 4, 'angka_tengah': 5, 'angka_kanan': 6}
+
+# Level deflate rendah: ukuran file sedikit lebih besar, tetapi kompresi tidak menjadi bottleneck
+LEVEL_KOMPRESI = 1
+BARIS_PER_TULIS = 2000
+
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+XML_DEKLARASI = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_TENGAH = '<alignment horizontal="center" vertical="center"/>'
+STYLES_XML = (
+    XML_DEKLARASI
+    + f'<styleSheet xmlns="{NS_MAIN}">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><color theme="1"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><b/><sz val="14"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><color rgb="00FFFFFF"/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="3">'
+    '<fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="004472C4"/><bgColor rgb="004472C4"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="7">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    f'<xf numFmtId="0" fontId="2" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">{_TENGAH}</xf>'
+    f'<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1" applyAlignment="1">{_TENGAH}</xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="left" vertical="center"/></xf>'
+    f'<xf numFmtId="2" fontId="0" fillId="0" borderId="1" xfId="0" applyNumberFormat="1" applyBorder="1" applyAlignment="1">{_TENGAH}</xf>'
+    '<xf numFmtId="2" fontId="0" fillId="0" borderId="1" xfId="0" applyNumberFormat="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="right" vertical="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def huruf_kolom(indeks):
+    """Huruf kolom Excel untuk indeks kolom berbasis 1 (1 -> A, 27 -> AA)"""
+    huruf = ''
+    while indeks:
+        indeks, sisa = divmod(indeks - 1, 26)
+        huruf = chr(65 + sisa) + huruf
+    return huruf
+
+
+def _sel(nilai, s):
+    # s adalah atribut style siap pakai, mis. ' s="5"'
+    if nilai is None or nilai == '':
+        return f'<c{s}/>'
+    if isinstance(nilai, str):
+        spasi = ' xml:space="preserve"' if nilai[:1].isspace() or nilai[-1:].isspace() else ''
+        return f'<c{s} t="inlineStr"><is><t{spasi}>{escape(nilai)}</t></is></c>'
+    if isinstance(nilai, bool):
+        return f'<c{s} t="b"><v>{int(nilai)}</v></c>'
+    nilai = float(nilai) if not isinstance(nilai, int) else nilai
+    if isinstance(nilai, float) and not math.isfinite(nilai):
+        return f'<c{s}/>'
+    return f'<c{s}><v>{nilai!r}</v></c>'
+
+
+def _xml_sheet(f, judul, headers, lebar_kolom, styles, rows):
+    # Menulis satu worksheet ke file zip yang terbuka; mengembalikan jumlah baris data
+    f.write((XML_DEKLARASI + f'<worksheet xmlns="{NS_MAIN}" xmlns:r="{NS_REL}">').encode())
+    if lebar_kolom:
+        cols = ''.join(f'<col min="{i}" max="{i}" width="{lebar}" customWidth="1"/>' for i, lebar in enumerate(lebar_kolom, 1))
+        f.write(f'<cols>{cols}</cols>'.encode())
+    f.write(b'<sheetData>')
+
+    nomor = 0
+    bagian = []
+    s_judul = f' s="{STYLE_XF["judul"]}"'
+    for teks in judul:
+        nomor += 1
+        bagian.append(f'<row r="{nomor}">{_sel(teks, s_judul)}</row>')
+    # Satu baris kosong di antara judul dan header, seperti ws.append([]) di ahp_excel
+    nomor += 2
+    s_header = f' s="{STYLE_XF["header"]}"'
+    bagian.append(f'<row r="{nomor}">' + ''.join(_sel(h, s_header) for h in headers) + '</row>')
+
+    atribut = [f' s="{STYLE_XF[style]}"' for style in styles]
+    jumlah = 0
+    for row_data in rows:
+        nomor += 1
+        jumlah += 1
+        bagian.append(f'<row r="{nomor}">' + ''.join([_sel(v, a) for v, a in zip(row_data, atribut)]) + '</row>')
+        if len(bagian) >= BARIS_PER_TULIS:
+            f.write(''.join(bagian).encode())
+            bagian = []
+    bagian.append('</sheetData>')
+
+    kolom_akhir = huruf_kolom(len(headers))
+    if judul:
+        bagian.append(f'<mergeCells count="{len(judul)}">')
+        bagian.extend(f'<mergeCell ref="A{i}:{kolom_akhir}{i}"/>' for i in range(1, len(judul) + 1))
+        bagian.append('</mergeCells>')
+    bagian.append('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/></worksheet>')
+    f.write(''.join(bagian).encode())
+    return jumlah
+
+
+def _bagian_tetap(titles):
+    n = len(titles)
+    sheet_types = ''.join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, n + 1)
+    )
+    content_types = (
+        XML_DEKLARASI
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+        f'{sheet_types}</Types>'
+    )
+    rels = (
+        XML_DEKLARASI
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>'
+        '</Relationships>'
+    )
+    sekarang = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    core = (
+        XML_DEKLARASI
+        + '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+        'xmlns:dcterms="http://purl.org/dc/terms/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+        f'<dcterms:created xsi:type="dcterms:W3CDTF">{sekarang}</dcterms:created>'
+        f'<dcterms:modified xsi:type="dcterms:W3CDTF">{sekarang}</dcterms:modified>'
+        '</cp:coreProperties>'
+    )
+    sheets = ''.join(f'<sheet name="{escape(t)}" sheetId="{i}" r:id="rId{i}"/>' for i, t in enumerate(titles, 1))
+    workbook = XML_DEKLARASI + f'<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}"><sheets>{sheets}</sheets></workbook>'
+    workbook_rels = (
+        XML_DEKLARASI
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        + ''.join(
+            f'<Relationship Id="rId{i}" Type="{NS_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>' for i in range(1, n + 1)
+        )
+        + f'<Relationship Id="rId{n + 1}" Type="{NS_REL}/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    )
+    return {
+        '[Content_Types].xml': content_types,
+        '_rels/.rels': rels,
+        'docProps/core.xml': core,
+        'xl/workbook.xml': workbook,
+        'xl/_rels/workbook.xml.rels': workbook_rels,
+        'xl/styles.xml': STYLES_XML,
+    }
+
+
+def tulis_workbook(path, sheets):
+    """Menulis workbook dari list (title, judul, headers, lebar_kolom, styles, rows).
+
+    Format ``sheets`` sama dengan ``ahp_excel.daftar_sheet``; ``rows`` boleh
+    berupa generator. Mengembalikan list jumlah baris data per sheet.
+    """
+    jumlah = []
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=LEVEL_KOMPRESI) as zf:
+        for nama, isi in _bagian_tetap([sheet[0] for sheet in sheets]).items():
+            zf.writestr(nama, isi)
+        for i, (_, judul, headers, lebar_kolom, styles, rows) in enumerate(sheets, 1):
+            with zf.open(f'xl/worksheets/sheet{i}.xml', 'w', force_zip64=True) as f:
+                jumlah.append(_xml_sheet(f, judul, headers, lebar_kolom, styles, rows))
+    return jumlah
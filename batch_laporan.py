@@ -0,0 +1,152 @@
+"""Render laporan per guru (form DOCX + ringkasan XLSX) secara paralel.
+
+Rendering python-docx/openpyxl bersifat CPU-bound, sehingga guru dibagi ke
+dalam chunk dan dikerjakan oleh ProcessPoolExecutor agar semua core terpakai.
+
+Contoh:
+    python batch_laporan.py --input guru.json --output laporan/ --workers 8 --chunk 20
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from ahp_engine import MATRIKS_KRITERIA, NAMA_KRITERIA, hitung_ahp
+from ahp_excel import tulis_ringkasan_guru
+from ahp_profil import profil, span
+from ahp_skor import hitung_nilai
+from form_evaluasi_guru import GURU_DATA, buat_dokumen
+
+
+def nama_file_aman(nama):
+    """Nama file aman dari nama guru, sama seperti export di HasilEvaluasiController"""
+    return re.sub(r'[^a-zA-Z0-9_-]', '_', nama.lower())
+
+
+def nama_file_guru(guru, nomor=None):
+    """Nama file laporan satu guru tanpa ekstensi: nama ditambah NIP (atau id / nomor urut).
+
+    Guru dengan nama sama tidak saling menimpa file laporannya.
+    """
+    pembeda = guru.get('nip') or guru.get('id') or nomor
+    nama = 'evaluasi_' + nama_file_aman(guru['nama'])
+    return nama if pembeda in (None, '') else f'{nama}_{nama_file_aman(str(pembeda))}'
+
+
+def lengkapi_nilai_ahp(guru_list, bobot):
+    """Mengisi nilai_ahp yang belum ada dengan satu perkalian matriks untuk seluruh guru"""
+    kosong = [guru for guru in guru_list if guru.get('nilai_ahp') is None]
+    if kosong:
+        with span('skor', baris=len(kosong)):
+            nilai = hitung_nilai([guru['nilai'] for guru in kosong], bobot)
+        for guru, n in zip(kosong, nilai):
+            guru['nilai_ahp'] = round(float(n), 2)
+    return guru_list
+
+
+def render_guru(guru, output_dir, nama_kriteria, bobot, nomor=None):
+    """Menyimpan form DOCX dan ringkasan XLSX untuk satu guru"""
+    base = os.path.join(output_dir, nama_file_guru(guru, nomor))
+    guru = dict(guru, komentar=guru.get('komentar', []))
+    with span('docx', baris=1):
+        buat_dokumen([guru]).save(base + '.docx')
+    with span('xlsx', baris=1):
+        tulis_ringkasan_guru(base + '.xlsx', guru['nama'], guru['mapel'], nama_kriteria, bobot, guru['nilai'])
+    return base + '.docx', base + '.xlsx'
+
+
+def render_chunk(chunk, output_dir, nama_kriteria, bobot):
+    """Dijalankan di proses worker: render satu chunk (nomor, guru), kembalikan durasi per guru"""
+    hasil = []
+    with span('render', baris=len(chunk)):
+        for nomor, guru in chunk:
+            mulai = time.perf_counter()
+            render_guru(guru, output_dir, nama_kriteria, bobot, nomor)
+            hasil.append((guru['nama'], time.perf_counter() - mulai))
+    return hasil
+
+
+def bagi_chunk(items, ukuran):
+    """Membagi list menjadi potongan berukuran ``ukuran``"""
+    return [items[i:i + ukuran] for i in range(0, len(items), ukuran)]
+
+
+def render_batch(guru_list, output_dir, workers=None, ukuran_chunk=10, nama_kriteria=None, bobot=None, progress=None):
+    """Render laporan seluruh guru, paralel bila ``workers`` > 1.
+
+    Mengembalikan ringkasan waktu: jumlah guru, durasi total, rata-rata per
+    guru dan throughput (guru/detik).
+    """
+    nama_kriteria = NAMA_KRITERIA if nama_kriteria is None else nama_kriteria
+    with span('bobot'):
+        bobot = hitung_ahp(MATRIKS_KRITERIA).bobot if bobot is None else np.asarray(bobot, dtype=float)
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    lengkapi_nilai_ahp(guru_list, bobot)
+
+    mulai = time.perf_counter()
+    durasi_guru = []
+    chunks = bagi_chunk(list(enumerate(guru_list, 1)), max(1, ukuran_chunk))
+    if workers == 1:
+        for chunk in chunks:
+            durasi_guru.extend(render_chunk(chunk, output_dir, nama_kriteria, bobot))
+            if progress:
+                progress(len(durasi_guru), len(guru_list))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(render_chunk, chunk, output_dir, nama_kriteria, bobot) for chunk in chunks]
+            for future in as_completed(futures):
+                durasi_guru.extend(future.result())
+                if progress:
+                    progress(len(durasi_guru), len(guru_list))
+    total = time.perf_counter() - mulai
+
+    return {
+        'jumlah_guru': len(guru_list),
+        'workers': workers,
+        'ukuran_chunk': ukuran_chunk,
+        'durasi_total': total,
+        'rata_per_guru': float(np.mean([d for _, d in durasi_guru])) if durasi_guru else 0.0,
+        'guru_per_detik': len(guru_list) / total if total > 0 else 0.0,
+    }
+
+
+def _cetak_progress(selesai, total):
+    print(f'\r[{selesai}/{total}] laporan guru selesai', end='', file=sys.stderr, flush=True)
+    if selesai == total:
+        print(file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render form DOCX dan ringkasan XLSX per guru secara paralel')
+    parser.add_argument('--input', help='File JSON berisi list guru (format seperti GURU_DATA); default data contoh')
+    parser.add_argument('--output', default='laporan_guru', help='Folder output')
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah proses worker (default: jumlah CPU)')
+    parser.add_argument('--chunk', type=int, default=10, help='Jumlah guru per tugas worker')
+    args = parser.parse_args(argv)
+
+    with profil('batch'):
+        with span('muat') as s:
+            if args.input:
+                with open(args.input, encoding='utf-8') as f:
+                    guru_list = json.load(f)
+            else:
+                guru_list = [dict(guru) for guru in GURU_DATA]
+            s.baris = len(guru_list)
+
+        ringkasan = render_batch(guru_list, args.output, workers=args.workers, ukuran_chunk=args.chunk, progress=_cetak_progress)
+    print(
+        f"{ringkasan['jumlah_guru']} laporan guru dibuat di {args.output} "
+        f"dalam {ringkasan['durasi_total']:.2f} detik "
+        f"({ringkasan['guru_per_detik']:.1f} guru/detik, {ringkasan['workers']} worker, "
+        f"rata-rata {ringkasan['rata_per_guru'] * 1000:.0f} ms per guru)"
+    )
+
+
+if __name__ == '__main__':
+    main()
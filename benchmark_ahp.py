@@ -0,0 +1,296 @@
+"""Benchmark pipeline AHP: bobot, skor, ranking, ekspor XLSX (openpyxl dan XML langsung) dan render DOCX.
+
+Data sintetis dibuat untuk N guru, K kriteria dan M matriks evaluator. Setiap
+(tahap, ukuran) dijalankan di proses anak tersendiri agar tahap lain tidak
+ikut menaikkan RSS puncaknya. ``rss_puncak_mb`` masih mencakup interpreter,
+modul yang diimpor dan data sintetis; memori tambahan tahap itu sendiri
+dicatat sebagai ``rss_tahap_mb`` (selisih RSS puncak sesudah dan sebelum
+tahap). Tahap yang gagal atau melewati ``--batas-waktu`` dicatat dengan field
+``error`` tanpa menghentikan tahap lain. Hasil disimpan sebagai JSON dan dapat
+dibandingkan dengan hasil versi sebelumnya untuk melihat regresi.
+
+Contoh:
+    python benchmark_ahp.py --ukuran 10 100 1000 10000 100000
+    python benchmark_ahp.py --bandingkan storage/app/benchmark/ahp_lama.json
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import queue as queue_lib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+UKURAN_DEFAULT = [10, 100, 1000, 10000, 100000]
+TAHAP = ['bobot', 'skor', 'ranking', 'xlsx', 'xlsx_xml', 'docx']
+OUTPUT_DIR = os.path.join('storage', 'app', 'benchmark')
+
+# Batas ukuran default untuk tahap yang lambat, agar satu run tetap wajar
+MAKS_DEFAULT = {'xlsx': 100000, 'xlsx_xml': 100000, 'docx': 1000}
+# Batas waktu satu (tahap, ukuran) sebelum proses anak dihentikan (detik)
+BATAS_WAKTU_DEFAULT = 1800
+
+
+def matriks_acak(rng, m, k):
+    """M matriks perbandingan resiprokal acak berskala Saaty, bentuk (M, K, K)"""
+    skala = np.array([1 / 9, 1 / 7, 1 / 5, 1 / 3, 1, 3, 5, 7, 9])
+    matriks = np.ones((m, k, k))
+    i, j = np.triu_indices(k, k=1)
+    atas = rng.choice(skala, (m, len(i)))
+    matriks[:, i, j] = atas
+    matriks[:, j, i] = 1.0 / atas
+    return matriks
+
+
+def data_sintetis(n_guru, n_kriteria=5, n_evaluator=None, seed=0):
+    """Data uji: skor (N, K), matriks evaluator (M, K, K) dan identitas guru"""
+    rng = np.random.default_rng(seed)
+    n_evaluator = n_guru if n_evaluator is None else n_evaluator
+    return {
+        'skor': np.round(rng.uniform(60, 100, (n_guru, n_kriteria)), 2),
+        'matriks': matriks_acak(rng, n_evaluator, n_kriteria),
+        'nama': [f'Guru Sintetis {i + 1}, S.Pd' for i in range(n_guru)],
+        'mapel': [f'Mapel {i % 12 + 1}' for i in range(n_guru)],
+    }
+
+
+def _tahap_bobot(data, tmpdir):
+    from ahp_engine import hitung_ahp_batch
+
+    hitung_ahp_batch(data['matriks'])
+    return len(data['matriks'])
+
+
+def _tahap_skor(data, tmpdir):
+    from ahp_skor import hitung_skor
+
+    bobot = np.full(data['skor'].shape[1], 1 / data['skor'].shape[1])
+    hitung_skor(data['skor'], bobot)
+    return len(data['skor'])
+
+
+def _tahap_ranking(data, tmpdir):
+    from ahp_ranking import peringkat, rekomendasi, top_k
+    from ahp_skor import hitung_nilai
+
+    bobot = np.full(data['skor'].shape[1], 1 / data['skor'].shape[1])
+    nilai = hitung_nilai(data['skor'], bobot)
+    peringkat(nilai, data['mapel'])
+    top_k(nilai, 10, data['mapel'])
+    top_k(nilai, 10, data['mapel'], terbawah=True)
+    rekomendasi(data['skor'], [f'Kriteria {i + 1}' for i in range(data['skor'].shape[1])], bobot)
+    return len(data['skor'])
+
+
+def _tahap_xlsx(data, tmpdir, backend='openpyxl'):
+    from ahp_excel import iter_baris_hasil, iter_baris_ranking, tulis_laporan_streaming
+    from ahp_skor import hitung_nilai
+
+    bobot = np.full(data['skor'].shape[1], 1 / data['skor'].shape[1])
+    nilai = hitung_nilai(data['skor'], bobot)
+    guru = zip(data['nama'], data['mapel'], data['skor'])
+    jumlah, _ = tulis_laporan_streaming(
+        os.path.join(tmpdir, 'bench.xlsx'), iter_baris_hasil(guru, bobot), iter_baris_ranking(data['nama'], nilai), backend=backend
+    )
+    return jumlah
+
+
+def _tahap_xlsx_xml(data, tmpdir):
+    return _tahap_xlsx(data, tmpdir, backend='xml')
+
+
+def _tahap_docx(data, tmpdir):
+    from form_evaluasi_guru import KRITERIA_FORM, buat_dokumen
+
+    if data['skor'].shape[1] != len(KRITERIA_FORM):
+        raise ValueError(f'tahap docx membutuhkan {len(KRITERIA_FORM)} kriteria sesuai form, bukan {data["skor"].shape[1]}')
+    guru_list = [
+        {'nama': nama, 'nip': str(i), 'mapel': mapel, 'kelas': '-', 'nilai': list(skor), 'nilai_ahp': float(skor.mean()), 'komentar': []}
+        for i, (nama, mapel, skor) in enumerate(zip(data['nama'], data['mapel'], data['skor']))
+    ]
+    buat_dokumen(guru_list).save(os.path.join(tmpdir, 'bench.docx'))
+    return len(guru_list)
+
+
+FUNGSI_TAHAP = {
+    'bobot': _tahap_bobot,
+    'skor': _tahap_skor,
+    'ranking': _tahap_ranking,
+    'xlsx': _tahap_xlsx,
+    'xlsx_xml': _tahap_xlsx_xml,
+    'docx': _tahap_docx,
+}
+
+# Modul yang diimpor sebelum pengukuran, agar waktu impor tidak ikut terhitung
+MODUL_TAHAP = {
+    'bobot': ['ahp_engine'],
+    'skor': ['ahp_skor'],
+    'ranking': ['ahp_ranking', 'ahp_skor'],
+    'xlsx': ['ahp_excel', 'ahp_skor'],
+    'xlsx_xml': ['ahp_excel', 'ahp_skor', 'ahp_xlsx_xml'],
+    'docx': ['form_evaluasi_guru'],
+}
+
+
+def _rss_puncak_mb():
+    # ru_maxrss dalam KiB di Linux, byte di macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def _jalankan_anak(tahap, n_guru, n_kriteria, n_evaluator, queue):
+    try:
+        data = data_sintetis(n_guru, n_kriteria, n_evaluator)
+        for modul in MODUL_TAHAP[tahap]:
+            importlib.import_module(modul)
+        rss_awal = _rss_puncak_mb()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mulai = time.perf_counter()
+            baris = FUNGSI_TAHAP[tahap](data, tmpdir)
+            durasi = time.perf_counter() - mulai
+        rss_puncak = _rss_puncak_mb()
+    except Exception as exc:
+        queue.put({'error': f'{type(exc).__name__}: {exc}'})
+        return
+    queue.put({
+        'durasi': durasi, 'baris': baris, 'rss_puncak_mb': rss_puncak, 'rss_awal_mb': rss_awal, 'rss_tahap_mb': rss_puncak - rss_awal,
+    })
+
+
+def _tunggu_hasil(proses, queue, batas_waktu):
+    # Proses anak yang mati (mis. OOM killer) tidak pernah mengisi queue, jadi queue.get() tanpa batas bisa menggantung
+    tenggat = time.monotonic() + batas_waktu
+    while True:
+        try:
+            return queue.get(timeout=1)
+        except queue_lib.Empty:
+            pass
+        if not proses.is_alive():
+            try:
+                return queue.get(timeout=1)
+            except queue_lib.Empty:
+                return {'error': f'proses anak berhenti dengan exitcode {proses.exitcode}'}
+        if time.monotonic() > tenggat:
+            proses.terminate()
+            return {'error': f'melewati batas waktu {batas_waktu} detik'}
+
+
+def ukur(tahap, n_guru, n_kriteria=5, n_evaluator=None, batas_waktu=BATAS_WAKTU_DEFAULT):
+    """Mengukur satu tahap di proses anak; mengembalikan dict waktu, RSS dan baris/detik.
+
+    Bila tahap gagal, proses anak mati atau melewati ``batas_waktu`` detik,
+    dict berisi ``error`` dan nilai pengukuran None.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proses = ctx.Process(target=_jalankan_anak, args=(tahap, n_guru, n_kriteria, n_evaluator, queue))
+    proses.start()
+    hasil = _tunggu_hasil(proses, queue, batas_waktu)
+    proses.join()
+    if 'error' in hasil:
+        hasil.update(dict.fromkeys(['durasi', 'baris', 'rss_puncak_mb', 'rss_awal_mb', 'rss_tahap_mb']))
+    hasil.update({
+        'tahap': tahap,
+        'n_guru': n_guru,
+        'n_kriteria': n_kriteria,
+        'n_evaluator': n_guru if n_evaluator is None else n_evaluator,
+        'baris_per_detik': hasil['baris'] / hasil['durasi'] if hasil['durasi'] else None,
+    })
+    return hasil
+
+
+def metadata():
+    """Informasi lingkungan yang disimpan bersama hasil benchmark"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'waktu': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu': os.cpu_count(),
+    }
+
+
+def bandingkan(hasil_baru, hasil_lama, toleransi=0.2):
+    """Daftar regresi: (tahap, n_guru, durasi_lama, durasi_baru) yang lebih lambat dari toleransi"""
+    lama = {(h['tahap'], h['n_guru']): h for h in hasil_lama['hasil']}
+    regresi = []
+    for h in hasil_baru['hasil']:
+        sebelumnya = lama.get((h['tahap'], h['n_guru']))
+        if not sebelumnya or h.get('error') or sebelumnya.get('error'):
+            continue
+        if h['durasi'] > sebelumnya['durasi'] * (1 + toleransi):
+            regresi.append((h['tahap'], h['n_guru'], sebelumnya['durasi'], h['durasi']))
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark bobot, skor, XLSX dan DOCX untuk berbagai jumlah guru')
+    parser.add_argument('--ukuran', type=int, nargs='+', default=UKURAN_DEFAULT, help='Jumlah guru yang diuji')
+    parser.add_argument('--tahap', nargs='+', choices=TAHAP, default=TAHAP)
+    parser.add_argument('--kriteria', type=int, default=5, help='Jumlah kriteria (K)')
+    parser.add_argument('--evaluator', type=int, default=None, help='Jumlah matriks evaluator (M), default = jumlah guru')
+    parser.add_argument('--maks-xlsx', type=int, default=MAKS_DEFAULT['xlsx'])
+    parser.add_argument('--maks-xlsx-xml', type=int, default=MAKS_DEFAULT['xlsx_xml'])
+    parser.add_argument('--maks-docx', type=int, default=MAKS_DEFAULT['docx'])
+    parser.add_argument('--batas-waktu', type=float, default=BATAS_WAKTU_DEFAULT, help='Batas waktu per tahap dan ukuran (detik)')
+    parser.add_argument('--output', default=None, help='File JSON hasil (default storage/app/benchmark/ahp_<waktu>.json)')
+    parser.add_argument('--bandingkan', default=None, help='File JSON hasil sebelumnya untuk deteksi regresi')
+    parser.add_argument('--toleransi', type=float, default=0.2, help='Batas perlambatan relatif sebelum dianggap regresi')
+    args = parser.parse_args(argv)
+
+    maks = {'xlsx': args.maks_xlsx, 'xlsx_xml': args.maks_xlsx_xml, 'docx': args.maks_docx}
+    daftar_tahap = list(args.tahap)
+    if 'docx' in daftar_tahap:
+        from form_evaluasi_guru import KRITERIA_FORM
+
+        if args.kriteria != len(KRITERIA_FORM):
+            print(f'Tahap docx dilewati: form hanya memiliki {len(KRITERIA_FORM)} kriteria, bukan {args.kriteria}')
+            daftar_tahap.remove('docx')
+    hasil = []
+    for tahap in daftar_tahap:
+        for n in args.ukuran:
+            if n > maks.get(tahap, n):
+                continue
+            h = ukur(tahap, n, args.kriteria, args.evaluator, args.batas_waktu)
+            hasil.append(h)
+            if h.get('error'):
+                print(f"{tahap:8s} n={n:>7d}  GAGAL: {h['error']}")
+                continue
+            print(
+                f"{tahap:8s} n={n:>7d}  {h['durasi']:9.4f} s  {h['baris_per_detik'] or 0:12.0f} baris/s  "
+                f"RSS puncak {h['rss_puncak_mb']:7.1f} MB (tahap +{h['rss_tahap_mb']:.1f} MB)"
+            )
+
+    laporan = {'metadata': metadata(), 'hasil': hasil}
+    output = args.output or os.path.join(OUTPUT_DIR, f"ahp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(laporan, f, indent=2)
+    print(f'Hasil benchmark tersimpan di: {output}')
+
+    if args.bandingkan:
+        with open(args.bandingkan, encoding='utf-8') as f:
+            regresi = bandingkan(laporan, json.load(f), args.toleransi)
+        for tahap, n, lama, baru in regresi:
+            print(f'REGRESI {tahap} n={n}: {lama:.4f} s -> {baru:.4f} s')
+        if regresi:
+            sys.exit(1)
+    if any(h.get('error') for h in hasil):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,5 @@
+import copy
+
 from docx import Document
 from docx.shared import Inches, Pt, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -6,6 +8,88 @@ from docx.oxml.shared import OxmlElement, qn
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
 
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp
+from ahp_profil import profil, span
+from ahp_skor import hitung_nilai
+
+OUTPUT_PATH = '/Users/flashcode/Documents/project-destra/Form_Evaluasi_Guru_Terisi_SMP_PENIDA_KATAPANG_FIX.docx'
+
+# Data evaluator (sudah diisi)
+EVALUATOR_DATA = [
+    ['Nama Evaluator', ':', 'Dr. H. Asep Suryadi, M.Pd', ''],
+    ['Jabatan', ':', 'Kepala Sekolah', ''],
+    ['Tanggal Evaluasi', ':', '15 Januari 2025', ''],
+    ['Periode Evaluasi', ':', 'Semester 1 / Tahun 2024/2025', '']
+]
+
+NAMA_SEKOLAH = 'SMP PENIDA KATAPANG'
+TAHUN_AKADEMIK = 'TAHUN AKADEMIK 2024/2025'
+
+# Tabel tanda tangan (sudah diisi)
+TANDA_TANGAN_DATA = [
+    ['Evaluator', 'Kepala Sekolah'],
+    ['', ''],
+    ['', ''],
+    ['(Dr. H. Asep Suryadi, M.Pd)', '(Dr. H. Asep Suryadi, M.Pd)']
+]
+
+KRITERIA_FORM = [
+    'Kedisiplinan\n(Ketepatan waktu, kehadiran)',
+    'Penguasaan Materi\n(Kemampuan mengajar)',
+    'Metode Mengajar\n(Variasi dan kreativitas)',
+    'Komunikasi\n(Interaksi dengan siswa)',
+    'Evaluasi Pembelajaran\n(Sistem penilaian)',
+]
+
+HEADERS_KRITERIA = ['No', 'Kriteria Evaluasi', 'Sangat Baik (90-100)', 'Baik (80-89)', 'Cukup (70-79)', 'Kurang (<70)']
+
+# Data guru yang dievaluasi - nilai kriteria berdasarkan nilai Excel
+GURU_DATA = [
+    {
+        'nama': 'Budi Santoso, S.Pd',
+        'nip': '196805121990031005',
+        'mapel': 'IPA (Ilmu Pengetahuan Alam)',
+        'kelas': 'VII A, VII B, VIII A',
+        'nilai': [80, 95, 90, 85, 80],
+        'komentar': [
+            "Guru Budi Santoso menunjukkan kinerja yang sangat baik dengan nilai AHP {nilai_ahp:.2f}.",
+            "Keunggulan: Penguasaan materi sangat baik dan metode mengajar yang inovatif.",
+            "Rekomendasi: Pertahankan kinerja dan jadikan mentor untuk guru lain.",
+            "Perlu sedikit perbaikan dalam hal kedisiplinan dan evaluasi pembelajaran."
+        ],
+    },
+    {
+        'nama': 'Siti Nurhaliza, S.Pd',
+        'nip': '197203151998022003',
+        'mapel': 'Bahasa Indonesia',
+        'kelas': 'VII C, VIII B, IX A',
+        'nilai': [90, 85, 85, 80, 90],
+        'komentar': [
+            "Guru Siti Nurhaliza menunjukkan kinerja yang baik dengan nilai AHP {nilai_ahp:.2f}.",
+            "Keunggulan: Kedisiplinan sangat baik dan sistem evaluasi pembelajaran yang efektif.",
+            "Rekomendasi: Tingkatkan variasi metode mengajar dan penguasaan materi.",
+            "Komunikasi dengan siswa perlu lebih ditingkatkan untuk hasil yang optimal."
+        ],
+    },
+]
+
+
+def _isi_nilai_ahp(guru_list):
+    # Nilai AHP dari bobot eigenvector matriks K1-K5, sama seperti sheet Evaluasi Guru di ahp_evaluasi_guru
+    nilai = hitung_nilai([guru['nilai'] for guru in guru_list], hitung_ahp(MATRIKS_KRITERIA).bobot)
+    for guru, nilai_ahp in zip(guru_list, nilai):
+        guru['nilai_ahp'] = round(float(nilai_ahp), 2)
+        guru['komentar'] = [baris.format(nilai_ahp=guru['nilai_ahp']) for baris in guru['komentar']]
+
+
+_isi_nilai_ahp(GURU_DATA)
+
+PLACEHOLDER_KOMENTAR = '{komentar}'
+
+# Template XML per proses; semua dokumen memakai template default python-docx yang sama
+_TEMPLATE_CACHE = {}
+
+
 def add_border_to_paragraph(paragraph):
     """Menambahkan border ke paragraph"""
     p = paragraph._element
@@ -17,97 +101,22 @@ def add_border_to_paragraph(paragraph):
     pBdr.set(qn('w:right'), qn('w:single'))
     pPr.append(pBdr)
 
-def create_form_evaluasi():
-    # Membuat dokumen baru
-    doc = Document()
-    
-    # Set margin dokumen
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Cm(2)
-        section.bottom_margin = Cm(2)
-        section.left_margin = Cm(2)
-        section.right_margin = Cm(2)
-    
-    # Header dokumen
-    header = doc.add_heading('FORM EVALUASI KINERJA GURU', 0)
-    header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    header_run = header.runs[0]
-    header_run.font.size = Pt(16)
-    header_run.font.name = 'Arial'
-    header_run.bold = True
-    
-    # Sub header
-    subheader = doc.add_paragraph('SMP PENIDA KATAPANG')
-    subheader.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subheader_run = subheader.runs[0]
-    subheader_run.font.size = Pt(14)
-    subheader_run.font.name = 'Arial'
-    subheader_run.bold = True
-    
-    # Tahun akademik
-    tahun = doc.add_paragraph('TAHUN AKADEMIK 2024/2025')
-    tahun.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    tahun_run = tahun.runs[0]
-    tahun_run.font.size = Pt(12)
-    tahun_run.font.name = 'Arial'
-    
-    # Line break
-    doc.add_paragraph()
-    
-    # Informasi evaluator (sudah diisi)
-    info_table = doc.add_table(rows=4, cols=4)
-    info_table.style = 'Table Grid'
-    info_table.alignment = WD_TABLE_ALIGNMENT.LEFT
-    
-    # Data evaluator
-    evaluator_data = [
-        ['Nama Evaluator', ':', 'Dr. H. Asep Suryadi, M.Pd', ''],
-        ['Jabatan', ':', 'Kepala Sekolah', ''],
-        ['Tanggal Evaluasi', ':', '15 Januari 2025', ''],
-        ['Periode Evaluasi', ':', 'Semester 1 / Tahun 2024/2025', '']
-    ]
-    
-    for i, row_data in enumerate(evaluator_data):
-        for j, cell_data in enumerate(row_data):
-            cell = info_table.cell(i, j)
-            cell.text = cell_data
-            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            # Bold untuk data yang sudah diisi
-            if j == 2 and cell_data:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.bold = True
-            if j == 0:
-                cell.width = Inches(2)
-            elif j == 1:
-                cell.width = Inches(0.3)
-            else:
-                cell.width = Inches(2.5)
-    
-    doc.add_paragraph()
-    
-    # GURU 1 - Budi Santoso (Ranking tertinggi)
-    guru1_header = doc.add_heading('EVALUASI GURU 1', level=1)
-    guru1_header.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    guru1_run = guru1_header.runs[0]
-    guru1_run.font.size = Pt(14)
-    guru1_run.font.name = 'Arial'
-    
-    # Data Guru 1 (sudah diisi)
-    guru1_table = doc.add_table(rows=4, cols=4)
-    guru1_table.style = 'Table Grid'
-    
-    guru1_data = [
-        ['Nama Guru', ':', 'Budi Santoso, S.Pd', ''],
-        ['NIP/NUPTK', ':', '196805121990031005', ''],
-        ['Mata Pelajaran', ':', 'IPA (Ilmu Pengetahuan Alam)', ''],
-        ['Kelas yang Diampu', ':', 'VII A, VII B, VIII A', '']
-    ]
-    
-    for i, row_data in enumerate(guru1_data):
+
+def kolom_band(nilai):
+    """Indeks kolom band nilai: 0 Sangat Baik, 1 Baik, 2 Cukup, 3 Kurang"""
+    if nilai >= 90:
+        return 0
+    if nilai >= 80:
+        return 1
+    if nilai >= 70:
+        return 2
+    return 3
+
+
+def _isi_tabel_identitas(table, data):
+    for i, row_data in enumerate(data):
         for j, cell_data in enumerate(row_data):
-            cell = guru1_table.cell(i, j)
+            cell = table.cell(i, j)
             cell.text = cell_data
             cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
             # Bold untuk data yang sudah diisi
@@ -121,24 +130,41 @@ def create_form_evaluasi():
                 cell.width = Inches(0.3)
             else:
                 cell.width = Inches(2.5)
-    
-    # Kriteria Evaluasi Guru 1
+
+
+def _bangun_bagian_guru(doc):
+    """Membangun bagian evaluasi satu guru berisi placeholder; dipakai sekali sebagai template"""
+    guru_header = doc.add_heading('EVALUASI GURU {nomor}', level=1)
+    guru_header.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    guru_run = guru_header.runs[0]
+    guru_run.font.size = Pt(14)
+    guru_run.font.name = 'Arial'
+
+    # Data guru
+    guru_table = doc.add_table(rows=4, cols=4)
+    guru_table.style = 'Table Grid'
+    _isi_tabel_identitas(guru_table, [
+        ['Nama Guru', ':', '{nama}', ''],
+        ['NIP/NUPTK', ':', '{nip}', ''],
+        ['Mata Pelajaran', ':', '{mapel}', ''],
+        ['Kelas yang Diampu', ':', '{kelas}', '']
+    ])
+
+    # Kriteria evaluasi
     doc.add_paragraph()
-    kriteria_header1 = doc.add_paragraph('KRITERIA EVALUASI:')
-    kriteria_run1 = kriteria_header1.runs[0]
-    kriteria_run1.font.size = Pt(12)
-    kriteria_run1.font.name = 'Arial'
-    kriteria_run1.bold = True
-    
-    # Tabel evaluasi Guru 1 dengan data terisi
-    eval_table1 = doc.add_table(rows=7, cols=6)
-    eval_table1.style = 'Table Grid'
-    eval_table1.alignment = WD_TABLE_ALIGNMENT.CENTER
-    
+    kriteria_header = doc.add_paragraph('KRITERIA EVALUASI:')
+    kriteria_run = kriteria_header.runs[0]
+    kriteria_run.font.size = Pt(12)
+    kriteria_run.font.name = 'Arial'
+    kriteria_run.bold = True
+
+    eval_table = doc.add_table(rows=len(KRITERIA_FORM) + 2, cols=6)
+    eval_table.style = 'Table Grid'
+    eval_table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
     # Header tabel evaluasi
-    headers = ['No', 'Kriteria Evaluasi', 'Sangat Baik (90-100)', 'Baik (80-89)', 'Cukup (70-79)', 'Kurang (<70)']
-    for j, header in enumerate(headers):
-        cell = eval_table1.cell(0, j)
+    for j, header in enumerate(HEADERS_KRITERIA):
+        cell = eval_table.cell(0, j)
         cell.text = header
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
         for paragraph in cell.paragraphs:
@@ -146,20 +172,18 @@ def create_form_evaluasi():
                 run.font.bold = True
                 run.font.size = Pt(10)
             paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Data kriteria evaluasi Guru 1 (Budi Santoso) - sudah terisi berdasarkan nilai Excel
-    kriteria_eval1 = [
-        ['1', 'Kedisiplinan\n(Ketepatan waktu, kehadiran)', '□', '☑', '□', '□'],  # 80
-        ['2', 'Penguasaan Materi\n(Kemampuan mengajar)', '☑', '□', '□', '□'],    # 95
-        ['3', 'Metode Mengajar\n(Variasi dan kreativitas)', '☑', '□', '□', '□'], # 90
-        ['4', 'Komunikasi\n(Interaksi dengan siswa)', '□', '☑', '□', '□'],       # 85
-        ['5', 'Evaluasi Pembelajaran\n(Sistem penilaian)', '□', '☑', '□', '□'],  # 80
-        ['', 'TOTAL NILAI AHP', '', '', '87.0', '']
+
+    # Baris kriteria dengan placeholder checkbox, baris terakhir total nilai AHP
+    kriteria_eval = [
+        [str(i), kriteria] + ['{cek_%d_%d}' % (i, j) for j in range(4)]
+        for i, kriteria in enumerate(KRITERIA_FORM, 1)
     ]
-    
-    for i, row_data in enumerate(kriteria_eval1, 1):
+    kriteria_eval.append(['', 'TOTAL NILAI AHP', '', '', '{nilai_ahp}', ''])
+    baris_total = len(kriteria_eval)
+
+    for i, row_data in enumerate(kriteria_eval, 1):
         for j, cell_data in enumerate(row_data):
-            cell = eval_table1.cell(i, j)
+            cell = eval_table.cell(i, j)
             cell.text = cell_data
             cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
             for paragraph in cell.paragraphs:
@@ -167,164 +191,151 @@ def create_form_evaluasi():
                     run.font.size = Pt(9)
                 if j == 0 or j > 1:
                     paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
+
             # Bold untuk total dan highlight nilai
-            if i == 6 or (j == 4 and i == 6):
+            if i == baris_total:
                 for paragraph in cell.paragraphs:
                     for run in paragraph.runs:
                         run.font.bold = True
                         if j == 4:  # Nilai AHP
                             run.font.size = Pt(12)
-    
-    # Komentar Guru 1 (sudah diisi)
+
+    # Komentar, satu paragraph placeholder yang digandakan per baris komentar
     doc.add_paragraph()
-    comment1 = doc.add_paragraph('KOMENTAR DAN SARAN:')
-    comment1_run = comment1.runs[0]
-    comment1_run.font.size = Pt(12)
-    comment1_run.font.name = 'Arial'
-    comment1_run.bold = True
-    
-    # Komentar terisi
-    comment_text1 = [
-        "Guru Budi Santoso menunjukkan kinerja yang sangat baik dengan nilai AHP 87.0.",
-        "Keunggulan: Penguasaan materi sangat baik dan metode mengajar yang inovatif.",
-        "Rekomendasi: Pertahankan kinerja dan jadikan mentor untuk guru lain.",
-        "Perlu sedikit perbaikan dalam hal kedisiplinan dan evaluasi pembelajaran."
-    ]
-    
-    for text in comment_text1:
-        line = doc.add_paragraph(text)
-        line_run = line.runs[0]
-        line_run.font.size = Pt(10)
-    
-    # Page break
-    doc.add_page_break()
-    
-    # GURU 2 - Siti Nurhaliza (Ranking kedua)
-    guru2_header = doc.add_heading('EVALUASI GURU 2', level=1)
-    guru2_header.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    guru2_run = guru2_header.runs[0]
-    guru2_run.font.size = Pt(14)
-    guru2_run.font.name = 'Arial'
-    
-    # Data Guru 2 (sudah diisi)
-    guru2_table = doc.add_table(rows=4, cols=4)
-    guru2_table.style = 'Table Grid'
-    
-    guru2_data = [
-        ['Nama Guru', ':', 'Siti Nurhaliza, S.Pd', ''],
-        ['NIP/NUPTK', ':', '197203151998022003', ''],
-        ['Mata Pelajaran', ':', 'Bahasa Indonesia', ''],
-        ['Kelas yang Diampu', ':', 'VII C, VIII B, IX A', '']
-    ]
-    
-    for i, row_data in enumerate(guru2_data):
-        for j, cell_data in enumerate(row_data):
-            cell = guru2_table.cell(i, j)
-            cell.text = cell_data
-            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            # Bold untuk data yang sudah diisi
-            if j == 2 and cell_data:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.bold = True
-            if j == 0:
-                cell.width = Inches(2)
-            elif j == 1:
-                cell.width = Inches(0.3)
-            else:
-                cell.width = Inches(2.5)
-    
-    # Kriteria Evaluasi Guru 2
+    comment = doc.add_paragraph('KOMENTAR DAN SARAN:')
+    comment_run = comment.runs[0]
+    comment_run.font.size = Pt(12)
+    comment_run.font.name = 'Arial'
+    comment_run.bold = True
+
+    line = doc.add_paragraph(PLACEHOLDER_KOMENTAR)
+    line_run = line.runs[0]
+    line_run.font.size = Pt(10)
+
+
+def _ambil_template(doc, builder):
+    """Menjalankan builder lalu melepas elemen body yang dihasilkannya sebagai template XML"""
+    body = doc.element.body
+    awal = len(body)
+    builder(doc)
+    # sectPr selalu elemen terakhir body, elemen baru disisipkan sebelumnya
+    template = list(body)[awal - 1:len(body) - 1]
+    for elem in template:
+        body.remove(elem)
+    return template
+
+
+def _template(doc, nama, builder):
+    """Mengambil template XML dari cache, membangunnya sekali bila belum ada"""
+    if nama not in _TEMPLATE_CACHE:
+        _TEMPLATE_CACHE[nama] = _ambil_template(doc, builder)
+    return _TEMPLATE_CACHE[nama]
+
+
+def data_template_guru(nomor, guru):
+    """Menyusun nilai placeholder untuk satu guru"""
+    data = {
+        'nomor': nomor,
+        'nama': guru['nama'],
+        'nip': guru['nip'],
+        'mapel': guru['mapel'],
+        'kelas': guru['kelas'],
+        'nilai_ahp': f"{guru['nilai_ahp']:.2f}",
+    }
+    for i, nilai in enumerate(guru['nilai'], 1):
+        band = kolom_band(nilai)
+        for j in range(4):
+            data['cek_%d_%d' % (i, j)] = '☑' if j == band else '□'
+    return data
+
+
+def _isi_template(template, data, komentar):
+    """Menggandakan elemen template dan mengganti placeholder teks dengan data guru"""
+    hasil = []
+    for elem in template:
+        salinan = copy.deepcopy(elem)
+        teks = [t for t in salinan.iter(qn('w:t')) if t.text and '{' in t.text]
+        if any(t.text == PLACEHOLDER_KOMENTAR for t in teks):
+            for baris in komentar:
+                paragraf = copy.deepcopy(elem)
+                next(t for t in paragraf.iter(qn('w:t')) if t.text == PLACEHOLDER_KOMENTAR).text = baris
+                hasil.append(paragraf)
+            continue
+        for t in teks:
+            t.text = t.text.format_map(data)
+        hasil.append(salinan)
+    return hasil
+
+
+def buat_dokumen(guru_list):
+    """Membangun Document form evaluasi untuk daftar guru tanpa menyimpannya"""
+    # Membuat dokumen baru
+    doc = Document()
+
+    # Set margin dokumen
+    sections = doc.sections
+    for section in sections:
+        section.top_margin = Cm(2)
+        section.bottom_margin = Cm(2)
+        section.left_margin = Cm(2)
+        section.right_margin = Cm(2)
+
+    # Header dokumen
+    header = doc.add_heading('FORM EVALUASI KINERJA GURU', 0)
+    header.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    header_run = header.runs[0]
+    header_run.font.size = Pt(16)
+    header_run.font.name = 'Arial'
+    header_run.bold = True
+
+    # Sub header
+    subheader = doc.add_paragraph(NAMA_SEKOLAH)
+    subheader.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subheader_run = subheader.runs[0]
+    subheader_run.font.size = Pt(14)
+    subheader_run.font.name = 'Arial'
+    subheader_run.bold = True
+
+    # Tahun akademik
+    tahun = doc.add_paragraph(TAHUN_AKADEMIK)
+    tahun.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    tahun_run = tahun.runs[0]
+    tahun_run.font.size = Pt(12)
+    tahun_run.font.name = 'Arial'
+
+    # Line break
     doc.add_paragraph()
-    kriteria_header2 = doc.add_paragraph('KRITERIA EVALUASI:')
-    kriteria_run2 = kriteria_header2.runs[0]
-    kriteria_run2.font.size = Pt(12)
-    kriteria_run2.font.name = 'Arial'
-    kriteria_run2.bold = True
-    
-    # Tabel evaluasi Guru 2 dengan data terisi
-    eval_table2 = doc.add_table(rows=7, cols=6)
-    eval_table2.style = 'Table Grid'
-    eval_table2.alignment = WD_TABLE_ALIGNMENT.CENTER
-    
-    # Header tabel evaluasi Guru 2
-    for j, header in enumerate(headers):
-        cell = eval_table2.cell(0, j)
-        cell.text = header
-        cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for paragraph in cell.paragraphs:
-            for run in paragraph.runs:
-                run.font.bold = True
-                run.font.size = Pt(10)
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Data kriteria evaluasi Guru 2 (Siti Nurhaliza) - sudah terisi berdasarkan nilai Excel
-    kriteria_eval2 = [
-        ['1', 'Kedisiplinan\n(Ketepatan waktu, kehadiran)', '☑', '□', '□', '□'],  # 90
-        ['2', 'Penguasaan Materi\n(Kemampuan mengajar)', '□', '☑', '□', '□'],    # 85
-        ['3', 'Metode Mengajar\n(Variasi dan kreativitas)', '□', '☑', '□', '□'], # 85
-        ['4', 'Komunikasi\n(Interaksi dengan siswa)', '□', '☑', '□', '□'],       # 80
-        ['5', 'Evaluasi Pembelajaran\n(Sistem penilaian)', '☑', '□', '□', '□'],  # 90
-        ['', 'TOTAL NILAI AHP', '', '', '86.0', '']
-    ]
-    
-    for i, row_data in enumerate(kriteria_eval2, 1):
-        for j, cell_data in enumerate(row_data):
-            cell = eval_table2.cell(i, j)
-            cell.text = cell_data
-            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.size = Pt(9)
-                if j == 0 or j > 1:
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Bold untuk total dan highlight nilai
-            if i == 6 or (j == 4 and i == 6):
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.bold = True
-                        if j == 4:  # Nilai AHP
-                            run.font.size = Pt(12)
-    
-    # Komentar Guru 2 (sudah diisi)
+
+    # Informasi evaluator (sudah diisi)
+    info_table = doc.add_table(rows=4, cols=4)
+    info_table.style = 'Table Grid'
+    info_table.alignment = WD_TABLE_ALIGNMENT.LEFT
+    _isi_tabel_identitas(info_table, EVALUATOR_DATA)
+
     doc.add_paragraph()
-    comment2 = doc.add_paragraph('KOMENTAR DAN SARAN:')
-    comment2_run = comment2.runs[0]
-    comment2_run.font.size = Pt(12)
-    comment2_run.font.name = 'Arial'
-    comment2_run.bold = True
-    
-    # Komentar terisi
-    comment_text2 = [
-        "Guru Siti Nurhaliza menunjukkan kinerja yang baik dengan nilai AHP 86.0.",
-        "Keunggulan: Kedisiplinan sangat baik dan sistem evaluasi pembelajaran yang efektif.",
-        "Rekomendasi: Tingkatkan variasi metode mengajar dan penguasaan materi.",
-        "Komunikasi dengan siswa perlu lebih ditingkatkan untuk hasil yang optimal."
-    ]
-    
-    for text in comment_text2:
-        line = doc.add_paragraph(text)
-        line_run = line.runs[0]
-        line_run.font.size = Pt(10)
-    
+
+    # Bagian per guru dibangun sekali sebagai template XML, lalu digandakan untuk setiap guru
+    template = _template(doc, 'bagian_guru', _bangun_bagian_guru)
+    page_break = _template(doc, 'page_break', lambda d: d.add_page_break())
+
+    body = doc.element.body
+    sect_pr = body[-1]
+    for nomor, guru in enumerate(guru_list, 1):
+        elemen = _isi_template(template, data_template_guru(nomor, guru), guru['komentar'])
+        if nomor > 1:
+            elemen = [copy.deepcopy(elem) for elem in page_break] + elemen
+        for elem in elemen:
+            sect_pr.addprevious(elem)
+
     # Footer dengan tanda tangan
     doc.add_paragraph()
     doc.add_paragraph()
-    
+
     # Tabel tanda tangan (sudah diisi)
-    signature_table = doc.add_table(rows=4, cols=2)
+    signature_table = doc.add_table(rows=len(TANDA_TANGAN_DATA), cols=2)
     signature_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    
-    signature_data = [
-        ['Evaluator', 'Kepala Sekolah'],
-        ['', ''],
-        ['', ''],
-        ['(Dr. H. Asep Suryadi, M.Pd)', '(Dr. H. Asep Suryadi, M.Pd)']
-    ]
-    
-    for i, row_data in enumerate(signature_data):
+
+    for i, row_data in enumerate(TANDA_TANGAN_DATA):
         for j, cell_data in enumerate(row_data):
             cell = signature_table.cell(i, j)
             cell.text = cell_data
@@ -334,11 +345,20 @@ def create_form_evaluasi():
                     run.font.size = Pt(11)
                     if i == 0 or i == 3:
                         run.font.bold = True
-    
-    # Save dokumen
-    doc.save('/Users/flashcode/Documents/project-destra/Form_Evaluasi_Guru_Terisi_SMP_PENIDA_KATAPANG_FIX.docx')
+
+    return doc
+
+
+def create_form_evaluasi(guru_list=None, output_path=OUTPUT_PATH):
+    guru_list = GURU_DATA if guru_list is None else guru_list
+    with span('docx', baris=len(guru_list)):
+        doc = buat_dokumen(guru_list)
+
+        # Save dokumen
+        doc.save(output_path)
     print('Form evaluasi guru (sudah terisi) berhasil dibuat!')
-    print('File tersimpan di: /Users/flashcode/Documents/project-destra/Form_Evaluasi_Guru_Terisi_SMP_PENIDA_KATAPANG_FIX.docx')
+    print(f'File tersimpan di: {output_path}')
 
 if __name__ == "__main__":
-    create_form_evaluasi()
\ No newline at end of file
+    with profil('form'):
+        create_form_evaluasi()
@@ -0,0 +1,396 @@
+"""Render form evaluasi guru ke PDF tanpa Word/LibreOffice.
+
+Isi form sama dengan ``form_evaluasi_guru``: tabel evaluator dan identitas
+guru, tabel kriteria dengan checkbox empat rentang nilai, total nilai AHP,
+komentar dan tanda tangan. Halaman ditulis langsung sebagai objek PDF (font
+standar Helvetica, tanpa embedding) dan dialirkan ke file satu per satu;
+yang disimpan di memori hanya offset objek, sehingga ribuan guru bisa
+dirender dengan memori yang tetap kecil.
+
+Dua mode:
+- per guru: satu file PDF per guru di folder output.
+- gabung: satu PDF berisi form seluruh guru dalam satu periode.
+
+Input ``.jsonl`` (satu guru per baris) dibaca bertahap, tidak dimuat sekaligus.
+
+Contoh:
+    python form_evaluasi_pdf.py --input guru.jsonl --output form_pdf/
+    python form_evaluasi_pdf.py --input guru.json --gabung --output form_periode.pdf --periode "Semester 2 / Tahun 2024/2025"
+"""
+import argparse
+import json
+import os
+import time
+import zlib
+from collections import namedtuple
+
+from ahp_profil import profil, span
+from form_evaluasi_guru import (
+    EVALUATOR_DATA,
+    GURU_DATA,
+    HEADERS_KRITERIA,
+    KRITERIA_FORM,
+    NAMA_SEKOLAH,
+    TAHUN_AKADEMIK,
+    TANDA_TANGAN_DATA,
+    kolom_band,
+)
+
+UKURAN_A4 = (595.28, 841.89)
+# Margin 2 cm, sama seperti margin dokumen DOCX
+MARGIN = 56.69
+LEBAR_ISI = UKURAN_A4[0] - 2 * MARGIN
+KOLOM_IDENTITAS = [144.0, 21.6, LEBAR_ISI - 165.6]
+KOLOM_KRITERIA = [28.0, 190.0] + [(LEBAR_ISI - 218.0) / 4] * 4
+TINGGI_TANDA_TANGAN = 80.0
+LEVEL_KOMPRESI = 6
+
+# Lebar glyph ASCII 32-126 font standar PDF (per 1000 unit); karakter lain memakai 556
+LEBAR_HURUF = {
+    'F1': (  # Helvetica
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278, 556, 556, 556, 556,
+        556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556, 1015, 667, 667, 722, 722, 667, 611, 778,
+        722, 278, 500, 667, 556, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278,
+        278, 278, 469, 556, 333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+    ),
+    'F2': (  # Helvetica-Bold
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278, 556, 556, 556, 556,
+        556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611, 975, 722, 722, 722, 722, 667, 611, 778,
+        722, 278, 556, 722, 611, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333,
+        278, 333, 584, 556, 333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+    ),
+}
+
+# Satu sel tabel; ``centang`` None untuk sel teks, True/False untuk checkbox
+Sel = namedtuple('Sel', ['teks', 'ukuran', 'tebal', 'rata', 'centang'], defaults=('', 10, False, 'kiri', None))
+
+
+def lebar_teks(teks, ukuran, tebal=False):
+    """Lebar teks dalam point untuk font Helvetica (tebal: Helvetica-Bold)"""
+    lebar = LEBAR_HURUF['F2' if tebal else 'F1']
+    return sum(lebar[ord(c) - 32] if 32 <= ord(c) < 127 else 556 for c in teks) * ukuran / 1000
+
+
+def bungkus_teks(teks, ukuran, lebar, tebal=False):
+    """Memecah teks menjadi baris yang muat dalam ``lebar`` point; '\\n' selalu memulai baris baru"""
+    hasil = []
+    for paragraf in str(teks).split('\n'):
+        kata = paragraf.split()
+        if not kata:
+            hasil.append('')
+            continue
+        baris = kata[0]
+        for k in kata[1:]:
+            if lebar_teks(baris + ' ' + k, ukuran, tebal) <= lebar:
+                baris += ' ' + k
+            else:
+                hasil.append(baris)
+                baris = k
+        hasil.append(baris)
+    return hasil
+
+
+def _escape(teks):
+    # String PDF memakai WinAnsiEncoding; karakter di luar cp1252 diganti '?'
+    teks = teks.encode('cp1252', errors='replace').decode('latin-1')
+    return teks.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+class Halaman:
+    """Perintah gambar satu halaman PDF (satuan point, titik asal di kiri bawah)"""
+
+    def __init__(self):
+        self.perintah = ['0.5 w']
+
+    def teks(self, x, y, teks, ukuran=10, tebal=False, rata='kiri'):
+        if rata == 'tengah':
+            x -= lebar_teks(teks, ukuran, tebal) / 2
+        elif rata == 'kanan':
+            x -= lebar_teks(teks, ukuran, tebal)
+        font = 'F2' if tebal else 'F1'
+        self.perintah.append(f'BT /{font} {ukuran} Tf {x:.2f} {y:.2f} Td ({_escape(teks)}) Tj ET')
+
+    def garis(self, x1, y1, x2, y2):
+        self.perintah.append(f'{x1:.2f} {y1:.2f} m {x2:.2f} {y2:.2f} l S')
+
+    def kotak(self, x, y, lebar, tinggi):
+        self.perintah.append(f'{x:.2f} {y:.2f} {lebar:.2f} {tinggi:.2f} re S')
+
+    def centang(self, x, y, sisi):
+        """Tanda centang di dalam kotak (x, y, sisi)"""
+        self.perintah.append(
+            f'q 1.2 w {x + 0.2 * sisi:.2f} {y + 0.5 * sisi:.2f} m {x + 0.42 * sisi:.2f} {y + 0.22 * sisi:.2f} l '
+            f'{x + 0.85 * sisi:.2f} {y + 0.85 * sisi:.2f} l S Q'
+        )
+
+    def konten(self):
+        return '\n'.join(self.perintah).encode('latin-1')
+
+
+class PenulisPDF:
+    """File PDF yang halamannya langsung dialirkan ke disk.
+
+    Ditulis ke ``path + '.tmp'`` dan baru dipindahkan ke ``path`` saat
+    ``tutup()``, sehingga file yang belum selesai tidak pernah terbaca.
+    """
+
+    # Nomor objek tetap: 1 Catalog, 2 Pages (ditulis terakhir), 3-4 font, 5 Info
+    _OBJEK_TETAP = 5
+
+    def __init__(self, path, judul=None):
+        self.path = path
+        self.judul = judul
+        self._sementara = path + '.tmp'
+        self._f = open(self._sementara, 'wb')
+        self._posisi = 0
+        self._offset = {}
+        self._halaman = []
+        self._nomor = self._OBJEK_TETAP
+        self._tulis(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        for nomor, font in ((3, 'Helvetica'), (4, 'Helvetica-Bold')):
+            self._objek(nomor, f'<< /Type /Font /Subtype /Type1 /BaseFont /{font} /Encoding /WinAnsiEncoding >>'.encode())
+
+    def __len__(self):
+        return len(self._halaman)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.tutup()
+        else:
+            self.batal()
+
+    def _tulis(self, data):
+        self._f.write(data)
+        self._posisi += len(data)
+
+    def _objek(self, nomor, isi):
+        self._offset[nomor] = self._posisi
+        self._tulis(b'%d 0 obj\n' % nomor + isi + b'\nendobj\n')
+
+    def _nomor_baru(self):
+        self._nomor += 1
+        return self._nomor
+
+    def tambah_halaman(self, halaman):
+        """Mengompres dan menulis satu Halaman ke file"""
+        data = zlib.compress(halaman.konten(), LEVEL_KOMPRESI)
+        konten = self._nomor_baru()
+        self._objek(konten, b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(data) + data + b'\nendstream')
+        nomor = self._nomor_baru()
+        self._objek(nomor, (
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {UKURAN_A4[0]} {UKURAN_A4[1]}] '
+            f'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {konten} 0 R >>'
+        ).encode())
+        self._halaman.append(nomor)
+
+    def tutup(self):
+        """Menulis pohon halaman, tabel xref dan trailer, lalu memindahkan file ke ``path``"""
+        kids = ' '.join(f'{nomor} 0 R' for nomor in self._halaman)
+        self._objek(2, f'<< /Type /Pages /Kids [{kids}] /Count {len(self._halaman)} >>'.encode())
+        self._objek(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+        judul = f' /Title ({_escape(self.judul)})' if self.judul else ''
+        self._objek(5, f'<< /Producer (form_evaluasi_pdf){judul} >>'.encode('latin-1'))
+
+        xref = self._posisi
+        jumlah = self._nomor + 1
+        bagian = [b'xref\n0 %d\n' % jumlah, b'0000000000 65535 f \n']
+        bagian.extend(b'%010d 00000 n \n' % self._offset[nomor] for nomor in range(1, jumlah))
+        self._tulis(b''.join(bagian))
+        self._tulis(b'trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (jumlah, xref))
+        self._f.close()
+        os.replace(self._sementara, self.path)
+
+    def batal(self):
+        """Menutup dan menghapus file sementara tanpa menghasilkan PDF"""
+        self._f.close()
+        os.remove(self._sementara)
+
+
+def _tabel(halaman, y, lebar_kolom, baris, garis=True, padding=3):
+    """Menggambar tabel dengan tepi atas di ``y``; mengembalikan y tepi bawah"""
+    for sel_baris in baris:
+        isi = [bungkus_teks(sel.teks, sel.ukuran, lebar - 2 * padding, sel.tebal) for sel, lebar in zip(sel_baris, lebar_kolom)]
+        tinggi = max(max(len(teks), 1) * sel.ukuran * 1.2 for teks, sel in zip(isi, sel_baris)) + 2 * padding
+        x = MARGIN
+        for sel, lebar, teks in zip(sel_baris, lebar_kolom, isi):
+            if garis:
+                halaman.kotak(x, y - tinggi, lebar, tinggi)
+            if sel.centang is not None:
+                sisi = 9
+                kx, ky = x + (lebar - sisi) / 2, y - (tinggi + sisi) / 2
+                halaman.kotak(kx, ky, sisi, sisi)
+                if sel.centang:
+                    halaman.centang(kx, ky, sisi)
+            else:
+                # Blok teks di tengah sel secara vertikal
+                leading = sel.ukuran * 1.2
+                atas = y - (tinggi - len(teks) * leading) / 2
+                tx = {'kiri': x + padding, 'tengah': x + lebar / 2, 'kanan': x + lebar - padding}[sel.rata]
+                for i, potongan in enumerate(teks):
+                    halaman.teks(tx, atas - (i + 1) * leading + 0.25 * sel.ukuran, potongan, sel.ukuran, sel.tebal, sel.rata)
+            x += lebar
+        y -= tinggi
+    return y
+
+
+def _baris_identitas(data):
+    # Kolom keempat tabel DOCX selalu kosong dan tidak digambar
+    return [[Sel(label), Sel(titik_dua, rata='tengah'), Sel(isi, tebal=bool(isi))] for label, titik_dua, isi, _ in data]
+
+
+def data_evaluator(periode=None):
+    """Salinan EVALUATOR_DATA, dengan baris Periode Evaluasi diganti bila ``periode`` diberikan"""
+    data = [list(baris) for baris in EVALUATOR_DATA]
+    if periode:
+        for baris in data:
+            if baris[0] == 'Periode Evaluasi':
+                baris[2] = periode
+    return data
+
+
+def bobot_default():
+    """Bobot kriteria dari matriks contoh K1-K5, untuk guru tanpa nilai_ahp"""
+    from ahp_dasar import MATRIKS_KRITERIA, hitung_ahp_murni
+
+    return hitung_ahp_murni(MATRIKS_KRITERIA).bobot
+
+
+def gambar_form_guru(penulis, nomor, guru, evaluator=EVALUATOR_DATA, bobot=None):
+    """Menambahkan form satu guru ke ``penulis``; mengembalikan jumlah halaman yang ditulis.
+
+    Komentar yang tidak muat dilanjutkan ke halaman berikutnya; tanda tangan
+    selalu berada di bagian bawah halaman terakhir.
+    """
+    nilai = guru['nilai']
+    if len(nilai) != len(KRITERIA_FORM):
+        raise ValueError(f"Guru {guru['nama']} memiliki {len(nilai)} nilai, form berisi {len(KRITERIA_FORM)} kriteria")
+    nilai_ahp = guru.get('nilai_ahp')
+    if nilai_ahp is None:
+        nilai_ahp = sum(n * b for n, b in zip(nilai, bobot_default() if bobot is None else bobot))
+
+    halaman = Halaman()
+    atas = UKURAN_A4[1] - MARGIN
+    tengah = UKURAN_A4[0] / 2
+    halaman.teks(tengah, atas - 16, 'FORM EVALUASI KINERJA GURU', 16, True, 'tengah')
+    halaman.teks(tengah, atas - 36, NAMA_SEKOLAH, 14, True, 'tengah')
+    halaman.teks(tengah, atas - 54, TAHUN_AKADEMIK, 12, rata='tengah')
+    y = _tabel(halaman, atas - 70, KOLOM_IDENTITAS, _baris_identitas(evaluator))
+
+    halaman.teks(MARGIN, y - 28, f'EVALUASI GURU {nomor}', 14, True)
+    y = _tabel(halaman, y - 36, KOLOM_IDENTITAS, _baris_identitas([
+        ['Nama Guru', ':', guru['nama'], ''],
+        ['NIP/NUPTK', ':', guru['nip'], ''],
+        ['Mata Pelajaran', ':', guru['mapel'], ''],
+        ['Kelas yang Diampu', ':', guru['kelas'], ''],
+    ]))
+
+    halaman.teks(MARGIN, y - 24, 'KRITERIA EVALUASI:', 12, True)
+    baris = [[Sel(header, tebal=True, rata='tengah') for header in HEADERS_KRITERIA]]
+    for i, (kriteria, n) in enumerate(zip(KRITERIA_FORM, nilai), 1):
+        band = kolom_band(n)
+        baris.append([Sel(str(i), 9, rata='tengah'), Sel(kriteria, 9)] + [Sel(centang=j == band) for j in range(4)])
+    baris.append([Sel(), Sel('TOTAL NILAI AHP', 9, True), Sel(), Sel(), Sel(f'{nilai_ahp:.2f}', 12, True, 'tengah'), Sel()])
+    y = _tabel(halaman, y - 32, KOLOM_KRITERIA, baris)
+
+    halaman.teks(MARGIN, y - 24, 'KOMENTAR DAN SARAN:', 12, True)
+    y -= 30
+    jumlah = 1
+    for komentar in guru.get('komentar', []):
+        for teks in bungkus_teks(komentar, 10, LEBAR_ISI):
+            if y - 13 < MARGIN + TINGGI_TANDA_TANGAN:
+                penulis.tambah_halaman(halaman)
+                halaman = Halaman()
+                jumlah += 1
+                halaman.teks(MARGIN, atas - 14, f'EVALUASI GURU {nomor} (lanjutan)', 12, True)
+                y = atas - 24
+            y -= 13
+            halaman.teks(MARGIN, y, teks, 10)
+
+    tanda_tangan = [
+        [Sel(teks, 11, i in (0, len(TANDA_TANGAN_DATA) - 1), 'tengah') for teks in row_data]
+        for i, row_data in enumerate(TANDA_TANGAN_DATA)
+    ]
+    _tabel(halaman, MARGIN + TINGGI_TANDA_TANGAN, [LEBAR_ISI / 2] * 2, tanda_tangan, garis=False)
+    penulis.tambah_halaman(halaman)
+    return jumlah
+
+
+def tulis_form_pdf(path, guru_list, evaluator=None, bobot=None, judul=None):
+    """Satu PDF gabungan berisi form seluruh guru; ``guru_list`` boleh berupa generator.
+
+    Mengembalikan (jumlah guru, jumlah halaman).
+    """
+    evaluator = data_evaluator() if evaluator is None else evaluator
+    jumlah = 0
+    with span('pdf', mode='gabung') as s, PenulisPDF(path, judul or 'Form Evaluasi Kinerja Guru') as penulis:
+        for nomor, guru in enumerate(guru_list, 1):
+            bobot = bobot_default() if bobot is None and guru.get('nilai_ahp') is None else bobot
+            gambar_form_guru(penulis, nomor, guru, evaluator, bobot)
+            jumlah = nomor
+        halaman = len(penulis)
+        s.baris = jumlah
+    return jumlah, halaman
+
+
+def tulis_form_per_guru(guru_list, output_dir, evaluator=None, bobot=None):
+    """Satu file PDF per guru di ``output_dir`` (nama file seperti batch_laporan); mengembalikan jumlah guru"""
+    from batch_laporan import nama_file_guru
+
+    evaluator = data_evaluator() if evaluator is None else evaluator
+    os.makedirs(output_dir, exist_ok=True)
+    jumlah = 0
+    with span('pdf', mode='per_guru') as s:
+        for nomor, guru in enumerate(guru_list, 1):
+            bobot = bobot_default() if bobot is None and guru.get('nilai_ahp') is None else bobot
+            path = os.path.join(output_dir, nama_file_guru(guru, nomor) + '.pdf')
+            with PenulisPDF(path, f"Form Evaluasi {guru['nama']}") as penulis:
+                gambar_form_guru(penulis, 1, guru, evaluator, bobot)
+            jumlah += 1
+        s.baris = jumlah
+    return jumlah
+
+
+def baca_guru(path=None):
+    """Menghasilkan data guru dari JSON (list), JSON Lines (bertahap) atau GURU_DATA bila ``path`` kosong"""
+    if not path:
+        yield from (dict(guru) for guru in GURU_DATA)
+        return
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            for baris in f:
+                if baris.strip():
+                    yield json.loads(baris)
+        else:
+            yield from json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render form evaluasi guru ke PDF per guru atau gabungan satu periode')
+    parser.add_argument('--input', help='File JSON / JSON Lines berisi guru (format seperti GURU_DATA); default data contoh')
+    parser.add_argument('--output', help='Folder output (per guru) atau file PDF (--gabung)')
+    parser.add_argument('--gabung', action='store_true', help='Tulis satu PDF berisi seluruh guru')
+    parser.add_argument('--periode', help='Teks Periode Evaluasi pada form, mis. "Semester 2 / Tahun 2024/2025"')
+    args = parser.parse_args(argv)
+
+    evaluator = data_evaluator(args.periode)
+    mulai = time.perf_counter()
+    with profil('pdf'):
+        if args.gabung:
+            output = args.output or 'Form_Evaluasi_Guru.pdf'
+            jumlah, halaman = tulis_form_pdf(output, baca_guru(args.input), evaluator, judul=args.periode and f'Form Evaluasi Guru {args.periode}')
+            keterangan = f'{halaman} halaman di {output}'
+        else:
+            output = args.output or 'form_pdf'
+            jumlah = tulis_form_per_guru(baca_guru(args.input), output, evaluator)
+            keterangan = f'di {output}'
+    durasi = time.perf_counter() - mulai
+    print(f'{jumlah} form evaluasi guru (PDF) dibuat {keterangan} dalam {durasi:.2f} detik ({jumlah / durasi if durasi > 0 else 0:.0f} guru/detik)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Database SQLite kecil dengan nilai yang bisa dihitung manual, dipakai beberapa test.
+
+Kriteria K1 (bobot 60) dan K2 (bobot 40, sub kriteria S1 70% dan S2 30%).
+Periode 1 (selesai):
+
+- guru 1 dinilai siswa (K1 80, K2/S1 90, K2/S2 60 -> 80.4), rekan guru
+  (K1 70, K2 80 -> 74) dan satu evaluator tanpa role (K1 10, diabaikan
+  controller); nilai akhir (80.4 x 30 + 74 x 30) / 60 = 77.2.
+- guru 2 hanya dinilai kepala sekolah (K1 90, K2 85 -> 88); nilai akhir 88.
+"""
+from ahp_db import MODEL_USER, buat_database_sqlite
+
+WAKTU = '2024-08-01 00:00:00'
+NILAI_AKHIR = {1: 77.2, 2: 88.0}
+
+
+def tambah_evaluasi(conn, evaluator_id, guru_id, detail, periode_id=1, waktu=WAKTU):
+    """Satu tt_evaluasi dengan detail [(kriteria_id, sub_kriteria_id, nilai), ...]; mengembalikan id-nya"""
+    cursor = conn.execute(
+        'INSERT INTO tt_evaluasi (periode_evaluasi_id, evaluator_id, guru_id, created_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+        (periode_id, evaluator_id, guru_id, waktu, waktu),
+    )
+    conn.executemany(
+        'INSERT INTO tt_detail_evaluasi (evaluasi_id, kriteria_id, sub_kriteria_id, nilai, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+        [(cursor.lastrowid, k, sub, nilai, waktu, waktu) for k, sub, nilai in detail],
+    )
+    return cursor.lastrowid
+
+
+def buat_database_uji():
+    conn = buat_database_sqlite()
+    conn.executemany('INSERT INTO roles (name) VALUES (?)', [('siswa',), ('guru',), ('kepala_sekolah',)])
+    conn.executemany('INSERT INTO users (name, email) VALUES (?, ?)', [(f'user {i}', f'user{i}@contoh.id') for i in range(1, 7)])
+    conn.execute("INSERT INTO tm_mata_pelajaran (nama, kode) VALUES ('IPA', 'IPA')")
+    conn.executemany(
+        "INSERT INTO tm_guru (user_id, nip, mata_pelajaran_id, tanggal_bergabung) VALUES (?, ?, 1, '2020-01-01')",
+        [(1, '196805121990031005'), (2, '197203151998022003')],
+    )
+    # Evaluator: user 3 siswa, user 4 guru (rekan), user 5 kepala sekolah, user 6 tanpa role
+    conn.executemany('INSERT INTO model_has_roles VALUES (?, ?, ?)', [(1, MODEL_USER, 3), (2, MODEL_USER, 4), (3, MODEL_USER, 5)])
+    conn.executemany(
+        'INSERT INTO tm_kriteria (nama, bobot, created_at, updated_at) VALUES (?, ?, ?, ?)',
+        [('Kedisiplinan', 60, WAKTU, WAKTU), ('Penguasaan Materi', 40, WAKTU, WAKTU)],
+    )
+    conn.executemany(
+        'INSERT INTO tm_sub_kriteria (kriteria_id, nama, bobot, urutan, created_at, updated_at) VALUES (2, ?, ?, ?, ?, ?)',
+        [('Materi inti', 70, 1, WAKTU, WAKTU), ('Pengayaan', 30, 2, WAKTU, WAKTU)],
+    )
+    conn.executemany(
+        'INSERT INTO tt_periode_evaluasi (judul, tanggal_mulai, tanggal_selesai, status) VALUES (?, ?, ?, ?)',
+        [('Semester Ganjil', '2024-07-01', '2024-12-31', 'selesai'), ('Semester Genap', '2025-01-01', '2025-06-30', 'aktif')],
+    )
+    tambah_evaluasi(conn, 3, 1, [(1, None, 80), (2, 1, 90), (2, 2, 60)])
+    tambah_evaluasi(conn, 4, 1, [(1, None, 70), (2, None, 80)])
+    tambah_evaluasi(conn, 6, 1, [(1, None, 10)])
+    tambah_evaluasi(conn, 5, 2, [(1, None, 90), (2, None, 85)])
+    conn.commit()
+    return conn
@@ -0,0 +1,81 @@
+"""Agregasi keputusan kelompok AIJ / AIP per role (ahp_agregasi).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_agregasi import AgregatorKelompok, agregasi_aij, agregasi_aip, agregasi_stream, iter_chunk_npy, kode_role  # noqa: E402
+
+
+def _matriks(a):
+    return np.array([[1, a], [1 / a, 1]])
+
+
+class TestAgregasiAIJ(unittest.TestCase):
+    def test_rata_rata_geometrik(self):
+        hasil = agregasi_aij([_matriks(2), _matriks(8)])
+        np.testing.assert_allclose(hasil, _matriks(4))
+
+    def test_bobot_role(self):
+        # Siswa rata-rata geometrik 2 dan 8 -> 4, pengawas 1; bobot 30 : 40 karena rekan kosong
+        hasil = agregasi_aij([_matriks(2), _matriks(8), _matriks(1)], roles=['siswa', 'siswa', 'pengawas'])
+        np.testing.assert_allclose(hasil[0, 1], 4 ** (30 / 70))
+        np.testing.assert_allclose(hasil * hasil.T, np.ones((2, 2)))
+
+    def test_matriks_tidak_positif_ditolak(self):
+        with self.assertRaises(ValueError):
+            agregasi_aij([[[1, 0], [1, 1]]])
+
+
+class TestAgregasiAIP(unittest.TestCase):
+    def test_rata_rata_aritmetik_tertimbang(self):
+        prioritas = [[0.6, 0.4], [0.2, 0.8], [0.5, 0.5]]
+        hasil = agregasi_aip(prioritas, roles=['siswa', 'rekan', 'pengawas'])
+        np.testing.assert_allclose(hasil, [0.3 * 0.6 + 0.3 * 0.2 + 0.4 * 0.5, 0.3 * 0.4 + 0.3 * 0.8 + 0.4 * 0.5])
+
+    def test_bobot_dibagi_rata_dalam_role(self):
+        hasil = agregasi_aip([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]], roles=['siswa', 'siswa', 'rekan'], bobot_role={'siswa': 1, 'rekan': 1})
+        np.testing.assert_allclose(hasil, [0.5, 0.5])
+
+
+class TestAgregatorKelompok(unittest.TestCase):
+    def test_per_chunk_sama_dengan_sekaligus(self):
+        rng = np.random.default_rng(0)
+        atas = rng.choice([1 / 5, 1 / 3, 1, 3, 5], (300, 3))
+        matriks = np.ones((300, 3, 3))
+        i, j = np.triu_indices(3, k=1)
+        matriks[:, i, j] = atas
+        matriks[:, j, i] = 1 / atas
+        roles = rng.integers(0, 3, 300)
+
+        sekaligus = agregasi_aij(matriks, roles)
+        chunk = ((matriks[m:m + 64], roles[m:m + 64]) for m in range(0, 300, 64))
+        np.testing.assert_allclose(agregasi_stream(chunk, 3), sekaligus)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path_data = os.path.join(folder, 'matriks.npy')
+            path_roles = os.path.join(folder, 'roles.npy')
+            np.save(path_data, matriks)
+            np.save(path_roles, roles)
+            np.testing.assert_allclose(agregasi_stream(iter_chunk_npy(path_data, path_roles, 50), 3), sekaligus)
+
+    def test_validasi(self):
+        with self.assertRaises(ValueError):
+            AgregatorKelompok(2, mode='rata')
+        with self.assertRaises(ValueError):
+            AgregatorKelompok(2).hasil()
+        with self.assertRaises(ValueError):
+            kode_role(['siswa', 'kepala'])
+        np.testing.assert_array_equal(kode_role(['pengawas', 'siswa', 'rekan']), [2, 0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
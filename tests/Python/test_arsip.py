@@ -0,0 +1,96 @@
+"""Arsip kolumnar hasil per periode (ahp_arsip).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_arsip import ambil_periode, cari_arsip, hitung_periode, muat_periode, simpan_periode  # noqa: E402
+from ahp_engine import hitung_ahp  # noqa: E402
+from ahp_inkremental import buka_state, perbarui  # noqa: E402
+from data_uji import NILAI_AKHIR, buat_database_uji  # noqa: E402
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+MATRIKS = [[1, 3], [1 / 3, 1]]
+
+
+class TestHitungPeriode(unittest.TestCase):
+    def test_nilai_sama_dengan_controller(self):
+        conn = buat_database_uji()
+        hasil = hitung_periode(conn, 1)
+        np.testing.assert_array_equal(hasil.guru_ids, [1, 2])
+        np.testing.assert_allclose(hasil.nilai_ahp, [NILAI_AKHIR[1], NILAI_AKHIR[2]])
+        self.assertEqual(list(hasil.kategori), ['Cukup', 'Baik'])
+        np.testing.assert_array_equal(hasil.ranking, [2, 1])
+        np.testing.assert_allclose(hasil.bobot, [0.6, 0.4])
+        self.assertTrue(np.isnan(hasil.cr))
+
+    def test_sama_dengan_tt_hasil_evaluasi_inkremental(self):
+        conn = buat_database_uji()
+        perbarui(conn, buka_state(':memory:'))
+        nilai_akhir = dict(conn.execute('SELECT guru_id, nilai_akhir FROM tt_hasil_evaluasi WHERE periode_evaluasi_id = 1'))
+        hasil = hitung_periode(conn, 1)
+        np.testing.assert_allclose(hasil.nilai_ahp, [nilai_akhir[int(g)] for g in hasil.guru_ids], atol=0.005)
+
+    def test_bobot_dari_matriks(self):
+        conn = buat_database_uji()
+        hasil = hitung_periode(conn, 1, MATRIKS)
+        np.testing.assert_allclose(hasil.bobot, [0.75, 0.25])
+        # Siswa: (0.75 x 80 + 0.25 x (0.7 x 90 + 0.3 x 60)) = 80.25, rekan: 0.75 x 70 + 0.25 x 80 = 72.5
+        np.testing.assert_allclose(hasil.nilai_ahp, [(80.25 + 72.5) / 2, 0.75 * 90 + 0.25 * 85])
+        with self.assertRaises(ValueError):
+            hitung_periode(conn, 1, np.ones((3, 3)))
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow tidak terpasang')
+class TestArsipPeriode(unittest.TestCase):
+    def test_simpan_muat_bolak_balik(self):
+        hasil = hitung_periode(buat_database_uji(), 1, MATRIKS)
+        for format in ('arrow', 'parquet'):
+            with tempfile.TemporaryDirectory() as root:
+                simpan_periode(root, hasil, format)
+                dimuat = muat_periode(root, 1)
+            for nama in ('guru_ids', 'kriteria_ids', 'nilai', 'jumlah', 'bobot', 'nilai_ahp', 'ranking'):
+                np.testing.assert_array_equal(getattr(dimuat, nama), getattr(hasil, nama), err_msg=f'{format}: {nama}')
+            self.assertEqual(list(dimuat.kategori), list(hasil.kategori))
+            self.assertAlmostEqual(dimuat.cr, hasil.cr)
+
+    def test_ambil_periode_hanya_mengarsipkan_yang_selesai(self):
+        conn = buat_database_uji()
+        with tempfile.TemporaryDirectory() as root:
+            ambil_periode(conn, 1, root)
+            ambil_periode(conn, 2, root)
+            self.assertIsNotNone(cari_arsip(root, 1))
+            self.assertIsNone(cari_arsip(root, 2))
+
+            # Arsip dipakai tanpa membuka koneksi
+            def tanpa_koneksi():
+                raise AssertionError('koneksi tidak boleh dibuka')
+
+            np.testing.assert_allclose(ambil_periode(tanpa_koneksi, 1, root).nilai_ahp, [NILAI_AKHIR[1], NILAI_AKHIR[2]])
+
+    def test_matriks_berbeda_dihitung_ulang(self):
+        conn = buat_database_uji()
+        with tempfile.TemporaryDirectory() as root:
+            ambil_periode(conn, 1, root)
+            hasil = ambil_periode(lambda: conn, 1, root, matriks=MATRIKS)
+            np.testing.assert_allclose(hasil.bobot, hitung_ahp(MATRIKS).bobot)
+            self.assertAlmostEqual(hasil.cr, 0.0)
+            # Arsip kini memakai matriks, permintaan tanpa matriks kembali ke tm_kriteria
+            np.testing.assert_allclose(muat_periode(root, 1).bobot, [0.75, 0.25])
+            np.testing.assert_allclose(ambil_periode(conn, 1, root).bobot, [0.6, 0.4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Cache LRU hasil AHP berdasarkan sidik jari matriks (ahp_cache).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_cache import CacheAHP, fingerprint  # noqa: E402
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp, hitung_ahp_batch  # noqa: E402
+
+MATRIKS_3 = np.array([[1, 3, 5], [1 / 3, 1, 2], [1 / 5, 1 / 2, 1]])
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_sama_setelah_pembulatan(self):
+        self.assertEqual(fingerprint(MATRIKS_3), fingerprint(MATRIKS_3 + 1e-7))
+        self.assertNotEqual(fingerprint(MATRIKS_3), fingerprint(MATRIKS_3 + 1e-3))
+
+    def test_segitiga_bawah_ikut_kunci(self):
+        # 0.33 dari evaluator berbeda dengan 1/3 yang resiprokal sempurna
+        tidak_resiprokal = MATRIKS_3.copy()
+        tidak_resiprokal[1, 0] = 0.33
+        self.assertNotEqual(fingerprint(MATRIKS_3), fingerprint(tidak_resiprokal))
+
+    def test_tumpukan(self):
+        kunci = fingerprint(np.array([MATRIKS_3, MATRIKS_3, np.ones((3, 3))]))
+        self.assertEqual(len(kunci), 3)
+        self.assertEqual(kunci[0], kunci[1])
+        self.assertNotEqual(kunci[0], kunci[2])
+
+
+class TestCacheAHP(unittest.TestCase):
+    def test_hasil_sama_dengan_hitung_ahp(self):
+        cache = CacheAHP()
+        for matriks in (MATRIKS_KRITERIA, MATRIKS_3, MATRIKS_KRITERIA):
+            hasil = cache.hitung(matriks)
+            langsung = hitung_ahp(matriks)
+            np.testing.assert_allclose(hasil.bobot, langsung.bobot)
+            self.assertAlmostEqual(hasil.cr, langsung.cr)
+        statistik = cache.statistik()
+        self.assertEqual((statistik['hits'], statistik['misses'], statistik['ukuran']), (1, 2, 2))
+
+    def test_batch_hanya_menghitung_matriks_unik(self):
+        tidak_resiprokal = MATRIKS_3.copy()
+        tidak_resiprokal[1, 0] = 0.33
+        matriks = np.array([MATRIKS_3, tidak_resiprokal, MATRIKS_3, tidak_resiprokal, MATRIKS_3])
+        cache = CacheAHP()
+        hasil = cache.hitung_batch(matriks)
+        langsung = hitung_ahp_batch(matriks)
+        np.testing.assert_allclose(hasil.bobot, langsung.bobot)
+        np.testing.assert_allclose(hasil.cr, langsung.cr)
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+
+    def test_kapasitas_lru(self):
+        cache = CacheAHP(kapasitas=2)
+        a, b, c = MATRIKS_3, np.ones((3, 3)), MATRIKS_3.T
+        cache.hitung(a)
+        cache.hitung(b)
+        cache.hitung(a)
+        cache.hitung(c)
+        # b paling lama tidak diakses sehingga dibuang lebih dulu
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        cache.hitung(a)
+        self.assertEqual(cache.misses, 3)
+        cache.hitung(b)
+        self.assertEqual(cache.misses, 4)
+
+    def test_disk(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'cache.sqlite')
+            cache = CacheAHP(path=path)
+            cache.hitung(MATRIKS_KRITERIA)
+            cache.close()
+
+            cache = CacheAHP(path=path)
+            hasil = cache.hitung(MATRIKS_KRITERIA)
+            self.assertEqual((cache.hits, cache.misses, cache.disk_hits), (1, 0, 1))
+            np.testing.assert_allclose(hasil.bobot, hitung_ahp(MATRIKS_KRITERIA).bobot)
+            cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Subperintah ahp_cli.py yang menulis laporan.
+
+    python -m unittest discover -s tests/Python
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import ahp_cli  # noqa: E402
+
+
+class TestPerintahForm(unittest.TestCase):
+    def test_input_tanpa_nilai_ahp_dan_komentar(self):
+        import docx
+
+        guru = [{'nama': 'Budi Santoso, S.Pd', 'nip': '196805121990031005', 'mapel': 'IPA', 'kelas': 'VII A', 'nilai': [80, 95, 90, 85, 80]}]
+        with tempfile.TemporaryDirectory() as folder:
+            path_input = os.path.join(folder, 'guru.json')
+            path_output = os.path.join(folder, 'form.docx')
+            with open(path_input, 'w', encoding='utf-8') as f:
+                json.dump(guru, f)
+            ahp_cli.main(['form', '--input', path_input, '--output', path_output])
+            dokumen = docx.Document(path_output)
+        sel = [c.text for tabel in dokumen.tables for baris in tabel.rows for c in baris.cells]
+        # Nilai AHP dari bobot eigenvector, sama dengan sheet Evaluasi Guru
+        self.assertIn('88.36', sel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Anggaran waktu start ahp_cli.py untuk perintah ringan.
+
+Waktu diukur sebagai selisih terhadap interpreter Python kosong, sehingga
+yang diuji adalah biaya impor CLI itu sendiri, bukan kecepatan mesin.
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CLI = os.path.join(ROOT, 'ahp_cli.py')
+
+ANGGARAN_DETIK = 0.100
+PENGULANGAN = 5
+MODUL_BERAT = ('numpy', 'pandas', 'openpyxl', 'docx', 'pyarrow')
+
+
+def _durasi_minimum(argumen):
+    terbaik = float('inf')
+    for _ in range(PENGULANGAN):
+        mulai = time.perf_counter()
+        subprocess.run([sys.executable, *argumen], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    return terbaik
+
+
+def _modul_diimpor(argumen):
+    hasil = subprocess.run(
+        [sys.executable, '-X', 'importtime', CLI, *argumen], cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    return {baris.rsplit('|', 1)[-1].strip() for baris in hasil.stderr.splitlines() if baris.startswith('import time:')}
+
+
+class TestStartupCli(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dasar = _durasi_minimum(['-c', 'pass'])
+
+    def assertDalamAnggaran(self, argumen):
+        durasi = _durasi_minimum([CLI, *argumen]) - self.dasar
+        self.assertLess(durasi, ANGGARAN_DETIK, f'{argumen}: {durasi * 1000:.0f} ms di atas interpreter kosong')
+
+    def test_help(self):
+        self.assertDalamAnggaran(['--help'])
+
+    def test_bobot(self):
+        self.assertDalamAnggaran(['bobot'])
+
+    def test_perintah_ringan_tanpa_modul_berat(self):
+        for argumen in (['--help'], ['bobot']):
+            berat = {m for m in _modul_diimpor(argumen) if m.split('.')[0] in MODUL_BERAT}
+            self.assertFalse(berat, f'{argumen} mengimpor {sorted(berat)}')
+
+
+if __name__ == '__main__':
+    unittest.main()
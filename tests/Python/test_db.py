@@ -0,0 +1,70 @@
+"""Pemuatan nilai periode lewat query agregat (ahp_db).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_db import iter_agregat_periode, iter_query, muat_kriteria, muat_nilai_periode, muat_sub_kriteria  # noqa: E402
+from data_uji import buat_database_uji  # noqa: E402
+
+
+class TestMuatNilaiPeriode(unittest.TestCase):
+    def setUp(self):
+        self.conn = buat_database_uji()
+
+    def test_rata_per_guru_dan_kriteria(self):
+        hasil = muat_nilai_periode(self.conn, 1)
+        np.testing.assert_array_equal(hasil.guru_ids, [1, 2])
+        np.testing.assert_array_equal(hasil.kriteria_ids, [1, 2])
+        # Guru 1: K1 (80 + 70 + 10) / 3, K2 (90 + 60 + 80) / 3
+        np.testing.assert_allclose(hasil.nilai, [[160 / 3, 230 / 3], [90, 85]])
+        np.testing.assert_array_equal(hasil.jumlah, [[3, 3], [1, 1]])
+
+    def test_ukuran_chunk_tidak_mengubah_hasil(self):
+        semua = muat_nilai_periode(self.conn, 1)
+        per_baris = muat_nilai_periode(self.conn, 1, ukuran_chunk=1)
+        np.testing.assert_allclose(per_baris.nilai, semua.nilai)
+        np.testing.assert_array_equal(per_baris.jumlah, semua.jumlah)
+
+    def test_kriteria_tidak_diminta_diabaikan(self):
+        hasil = muat_nilai_periode(self.conn, 1, kriteria_ids=[2])
+        np.testing.assert_allclose(hasil.nilai, [[230 / 3], [85]])
+
+    def test_periode_kosong(self):
+        hasil = muat_nilai_periode(self.conn, 2)
+        self.assertEqual(hasil.guru_ids.shape, (0,))
+        self.assertEqual(hasil.nilai.shape, (0, 2))
+
+    def test_agregat_per_role_tanpa_evaluator_tanpa_role(self):
+        rows = [row for chunk in iter_agregat_periode(self.conn, 1, per_role=True) for row in chunk]
+        self.assertIn((1, 1, 'siswa', 80.0, 1), rows)
+        self.assertIn((1, 1, 'guru', 70.0, 1), rows)
+        self.assertEqual(sum(row[4] for row in rows if row[0] == 1), 5)
+
+
+class TestQuery(unittest.TestCase):
+    def setUp(self):
+        self.conn = buat_database_uji()
+
+    def test_iter_query_per_chunk(self):
+        chunk = list(iter_query(self.conn, 'SELECT id FROM tt_detail_evaluasi ORDER BY id', ukuran_chunk=3))
+        self.assertEqual([len(c) for c in chunk], [3, 3, 2])
+        self.assertEqual([row[0] for c in chunk for row in c], list(range(1, 9)))
+
+    def test_muat_kriteria_dan_sub_kriteria(self):
+        ids, nama, bobot = muat_kriteria(self.conn)
+        np.testing.assert_array_equal(ids, [1, 2])
+        self.assertEqual(nama, ['Kedisiplinan', 'Penguasaan Materi'])
+        np.testing.assert_allclose(bobot, [60, 40])
+        self.assertEqual(muat_sub_kriteria(self.conn), {2: [(1, 'Materi inti', 70.0), (2, 'Pengayaan', 30.0)]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Bobot eigenvector, lambda max, CI dan CR (ahp_engine, ahp_dasar).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_dasar import hitung_ahp_murni  # noqa: E402
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp, hitung_ahp_batch, is_konsisten, ke_matriks, random_index  # noqa: E402
+
+
+def _matriks_konsisten(bobot):
+    bobot = np.asarray(bobot, dtype=float)
+    return bobot[:, np.newaxis] / bobot[np.newaxis, :]
+
+
+class TestHitungAHP(unittest.TestCase):
+    def test_matriks_konsisten(self):
+        bobot = np.array([0.5, 0.25, 0.15, 0.1])
+        hasil = hitung_ahp(_matriks_konsisten(bobot))
+        np.testing.assert_allclose(hasil.bobot, bobot)
+        self.assertAlmostEqual(hasil.lambda_max, 4.0)
+        self.assertAlmostEqual(hasil.ci, 0.0)
+        self.assertAlmostEqual(hasil.cr, 0.0)
+
+    def test_matriks_kriteria(self):
+        hasil = hitung_ahp(MATRIKS_KRITERIA)
+        np.testing.assert_allclose(hasil.bobot, [0.2626, 0.4188, 0.1597, 0.0971, 0.0617], atol=1e-4)
+        self.assertAlmostEqual(hasil.bobot.sum(), 1.0)
+        self.assertAlmostEqual(hasil.cr, 0.0140, places=4)
+        self.assertTrue(is_konsisten(hasil.cr))
+
+    def test_batch_sama_dengan_satu_per_satu(self):
+        rng = np.random.default_rng(0)
+        skala = np.array([1 / 9, 1 / 5, 1 / 3, 1, 3, 5, 9])
+        i, j = np.triu_indices(5, k=1)
+        matriks = np.ones((50, 5, 5))
+        atas = rng.choice(skala, (50, len(i)))
+        matriks[:, i, j] = atas
+        matriks[:, j, i] = 1 / atas
+
+        batch = hitung_ahp_batch(matriks)
+        self.assertEqual(batch.bobot.shape, (50, 5))
+        for k in (0, 17, 49):
+            satu = hitung_ahp(matriks[k])
+            np.testing.assert_allclose(batch.bobot[k], satu.bobot)
+            self.assertAlmostEqual(batch.cr[k], satu.cr)
+        np.testing.assert_array_equal(is_konsisten(batch.cr), batch.cr < 0.1)
+
+    def test_ordo_kecil_tanpa_cr(self):
+        self.assertEqual(hitung_ahp([[1, 3], [1 / 3, 1]]).cr, 0.0)
+        np.testing.assert_allclose(hitung_ahp([[1.0]]).bobot, [1.0])
+
+    def test_validasi(self):
+        with self.assertRaises(ValueError):
+            hitung_ahp(np.ones((2, 3)))
+        with self.assertRaises(ValueError):
+            hitung_ahp([[1, 0], [1, 1]])
+        with self.assertRaises(ValueError):
+            random_index(16)
+
+    def test_ke_matriks_dengan_label(self):
+        np.testing.assert_array_equal(ke_matriks([['K1', 1, 3], ['K2', 1 / 3, 1]]), [[1, 3], [1 / 3, 1]])
+
+
+class TestHitungAHPMurni(unittest.TestCase):
+    def test_sama_dengan_engine(self):
+        for matriks in (MATRIKS_KRITERIA, _matriks_konsisten([0.4, 0.3, 0.2, 0.1]), [[1, 7, 1 / 3], [1 / 7, 1, 1 / 5], [3, 5, 1]]):
+            murni = hitung_ahp_murni(matriks)
+            engine = hitung_ahp(matriks)
+            np.testing.assert_allclose(murni.bobot, engine.bobot, atol=1e-10)
+            self.assertAlmostEqual(murni.lambda_max, engine.lambda_max, places=10)
+            self.assertAlmostEqual(murni.cr, engine.cr, places=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Ekspor laporan Excel streaming (ahp_excel).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+from openpyxl import load_workbook
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp  # noqa: E402
+from ahp_excel import (  # noqa: E402
+    HEADERS_EVALUASI,
+    iter_baris_hasil,
+    iter_baris_ranking,
+    tulis_laporan_streaming,
+    tulis_ringkasan_guru,
+)
+
+GURU = [
+    ('Budi Santoso, S.Pd', 'IPA', [80, 95, 90, 85, 80]),
+    ('Siti Nurhaliza, S.Pd', 'Bahasa Indonesia', [90, 85, 85, 80, 90]),
+    ('Ahmad Fauzi, S.Pd', 'Matematika', [70, 75, 65, 80, 70]),
+]
+
+
+def _tulis(folder, backend='openpyxl', ukuran_chunk=2):
+    bobot = hitung_ahp(MATRIKS_KRITERIA).bobot
+    nama = [g[0] for g in GURU]
+    nilai = np.array([g[2] for g in GURU], dtype=float) @ bobot
+    path = os.path.join(folder, f'laporan_{backend}.xlsx')
+    jumlah = tulis_laporan_streaming(
+        path, iter_baris_hasil(iter(GURU), bobot, ukuran_chunk), iter_baris_ranking(nama, nilai), backend=backend
+    )
+    return path, jumlah, nilai
+
+
+class TestLaporanStreaming(unittest.TestCase):
+    def test_isi_dan_chunk(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path, jumlah, nilai = _tulis(folder)
+            wb = load_workbook(path)
+        self.assertEqual(jumlah, (3, 3))
+        self.assertEqual(wb.sheetnames, ['Hasil Evaluasi', 'Ranking'])
+        hasil = wb['Hasil Evaluasi']
+        self.assertEqual([c.value for c in hasil[4]], HEADERS_EVALUASI)
+        # Nomor berlanjut antar chunk dan Nilai AHP dibulatkan dua angka
+        self.assertEqual([hasil.cell(row=r, column=1).value for r in (5, 6, 7)], [1, 2, 3])
+        self.assertEqual(hasil.cell(row=5, column=9).value, 88.36)
+        ranking = wb['Ranking']
+        self.assertEqual([ranking.cell(row=r, column=2).value for r in (5, 6, 7)], [GURU[i][0] for i in np.argsort(-nilai)])
+        self.assertEqual(ranking.cell(row=7, column=4).value, 'Cukup')
+
+    def test_named_style(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path, _, _ = _tulis(folder)
+            ws = load_workbook(path)['Hasil Evaluasi']
+        judul, header, nomor, angka = ws['A1'], ws['A4'], ws['A5'], ws['I5']
+        self.assertTrue(judul.font.b)
+        self.assertEqual(judul.font.sz, 14)
+        self.assertEqual(header.style, 'header')
+        self.assertEqual(header.fill.fgColor.rgb[-6:], '4472C4')
+        self.assertEqual(nomor.style, 'isi_tengah')
+        self.assertEqual(nomor.alignment.horizontal, 'center')
+        self.assertEqual(angka.style, 'angka_kanan')
+        self.assertEqual(angka.number_format, '0.00')
+        self.assertEqual(angka.border.left.style, 'thin')
+
+    def test_backend_tidak_dikenal(self):
+        with self.assertRaises(ValueError):
+            tulis_laporan_streaming('tidak-dipakai.xlsx', [], [], backend='csv')
+
+
+class TestRingkasanGuru(unittest.TestCase):
+    def test_total_sama_dengan_nilai_ahp(self):
+        bobot = hitung_ahp(MATRIKS_KRITERIA).bobot
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'ringkasan.xlsx')
+            tulis_ringkasan_guru(path, 'Budi Santoso, S.Pd', 'IPA', [f'K{i}' for i in range(1, 6)], bobot, GURU[0][2])
+            ws = load_workbook(path)['Ringkasan']
+        self.assertEqual([ws.cell(row=r, column=1).value for r in range(5, 10)], ['K1', 'K2', 'K3', 'K4', 'K5'])
+        self.assertEqual(ws['A10'].value, 'TOTAL NILAI AHP')
+        self.assertEqual(ws['D10'].value, 88.36)
+
+
+if __name__ == '__main__':
+    unittest.main()
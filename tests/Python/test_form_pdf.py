@@ -0,0 +1,113 @@
+"""Render form evaluasi guru ke PDF yang dialirkan ke disk (form_evaluasi_pdf).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import re
+import sys
+import tempfile
+import unittest
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from form_evaluasi_guru import GURU_DATA  # noqa: E402
+from form_evaluasi_pdf import Halaman, PenulisPDF, tulis_form_pdf, tulis_form_per_guru  # noqa: E402
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+
+def _periksa_struktur(test, data):
+    """Memeriksa header, offset xref dan trailer; mengembalikan isi stream konten yang sudah didekompres"""
+    test.assertTrue(data.startswith(b'%PDF-1.4\n'))
+    test.assertTrue(data.endswith(b'%%EOF\n'))
+    startxref = int(re.search(rb'startxref\n(\d+)\n%%EOF\n$', data).group(1))
+    test.assertEqual(data[startxref:startxref + 5], b'xref\n')
+    jumlah = int(re.match(rb'xref\n0 (\d+)\n', data[startxref:]).group(1))
+    entri = re.findall(rb'(\d{10}) 00000 n \n', data[startxref:])
+    test.assertEqual(len(entri), jumlah - 1)
+    for nomor, offset in enumerate(entri, 1):
+        test.assertTrue(data[int(offset):].startswith(b'%d 0 obj\n' % nomor), f'objek {nomor}')
+    test.assertIn(b'/Size %d /Root 1 0 R' % jumlah, data)
+    return [zlib.decompress(stream) for stream in re.findall(rb'/FlateDecode >>\nstream\n(.*?)\nendstream', data, re.S)]
+
+
+class TestPenulisPDF(unittest.TestCase):
+    def test_struktur_dan_halaman(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'dua.pdf')
+            with PenulisPDF(path, 'Uji (kurung)') as penulis:
+                for teks in ('satu', 'dua'):
+                    halaman = Halaman()
+                    halaman.teks(100, 100, teks)
+                    penulis.tambah_halaman(halaman)
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.assertEqual(os.listdir(folder), ['dua.pdf'])
+        konten = _periksa_struktur(self, data)
+        self.assertEqual(len(konten), 2)
+        self.assertIn(b'(dua) Tj', konten[1])
+        self.assertIn(b'/Count 2', data)
+        self.assertIn(rb'/Title (Uji \(kurung\))', data)
+
+    def test_batal_saat_error(self):
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(ValueError):
+                with PenulisPDF(os.path.join(folder, 'gagal.pdf')):
+                    raise ValueError('gagal')
+            self.assertEqual(os.listdir(folder), [])
+
+
+class TestFormPDF(unittest.TestCase):
+    def test_gabung(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'form.pdf')
+            jumlah, halaman = tulis_form_pdf(path, iter(GURU_DATA))
+            with open(path, 'rb') as f:
+                data = f.read()
+        self.assertEqual((jumlah, halaman), (len(GURU_DATA), len(GURU_DATA)))
+        konten = _periksa_struktur(self, data)
+        self.assertIn(b'(EVALUASI GURU 2) Tj', konten[1])
+        self.assertIn(b'(%.2f) Tj' % GURU_DATA[0]['nilai_ahp'], konten[0])
+
+    def test_komentar_panjang_berlanjut_ke_halaman_baru(self):
+        guru = dict(GURU_DATA[0], komentar=['Komentar evaluasi yang cukup panjang.'] * 60)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'form.pdf')
+            _, halaman = tulis_form_pdf(path, [guru])
+            with open(path, 'rb') as f:
+                konten = _periksa_struktur(self, f.read())
+        self.assertGreater(halaman, 1)
+        self.assertIn(b'(EVALUASI GURU 1 \\(lanjutan\\)) Tj', konten[1])
+
+    def test_jumlah_nilai_salah(self):
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(ValueError):
+                tulis_form_pdf(os.path.join(folder, 'form.pdf'), [dict(GURU_DATA[0], nilai=[80, 90])])
+            self.assertEqual(os.listdir(folder), [])
+
+    def test_per_guru(self):
+        with tempfile.TemporaryDirectory() as folder:
+            self.assertEqual(tulis_form_per_guru(iter(GURU_DATA), folder), len(GURU_DATA))
+            files = sorted(os.listdir(folder))
+        self.assertEqual(len(files), len(GURU_DATA))
+        self.assertTrue(all(nama.endswith('.pdf') for nama in files))
+
+    @unittest.skipIf(pypdf is None, 'pypdf tidak terpasang')
+    def test_terbaca_pypdf(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'form.pdf')
+            tulis_form_pdf(path, GURU_DATA)
+            reader = pypdf.PdfReader(path, strict=True)
+            self.assertEqual(len(reader.pages), len(GURU_DATA))
+            teks = reader.pages[0].extract_text()
+        self.assertIn('FORM EVALUASI KINERJA GURU', teks)
+        self.assertIn(GURU_DATA[0]['nama'], teks)
+
+
+if __name__ == '__main__':
+    unittest.main()
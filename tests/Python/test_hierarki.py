@@ -0,0 +1,75 @@
+"""Hierarki AHP bertingkat dan invalidasi subtree (ahp_hierarki).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import hitung_ahp  # noqa: E402
+from ahp_hierarki import AKAR, HierarkiAHP  # noqa: E402
+
+MATRIKS_A = [[1, 3], [1 / 3, 1]]
+
+
+def _hierarki():
+    # akar -> A (a1, a2), B (b1, b2, b3)
+    hierarki = HierarkiAHP()
+    hierarki.tambah('A')
+    hierarki.tambah('B')
+    for daun in ('a1', 'a2'):
+        hierarki.tambah(daun, 'A')
+    for daun in ('b1', 'b2', 'b3'):
+        hierarki.tambah(daun, 'B')
+    hierarki.atur_bobot(AKAR, [0.6, 0.4])
+    hierarki.atur_matriks('A', MATRIKS_A)
+    hierarki.atur_bobot('B', [1, 1, 2])
+    return hierarki
+
+
+class TestHierarkiAHP(unittest.TestCase):
+    def test_bobot_global(self):
+        hierarki = _hierarki()
+        bobot_a = hitung_ahp(MATRIKS_A).bobot
+        np.testing.assert_allclose(bobot_a, [0.75, 0.25])
+        self.assertEqual(hierarki.daun(), ['a1', 'a2', 'b1', 'b2', 'b3'])
+        np.testing.assert_allclose(hierarki.bobot_global(), [0.45, 0.15, 0.1, 0.1, 0.2])
+        self.assertEqual(hierarki.rentang('B'), (2, 5))
+
+    def test_invalidasi_hanya_subtree(self):
+        hierarki = _hierarki()
+        hierarki.bobot_global()
+        sebelum = hierarki.jumlah_hitung_ulang
+        hierarki.atur_bobot('B', [1, 1, 1])
+        bobot = hierarki.bobot_global()
+        # Hanya tiga daun di bawah B yang dihitung ulang
+        self.assertEqual(hierarki.jumlah_hitung_ulang - sebelum, 3)
+        np.testing.assert_allclose(bobot, [0.45, 0.15, 0.4 / 3, 0.4 / 3, 0.4 / 3])
+
+        baru = _hierarki()
+        baru.atur_bobot('B', [1, 1, 1])
+        np.testing.assert_allclose(bobot, baru.bobot_global())
+
+    def test_perubahan_akar_menghitung_ulang_semua(self):
+        hierarki = _hierarki()
+        hierarki.bobot_global()
+        sebelum = hierarki.jumlah_hitung_ulang
+        hierarki.atur_bobot(AKAR, [1, 1])
+        np.testing.assert_allclose(hierarki.bobot_global(), [0.375, 0.125, 0.125, 0.125, 0.25])
+        self.assertEqual(hierarki.jumlah_hitung_ulang - sebelum, 5)
+
+    def test_skor(self):
+        hierarki = _hierarki()
+        skor = np.array([[100, 100, 100, 100, 100], [80, 60, 90, 70, 50]])
+        np.testing.assert_allclose(hierarki.skor(skor), [100.0, 80 * 0.45 + 60 * 0.15 + 90 * 0.1 + 70 * 0.1 + 50 * 0.2])
+        with self.assertRaises(ValueError):
+            hierarki.skor(skor[:, :4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Perhitungan ulang tt_hasil_evaluasi secara inkremental (ahp_inkremental).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_db import MODEL_USER  # noqa: E402
+from ahp_inkremental import baca_watermark, buka_state, perbarui, simpan_watermark  # noqa: E402
+from data_uji import NILAI_AKHIR, buat_database_uji, tambah_evaluasi  # noqa: E402
+
+
+def _hasil(conn):
+    return {(g, p): akhir for g, p, akhir in conn.execute('SELECT guru_id, periode_evaluasi_id, nilai_akhir FROM tt_hasil_evaluasi')}
+
+
+class TestPerbarui(unittest.TestCase):
+    def setUp(self):
+        self.conn = buat_database_uji()
+        self.state = buka_state(':memory:')
+        self.assertEqual(self._perbarui(), [(1, 1), (2, 1)])
+
+    def _perbarui(self, **kwargs):
+        hasil = perbarui(self.conn, self.state, **kwargs)
+        # Run berikutnya dianggap terjadi setelah detik watermark, agar ``>=`` tidak mengambil ulang baris yang sama
+        waktu = datetime.strptime(baca_watermark(self.state), '%Y-%m-%d %H:%M:%S') + timedelta(seconds=1)
+        simpan_watermark(self.state, waktu.strftime('%Y-%m-%d %H:%M:%S'))
+        return hasil
+
+    def assertSamaDenganHitungPenuh(self):
+        # Hasil inkremental harus sama dengan perhitungan dari state kosong
+        inkremental = _hasil(self.conn)
+        perbarui(self.conn, buka_state(':memory:'))
+        self.assertEqual(inkremental, _hasil(self.conn))
+
+    def test_nilai_awal_dan_run_tanpa_perubahan(self):
+        hasil = _hasil(self.conn)
+        self.assertAlmostEqual(hasil[(1, 1)], NILAI_AKHIR[1])
+        self.assertAlmostEqual(hasil[(2, 1)], NILAI_AKHIR[2])
+        self.assertEqual(self._perbarui(), [])
+
+    def test_detail_baru(self):
+        tambah_evaluasi(self.conn, 5, 1, [(1, None, 100)], waktu='2024-09-01 00:00:00')
+        self.conn.commit()
+        self.assertEqual(self._perbarui(), [(1, 1)])
+        self.assertSamaDenganHitungPenuh()
+
+    def test_bobot_kriteria_berubah(self):
+        self.conn.execute('UPDATE tm_kriteria SET bobot = 50 WHERE id = 1')
+        self.conn.commit()
+        self.assertEqual(self._perbarui(), [(1, 1), (2, 1)])
+        self.assertNotAlmostEqual(_hasil(self.conn)[(2, 1)], NILAI_AKHIR[2])
+        self.assertSamaDenganHitungPenuh()
+
+    def test_bobot_sub_kriteria_berubah(self):
+        self.conn.execute('UPDATE tm_sub_kriteria SET bobot = 50 WHERE id = 1')
+        self.conn.commit()
+        # Hanya guru 1 yang dinilai dengan sub kriteria
+        self.assertEqual(self._perbarui(), [(1, 1)])
+        self.assertSamaDenganHitungPenuh()
+        self.assertEqual(self._perbarui(), [])
+
+    def test_role_evaluator_berubah(self):
+        # Evaluator tanpa role (nilai K1 10) menjadi rekan guru
+        self.conn.execute('INSERT INTO model_has_roles VALUES (2, ?, 6)', (MODEL_USER,))
+        self.conn.commit()
+        self.assertEqual(self._perbarui(), [(1, 1)])
+        self.assertLess(_hasil(self.conn)[(1, 1)], NILAI_AKHIR[1])
+        self.assertSamaDenganHitungPenuh()
+
+        self.conn.execute('DELETE FROM model_has_roles WHERE model_id = 5')
+        self.conn.commit()
+        self.assertEqual(self._perbarui(), [(2, 1)])
+        self.assertSamaDenganHitungPenuh()
+
+    def test_detail_terhapus(self):
+        self.conn.execute('DELETE FROM tt_detail_evaluasi WHERE evaluasi_id = 4')
+        self.conn.commit()
+        self.assertEqual(self._perbarui(), [(2, 1)])
+        self.assertNotIn((2, 1), _hasil(self.conn))
+
+    def test_referensi_disimpan_hanya_tanpa_filter_periode(self):
+        self.conn.execute('UPDATE tm_kriteria SET bobot = 50 WHERE id = 1')
+        self.conn.commit()
+        self.assertEqual(self._perbarui(periode_id=2), [])
+        self.assertEqual(self._perbarui(), [(1, 1), (2, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
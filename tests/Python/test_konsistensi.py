@@ -0,0 +1,66 @@
+"""Perbaikan konsistensi matriks perbandingan (ahp_konsistensi).
+
+    python -m unittest discover -s tests/Python
+"""
+import itertools
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import BATAS_CR, hitung_ahp_batch  # noqa: E402
+from ahp_konsistensi import SKALA_SAATY, perbaiki_konsistensi  # noqa: E402
+
+# Matriks yang dulu bolak-balik antara CR 0.254 dan 0.111 tanpa pernah konsisten
+MATRIKS_BOLAK_BALIK = [[1, 1 / 5, 1 / 5], [5, 1, 1 / 9], [5, 9, 1]]
+
+
+def _di_skala_saaty(matriks):
+    return np.isclose(np.asarray(matriks)[..., np.newaxis], SKALA_SAATY).any(axis=-1).all()
+
+
+class TestPerbaikiKonsistensi(unittest.TestCase):
+    def test_matriks_bolak_balik_berhasil(self):
+        hasil = perbaiki_konsistensi(MATRIKS_BOLAK_BALIK)
+        self.assertTrue(hasil.berhasil)
+        self.assertLess(hasil.hasil.cr, BATAS_CR)
+        self.assertTrue(_di_skala_saaty(hasil.matriks))
+        np.testing.assert_allclose(hasil.matriks * hasil.matriks.T, np.ones((3, 3)))
+
+    def test_target_dibatasi_rentang_skala(self):
+        for skala_saaty in (True, False):
+            hasil = perbaiki_konsistensi(MATRIKS_BOLAK_BALIK, skala_saaty=skala_saaty)
+            self.assertTrue(hasil.berhasil)
+            self.assertLessEqual(hasil.matriks.max(), 9 + 1e-9)
+            self.assertGreaterEqual(hasil.matriks.min(), 1 / 9 - 1e-9)
+
+    def test_semua_matriks_3x3_skala_saaty(self):
+        matriks = []
+        for a, b, c in itertools.product(SKALA_SAATY, repeat=3):
+            matriks.append([[1, a, b], [1 / a, 1, c], [1 / b, 1 / c, 1]])
+        matriks = np.array(matriks)
+        gagal = matriks[hitung_ahp_batch(matriks).cr >= BATAS_CR]
+
+        hasil = perbaiki_konsistensi(gagal)
+        self.assertTrue(hasil.berhasil.all())
+        np.testing.assert_array_equal(hasil.berhasil, hasil.hasil.cr < BATAS_CR)
+        self.assertTrue(_di_skala_saaty(hasil.matriks))
+
+    def test_matriks_konsisten_tidak_diubah(self):
+        hasil = perbaiki_konsistensi(np.ones((2, 4, 4)))
+        self.assertTrue(hasil.berhasil.all())
+        np.testing.assert_array_equal(hasil.iterasi, [0, 0])
+        self.assertFalse(hasil.berubah.any())
+
+    def test_berhasil_false_bila_iterasi_habis(self):
+        hasil = perbaiki_konsistensi(MATRIKS_BOLAK_BALIK, maks_iterasi=0)
+        self.assertFalse(hasil.berhasil)
+        self.assertGreaterEqual(hasil.hasil.cr, BATAS_CR)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Layanan HTTP perhitungan bobot dan nilai AHP (ahp_layanan).
+
+    python -m unittest discover -s tests/Python
+"""
+import asyncio
+import json
+import os
+import sys
+import unittest
+from http import HTTPStatus
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp  # noqa: E402
+from ahp_layanan import LayananAHP  # noqa: E402
+from ahp_skor import hitung_skor  # noqa: E402
+
+SKOR = [[85, 90, 80, 75, 85], [95, 92, 94, 90, 91]]
+
+
+def _kirim(layanan, path, data, method='POST'):
+    body = data if isinstance(data, bytes) else json.dumps(data).encode()
+    status, _, isi = asyncio.run(layanan.proses(method, path, body))
+    return status, json.loads(isi)
+
+
+class TestLayananAHP(unittest.TestCase):
+    def setUp(self):
+        self.layanan = LayananAHP.dari_matriks()
+
+    def test_weights_sama_dengan_engine(self):
+        status, jawaban = _kirim(self.layanan, '/weights', {'matriks': MATRIKS_KRITERIA})
+        self.assertEqual(status, HTTPStatus.OK)
+        hasil = hitung_ahp(MATRIKS_KRITERIA)
+        np.testing.assert_allclose(jawaban['bobot'], hasil.bobot)
+        self.assertAlmostEqual(jawaban['cr'], hasil.cr)
+        self.assertTrue(jawaban['konsisten'])
+
+    def test_score_sama_dengan_hitung_skor(self):
+        status, jawaban = _kirim(self.layanan, '/score', {'skor': SKOR})
+        self.assertEqual(status, HTTPStatus.OK)
+        hasil = hitung_skor(SKOR, hitung_ahp(MATRIKS_KRITERIA).bobot)
+        np.testing.assert_allclose(jawaban['nilai'], hasil.nilai)
+        self.assertEqual(jawaban['ranking'], [2, 1])
+        self.assertEqual(jawaban['kategori'], list(hasil.kategori))
+
+    def test_nilai_tidak_hingga_ditolak(self):
+        for path, data in [
+            ('/score', {'skor': [[None, 2, 3, 4, 5]]}),
+            ('/score', {'skor': SKOR, 'bobot': [1, 1, 1, 1, None]}),
+            ('/weights', {'matriks': [[1, None], [1, 1]]}),
+        ]:
+            status, jawaban = _kirim(self.layanan, path, data)
+            self.assertEqual(status, HTTPStatus.BAD_REQUEST, data)
+            self.assertIn('angka hingga', jawaban['error'])
+        # Literal NaN/Infinity diterima json.loads, tetapi tetap ditolak
+        status, _ = _kirim(self.layanan, '/score', b'{"skor": [[NaN, 2, 3, 4, Infinity]]}')
+        self.assertEqual(status, HTTPStatus.BAD_REQUEST)
+
+    def test_permintaan_salah(self):
+        self.assertEqual(_kirim(self.layanan, '/score', {'bobot': [1]})[0], HTTPStatus.BAD_REQUEST)
+        self.assertEqual(_kirim(self.layanan, '/score', b'[1, 2]')[0], HTTPStatus.BAD_REQUEST)
+        self.assertEqual(_kirim(self.layanan, '/tidak-ada', {})[0], HTTPStatus.NOT_FOUND)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Backend metode prioritas AHP (ahp_metode).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import MATRIKS_KRITERIA  # noqa: E402
+from ahp_metode import METODE_PRIORITAS, bandingkan_metode, fuzzifikasi, hitung_prioritas  # noqa: E402
+
+BOBOT = np.array([0.5, 0.25, 0.15, 0.1])
+MATRIKS_KONSISTEN = BOBOT[:, np.newaxis] / BOBOT[np.newaxis, :]
+MATRIKS_RESIPROKAL = np.array([[1, 3, 5], [1 / 3, 1, 2], [1 / 5, 1 / 2, 1]])
+
+
+class TestMetodeTegas(unittest.TestCase):
+    def test_matriks_konsisten_semua_sama(self):
+        for metode in ('eigenvector', 'geometrik', 'llsm'):
+            np.testing.assert_allclose(hitung_prioritas(MATRIKS_KONSISTEN, metode), BOBOT, err_msg=metode)
+
+    def test_llsm_sama_dengan_geometrik_pada_matriks_resiprokal(self):
+        np.testing.assert_allclose(hitung_prioritas(MATRIKS_RESIPROKAL, 'llsm'), hitung_prioritas(MATRIKS_RESIPROKAL, 'geometrik'))
+
+    def test_llsm_judgment_kosong(self):
+        # a_13 dan a_31 kosong tetap bisa diturunkan dari a_12 dan a_23
+        matriks = MATRIKS_KONSISTEN[:3, :3].copy()
+        matriks[0, 2] = matriks[2, 0] = np.nan
+        np.testing.assert_allclose(hitung_prioritas(matriks, 'llsm'), BOBOT[:3] / BOBOT[:3].sum())
+
+    def test_tumpukan(self):
+        tumpukan = np.array([MATRIKS_KONSISTEN, np.ones((4, 4))])
+        for metode in METODE_PRIORITAS:
+            bobot = hitung_prioritas(tumpukan, metode)
+            self.assertEqual(bobot.shape, (2, 4))
+            np.testing.assert_allclose(bobot.sum(axis=-1), 1.0)
+            np.testing.assert_allclose(bobot[1], 0.25, err_msg=metode)
+
+
+class TestMetodeFuzzy(unittest.TestCase):
+    def test_fuzzifikasi(self):
+        fuzzy = fuzzifikasi(MATRIKS_RESIPROKAL)
+        np.testing.assert_allclose(fuzzy[0, 1], [2, 3, 4])
+        np.testing.assert_allclose(fuzzy[1, 0], [1 / 4, 1 / 3, 1 / 2])
+        np.testing.assert_allclose(fuzzy[0, 0], [1, 1, 1])
+
+    def test_buckley_tanpa_sebaran_sama_dengan_geometrik(self):
+        np.testing.assert_allclose(hitung_prioritas(MATRIKS_KRITERIA, 'fuzzy_buckley', delta=0), hitung_prioritas(MATRIKS_KRITERIA, 'geometrik'))
+
+    def test_urutan_prioritas_terjaga(self):
+        for metode in ('fuzzy_buckley', 'fuzzy_chang'):
+            bobot = hitung_prioritas(MATRIKS_KONSISTEN, metode)
+            self.assertAlmostEqual(bobot.sum(), 1.0)
+            self.assertEqual(np.argmax(bobot), 0)
+            self.assertTrue(np.all(np.diff(bobot) <= 0), metode)
+
+    def test_input_fuzzy_langsung(self):
+        fuzzy = fuzzifikasi(MATRIKS_RESIPROKAL)
+        np.testing.assert_allclose(hitung_prioritas(fuzzy, 'fuzzy_buckley', fuzzy=True), hitung_prioritas(MATRIKS_RESIPROKAL, 'fuzzy_buckley'))
+        with self.assertRaises(ValueError):
+            hitung_prioritas(fuzzy, 'geometrik', fuzzy=True)
+        with self.assertRaises(ValueError):
+            hitung_prioritas(MATRIKS_RESIPROKAL, 'topsis')
+
+
+class TestBandingkanMetode(unittest.TestCase):
+    def test_eigenvector_acuan(self):
+        hasil = {h['metode']: h for h in bandingkan_metode(np.array([MATRIKS_KONSISTEN] * 3), MATRIKS_KONSISTEN)}
+        self.assertEqual(sorted(hasil), sorted(METODE_PRIORITAS))
+        self.assertAlmostEqual(hasil['eigenvector']['selisih_rata'], 0.0)
+        self.assertEqual(hasil['geometrik']['urutan_sama'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Instrumentasi span per tahap pipeline (ahp_profil).
+
+    python -m unittest discover -s tests/Python
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import ahp_profil  # noqa: E402
+from ahp_profil import aktif, profil, ringkasan, span  # noqa: E402
+
+
+class TestSpan(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+        self.log = os.path.join(self.folder, 'profil.jsonl')
+        for patcher in (
+            mock.patch.object(ahp_profil, 'AKTIF', True),
+            mock.patch.dict(ahp_profil._ringkasan, clear=True),
+            mock.patch.dict(os.environ, {ahp_profil.ENV_LOG: self.log}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _catatan(self):
+        with open(self.log, encoding='utf-8') as f:
+            return [json.loads(baris) for baris in f]
+
+    def test_aktif_dari_env(self):
+        self.assertFalse(aktif({}))
+        self.assertFalse(aktif({'AHP_PROFIL': '0'}))
+        self.assertTrue(aktif({'AHP_PROFIL': '1'}))
+        self.assertTrue(aktif({'AHP_PROFIL_LOG': 'profil.jsonl'}))
+
+    def test_span_bersarang_ke_file_log(self):
+        with span('batch'):
+            for _ in range(2):
+                with span('xlsx', backend='xml') as s:
+                    s.baris = 10
+        catatan = self._catatan()
+        self.assertEqual([c['span'] for c in catatan], ['batch/xlsx', 'batch/xlsx', 'batch'])
+        self.assertEqual(catatan[0]['baris'], 10)
+        self.assertEqual(catatan[0]['backend'], 'xml')
+        self.assertEqual(catatan[0]['status'], 'ok')
+        self.assertGreaterEqual(catatan[0]['durasi'], 0)
+        self.assertEqual(ringkasan()['batch/xlsx']['jumlah'], 2)
+        self.assertEqual(ringkasan()['batch/xlsx']['baris'], 20)
+
+    def test_span_error(self):
+        with self.assertRaises(KeyError):
+            with span('muat'):
+                raise KeyError('guru')
+        catatan = self._catatan()[0]
+        self.assertEqual((catatan['status'], catatan['error']), ('error', 'KeyError'))
+
+    def test_tidak_aktif(self):
+        with mock.patch.object(ahp_profil, 'AKTIF', False):
+            with span('muat') as s:
+                s.baris = 5
+        self.assertFalse(os.path.exists(self.log))
+        self.assertEqual(ringkasan(), {})
+
+    def test_profil_ringkasan_dan_cprofile(self):
+        folder_prof = os.path.join(self.folder, 'prof')
+        with mock.patch.dict(os.environ, {ahp_profil.ENV_CPROFILE: folder_prof}):
+            with profil('job'):
+                with span('skor', baris=3):
+                    pass
+                # Folder dump sudah ditentukan saat blok dimulai
+                del os.environ[ahp_profil.ENV_CPROFILE]
+        catatan = self._catatan()
+        self.assertEqual([c['span'] for c in catatan], ['job/skor', 'job', 'job'])
+        self.assertEqual(catatan[-1]['ringkasan']['job/skor']['baris'], 3)
+        self.assertEqual(os.listdir(folder_prof), [f'job-{os.getpid()}.prof'])
+
+
+if __name__ == '__main__':
+    unittest.main()
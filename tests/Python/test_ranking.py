@@ -0,0 +1,84 @@
+"""Peringkat dengan nilai seri (ahp_ranking, ahp_skor.ranking, ahp_sensitivitas.peringkat_batch).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_ranking import KATEGORI_BELUM_DINILAI, kategori, peringkat, rekomendasi, top_k  # noqa: E402
+from ahp_sensitivitas import peringkat_batch  # noqa: E402
+from ahp_skor import ranking  # noqa: E402
+
+# 84.25 dan 84.2500000001 (hasil perkalian matriks) seri pada 2 angka desimal
+NILAI_SERI = [84.25, 90.0, 84.2500000001, 70.5, 90.0, np.nan]
+
+
+class TestPeringkatSeri(unittest.TestCase):
+    def test_metode(self):
+        np.testing.assert_array_equal(peringkat(NILAI_SERI), [3, 1, 3, 5, 1, 6])
+        np.testing.assert_array_equal(peringkat(NILAI_SERI, metode='dense'), [2, 1, 2, 3, 1, 4])
+        np.testing.assert_array_equal(peringkat(NILAI_SERI, metode='urut'), [3, 1, 4, 5, 2, 6])
+
+    def test_per_kelompok(self):
+        nilai = [80, 90, 80, 70, 85]
+        np.testing.assert_array_equal(peringkat(nilai, kelompok=[1, 1, 1, 2, 2]), [2, 1, 2, 2, 1])
+
+    def test_ranking_dan_peringkat_batch_sama(self):
+        np.testing.assert_array_equal(ranking(NILAI_SERI), peringkat(NILAI_SERI))
+        batch = np.array([NILAI_SERI, NILAI_SERI[::-1]])
+        np.testing.assert_array_equal(peringkat_batch(batch)[0], ranking(NILAI_SERI))
+        np.testing.assert_array_equal(peringkat_batch(batch)[1], ranking(NILAI_SERI[::-1]))
+
+    def test_peringkat_batch_acak(self):
+        rng = np.random.default_rng(0)
+        nilai = np.round(rng.uniform(80, 82, (200, 9)), 1)
+        batch = peringkat_batch(nilai)
+        for baris, hasil in zip(nilai, batch):
+            np.testing.assert_array_equal(hasil, ranking(baris))
+
+
+class TestKategori(unittest.TestCase):
+    def test_batas_dan_pembulatan(self):
+        self.assertEqual(
+            list(kategori([69.99, 70.0, 79.994, 89.999, 90.0, 100.0])),
+            ['Kurang', 'Cukup', 'Cukup', 'Sangat Baik', 'Sangat Baik', 'Sangat Baik'],
+        )
+
+    def test_nan_belum_dinilai(self):
+        self.assertEqual(list(kategori([np.nan, 85.0])), [KATEGORI_BELUM_DINILAI, 'Baik'])
+
+
+class TestTopK(unittest.TestCase):
+    def test_seri_ikut_terpilih(self):
+        np.testing.assert_array_equal(top_k(NILAI_SERI, 1), [1, 4])
+        np.testing.assert_array_equal(top_k(NILAI_SERI, 3), [1, 4, 0, 2])
+        np.testing.assert_array_equal(top_k(NILAI_SERI, 3, seri=False), [1, 4, 0])
+
+    def test_terbawah_tanpa_nan(self):
+        np.testing.assert_array_equal(top_k(NILAI_SERI, 1, terbawah=True), [3])
+
+    def test_per_kelompok(self):
+        hasil = top_k([80, 90, 80, 70, 85], 1, kelompok=['IPA', 'IPA', 'IPA', 'IPS', 'IPS'], terbawah=True)
+        self.assertEqual(sorted(hasil), ['IPA', 'IPS'])
+        np.testing.assert_array_equal(hasil['IPA'], [0, 2])
+        np.testing.assert_array_equal(hasil['IPS'], [3])
+
+
+class TestRekomendasi(unittest.TestCase):
+    def test_kriteria_terlemah(self):
+        nama = ['Kedisiplinan', 'Penguasaan Materi', 'Metode Mengajar']
+        hasil = rekomendasi([[95, 95, 95], [70, 80, 95], [95, 85, 95]], nama)
+        self.assertEqual(
+            list(hasil),
+            ['Pertahankan kinerja, jadikan mentor', 'Tingkatkan kedisiplinan dan penguasaan materi', 'Tingkatkan penguasaan materi'],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Analisis sensitivitas bobot AHP (ahp_sensitivitas).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp  # noqa: E402
+from ahp_sensitivitas import analisis_sensitivitas, matriks_resiprokal, sampel_matriks  # noqa: E402
+
+SKOR = [[80, 95, 90, 85, 80], [90, 85, 85, 80, 90], [85, 85, 85, 85, 85]]
+
+
+class TestSensitivitas(unittest.TestCase):
+    def test_sampel_tanpa_gangguan_sama_dengan_bobot_dasar(self):
+        # MATRIKS_KRITERIA memakai 0.33 untuk 1/3, jadi tidak persis resiprokal
+        dasar = hitung_ahp(matriks_resiprokal(MATRIKS_KRITERIA)).bobot
+        sampel = sampel_matriks(np.random.default_rng(0), MATRIKS_KRITERIA, 3, sebaran=0.0)
+        np.testing.assert_allclose(sampel, np.tile(dasar, (3, 1)))
+
+    def test_peringkat_dasar_dari_matriks_resiprokal(self):
+        hasil = analisis_sensitivitas(SKOR, matriks=MATRIKS_KRITERIA, n_sampel=200, metode='matriks', sebaran=1e-9, seed=0)
+        np.testing.assert_array_equal(hasil.peluang_tetap, [1.0, 1.0, 1.0])
+        np.testing.assert_allclose(hasil.peluang_peringkat.sum(axis=1), 1.0)
+
+    def test_dirichlet_chunk_dan_seed(self):
+        bobot = hitung_ahp(MATRIKS_KRITERIA).bobot
+        satu = analisis_sensitivitas(SKOR, bobot=bobot, n_sampel=1000, ukuran_chunk=1000, seed=3)
+        lagi = analisis_sensitivitas(SKOR, bobot=bobot, n_sampel=1000, ukuran_chunk=1000, seed=3)
+        np.testing.assert_array_equal(satu.peluang_peringkat, lagi.peluang_peringkat)
+        self.assertEqual(satu.n_sampel, 1000)
+
+    def test_metode_matriks_tanpa_matriks(self):
+        with self.assertRaises(ValueError):
+            analisis_sensitivitas(SKOR, bobot=[0.2] * 5, metode='matriks')
+
+
+if __name__ == '__main__':
+    unittest.main()
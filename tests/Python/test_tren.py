@@ -0,0 +1,100 @@
+"""Statistik berjalan per chunk untuk tren nilai guru (ahp_tren).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_tren import StatistikOnline, TrenPeriode, iter_tren, rata_tertimbang, tahun_ajaran  # noqa: E402
+from data_uji import buat_database_uji  # noqa: E402
+
+KRITERIA_IDS = [3, 5, 8]
+
+
+def _detail_acak(seed=0, n=5000):
+    rng = np.random.default_rng(seed)
+    guru = rng.integers(1, 40, n)
+    kriteria = rng.choice(KRITERIA_IDS, n)
+    # Nilai besar dengan sebaran kecil menguji kestabilan numerik rumus gabungan
+    nilai = 1e6 + rng.normal(80, 7, n)
+    return guru, kriteria, nilai
+
+
+def _langsung(guru, kriteria, nilai):
+    guru_ids = np.unique(guru)
+    rata = np.full((len(guru_ids), len(KRITERIA_IDS)), np.nan)
+    sb = np.full(rata.shape, np.nan)
+    for i, g in enumerate(guru_ids):
+        for k, kriteria_id in enumerate(KRITERIA_IDS):
+            sel = nilai[(guru == g) & (kriteria == kriteria_id)]
+            if len(sel):
+                rata[i, k] = sel.mean()
+            if len(sel) > 1:
+                sb[i, k] = sel.std(ddof=1)
+    return guru_ids, rata, sb
+
+
+class TestStatistikOnline(unittest.TestCase):
+    def test_per_chunk_sama_dengan_langsung(self):
+        guru, kriteria, nilai = _detail_acak()
+        guru_ids, rata, sb = _langsung(guru, kriteria, nilai)
+        for ukuran_chunk in (1, 7, 1000, len(nilai)):
+            akumulator = StatistikOnline(KRITERIA_IDS)
+            for mulai in range(0, len(nilai), ukuran_chunk):
+                akhir = mulai + ukuran_chunk
+                akumulator.tambah(guru[mulai:akhir], kriteria[mulai:akhir], nilai[mulai:akhir])
+            hasil = akumulator.hasil()
+            np.testing.assert_array_equal(hasil.guru_ids, guru_ids)
+            np.testing.assert_allclose(hasil.rata, rata, rtol=0, atol=1e-8)
+            np.testing.assert_allclose(hasil.simpangan_baku, sb, rtol=1e-7)
+            self.assertEqual(hasil.jumlah.sum(), len(nilai))
+
+    def test_gabung_sama_dengan_satu_akumulator(self):
+        guru, kriteria, nilai = _detail_acak(seed=1)
+        separuh = len(nilai) // 2
+        pertama = StatistikOnline(KRITERIA_IDS).tambah(guru[:separuh], kriteria[:separuh], nilai[:separuh])
+        kedua = StatistikOnline(KRITERIA_IDS).tambah(guru[separuh:], kriteria[separuh:], nilai[separuh:])
+        semua = StatistikOnline(KRITERIA_IDS).tambah(guru, kriteria, nilai)
+        gabungan = pertama.gabung(kedua).hasil()
+        np.testing.assert_allclose(gabungan.rata, semua.hasil().rata, rtol=0, atol=1e-8)
+        np.testing.assert_allclose(gabungan.simpangan_baku, semua.hasil().simpangan_baku, rtol=1e-7)
+
+    def test_kriteria_lain_dan_nan_diabaikan(self):
+        akumulator = StatistikOnline(KRITERIA_IDS)
+        akumulator.tambah([1, 1, 1, 1], [3, 3, 4, 3], [80.0, 90.0, 10.0, np.nan])
+        hasil = akumulator.hasil()
+        np.testing.assert_array_equal(hasil.jumlah, [[2, 0, 0]])
+        np.testing.assert_allclose(hasil.rata[0, 0], 85.0)
+        np.testing.assert_allclose(hasil.simpangan_baku[0, 0], np.std([80.0, 90.0], ddof=1))
+        self.assertTrue(np.isnan(hasil.rata[0, 1]))
+
+
+class TestNilaiTren(unittest.TestCase):
+    def test_rata_tertimbang_normalisasi_ulang(self):
+        rata = np.array([[80.0, 90.0, np.nan], [np.nan, np.nan, np.nan]])
+        np.testing.assert_allclose(rata_tertimbang(rata, np.array([0.5, 0.25, 0.25])), [(80 * 0.5 + 90 * 0.25) / 0.75, np.nan])
+
+    def test_iter_tren_dari_database(self):
+        tren = list(iter_tren(buat_database_uji()))
+        periode = [t for t in tren if isinstance(t, TrenPeriode)]
+        self.assertEqual([t.periode.id for t in periode], [1, 2])
+        pertama = periode[0]
+        # Guru 1: K1 (80 + 70 + 10) / 3, K2 (90 + 60 + 80) / 3, tanpa role dan bobot sub kriteria
+        np.testing.assert_allclose(pertama.statistik.rata[0], [160 / 3, 230 / 3])
+        np.testing.assert_allclose(pertama.rata_tertimbang, [0.6 * 160 / 3 + 0.4 * 230 / 3, 0.6 * 90 + 0.4 * 85])
+        self.assertEqual(len(periode[1].statistik.guru_ids), 0)
+
+    def test_tahun_ajaran(self):
+        self.assertEqual(tahun_ajaran('2024-07-15'), '2024/2025')
+        self.assertEqual(tahun_ajaran('2025-01-10'), '2024/2025')
+        self.assertEqual(tahun_ajaran('2025-06-30 00:00:00'), '2024/2025')
+
+
+if __name__ == '__main__':
+    unittest.main()
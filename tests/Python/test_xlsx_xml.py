@@ -0,0 +1,89 @@
+"""Backend penulis XML langsung untuk laporan Excel (ahp_xlsx_xml).
+
+    python -m unittest discover -s tests/Python
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+from openpyxl import load_workbook
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from ahp_engine import MATRIKS_KRITERIA, hitung_ahp  # noqa: E402
+from ahp_excel import iter_baris_hasil, iter_baris_ranking, tulis_laporan_streaming  # noqa: E402
+from ahp_xlsx_xml import huruf_kolom  # noqa: E402
+
+GURU = [
+    ('Budi Santoso, S.Pd', 'IPA', [80, 95, 90, 85, 80]),
+    ('Siti <Nurhaliza> & Rekan', 'Bahasa Indonesia', [90, 85, 85, 80, 90]),
+    ('  Ahmad Fauzi', 'Matematika', [70, 75, 65, 80, 70]),
+]
+KRITERIA_DATA = [[f'K{i}', f'Kriteria {i}', 'Deskripsi', round(float(b), 4)] for i, b in enumerate(hitung_ahp(MATRIKS_KRITERIA).bobot, 1)]
+MATRIX_DATA = [[f'K{i}', *baris] for i, baris in enumerate(MATRIKS_KRITERIA, 1)]
+
+
+def _tulis(folder, backend):
+    bobot = hitung_ahp(MATRIKS_KRITERIA).bobot
+    nilai = np.array([g[2] for g in GURU], dtype=float) @ bobot
+    path = os.path.join(folder, f'laporan_{backend}.xlsx')
+    jumlah = tulis_laporan_streaming(
+        path,
+        iter_baris_hasil(iter(GURU), bobot, ukuran_chunk=2),
+        iter_baris_ranking([g[0] for g in GURU], nilai, rekomendasi=['', 'Pertahankan', np.nan]),
+        kriteria_data=KRITERIA_DATA,
+        matrix_data=MATRIX_DATA,
+        backend=backend,
+    )
+    return load_workbook(path), jumlah
+
+
+def _format(sel):
+    # Font tanpa ukuran memakai ukuran font Normal (11)
+    return (
+        sel.font.b, sel.font.sz or 11, sel.fill.fgColor.rgb if sel.fill.fill_type else None,
+        sel.alignment.horizontal, sel.number_format, sel.border.left.style if sel.border.left else None,
+    )
+
+
+class TestBackendXML(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as folder:
+            cls.openpyxl, cls.jumlah_openpyxl = _tulis(folder, 'openpyxl')
+            cls.xml, cls.jumlah_xml = _tulis(folder, 'xml')
+
+    def test_jumlah_baris_dan_sheet(self):
+        self.assertEqual(self.jumlah_xml, self.jumlah_openpyxl)
+        self.assertEqual(self.xml.sheetnames, self.openpyxl.sheetnames)
+
+    def test_nilai_sama(self):
+        for title in self.openpyxl.sheetnames:
+            acuan = [[sel.value for sel in row] for row in self.openpyxl[title].iter_rows()]
+            hasil = [[sel.value for sel in row] for row in self.xml[title].iter_rows()]
+            self.assertEqual(hasil, acuan, title)
+        # Teks dengan karakter XML dan spasi di awal tetap utuh
+        self.assertEqual(self.xml['Hasil Evaluasi']['B6'].value, GURU[1][0])
+        self.assertEqual(self.xml['Hasil Evaluasi']['B7'].value, GURU[2][0])
+
+    def test_format_sama(self):
+        for title in self.openpyxl.sheetnames:
+            acuan, hasil = self.openpyxl[title], self.xml[title]
+            for row in acuan.iter_rows():
+                for sel in row:
+                    self.assertEqual(_format(hasil[sel.coordinate]), _format(sel), f'{title}!{sel.coordinate}')
+            self.assertEqual(sorted(map(str, hasil.merged_cells.ranges)), sorted(map(str, acuan.merged_cells.ranges)))
+            self.assertEqual(
+                {k: d.width for k, d in hasil.column_dimensions.items() if d.customWidth},
+                {k: d.width for k, d in acuan.column_dimensions.items() if d.customWidth},
+            )
+
+    def test_huruf_kolom(self):
+        self.assertEqual([huruf_kolom(i) for i in (1, 9, 26, 27, 52, 703)], ['A', 'I', 'Z', 'AA', 'AZ', 'AAA'])
+
+
+if __name__ == '__main__':
+    unittest.main()